@@ -0,0 +1,68 @@
+"""
+Тест производительности потокового экспорта каталога.
+
+Категория из products товаров записывается во временный файл в каждом
+формате export_catalog; выводится время и пропускная способность в МБ/с.
+
+Запуск:
+    python -m benchmarks.export --products 2000000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from src.export import FORMATS, export_catalog
+from src.product import Category, Product
+
+
+def make_category(products: int):
+    """Создает категорию из products товаров."""
+    return Category(
+        "Категория",
+        "Описание",
+        [Product(f"Товар {index}", "Описание", 100.0 + index % 1000, index % 50) for index in range(products)],
+    )
+
+
+def run(products: int, formats=FORMATS, category=None) -> dict:
+    """
+    Экспортирует категорию в каждом формате.
+
+    Returns:
+        dict: Для каждого формата seconds, bytes, megabytes_per_second
+    """
+    if category is None:
+        category = make_category(products)
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for file_format in formats:
+            path = os.path.join(directory, f"catalog.{file_format}")
+            started = time.perf_counter()
+            export_catalog([category], path)
+            seconds = time.perf_counter() - started
+            size = os.path.getsize(path)
+            results[file_format] = {
+                "seconds": seconds,
+                "bytes": size,
+                "megabytes_per_second": size / seconds / 1e6 if seconds else 0.0,
+            }
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--products", type=int, default=2_000_000)
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=list(FORMATS))
+    args = parser.parse_args(argv)
+
+    for file_format, result in run(args.products, args.formats).items():
+        print(
+            f"{file_format:<8} {result['seconds']:>8.3f} с  {result['bytes'] / 1e6:>10.1f} МБ  "
+            f"{result['megabytes_per_second']:>8.1f} МБ/с"
+        )
+
+
+if __name__ == "__main__":
+    main()
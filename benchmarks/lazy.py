@@ -0,0 +1,91 @@
+"""
+Тест производительности ленивого создания товаров из записей.
+
+Сравнивается импорт строк ленты (значения - строки, как у csv.DictReader)
+в категорию через Category.extend из обычных Product и из LazyProduct,
+после которого просматривается доля inspected товаров (все поля).
+Категория сразу читает цену и количество каждого товара для агрегатов,
+поэтому ленивыми остаются только название и описание.
+
+Запуск:
+    python -m benchmarks.lazy --rows 1000000 --inspected 0.05
+"""
+
+import argparse
+import time
+
+from src.lazy import LazyProduct
+from src.product import Category, Product
+
+
+def make_rows(count: int):
+    """Создает count записей со строковыми значениями."""
+    return [
+        {"name": f"Товар {index}", "description": "Описание", "price": str(100.0 + index % 1000), "quantity": str(index % 50)}
+        for index in range(count)
+    ]
+
+
+def import_eager(rows):
+    return [Product(row["name"], row["description"], float(row["price"]), int(row["quantity"])) for row in rows]
+
+
+def import_lazy(rows):
+    return [LazyProduct(row) for row in rows]
+
+
+def inspect(category, step: int):
+    value = 0.0
+    length = 0
+    for product in category.get_products_list()[::step]:
+        value += product.price * product.quantity
+        length += len(product.name) + len(product.description)
+    return value, length
+
+
+def run(rows: int, inspected: float = 0.05) -> dict:
+    """
+    Выполняет импорт rows записей в категорию обоими способами.
+
+    Returns:
+        dict: rows, inspected, eager_seconds, lazy_seconds, speedup
+    """
+    records = make_rows(rows)
+    step = max(1, round(1 / inspected))
+    timings = {}
+    values = {}
+    for name, import_products in (("eager", import_eager), ("lazy", import_lazy)):
+        started = time.perf_counter()
+        category = Category("Категория", "Описание", [])
+        category.extend(import_products(records))
+        values[name] = inspect(category, step)
+        timings[name] = time.perf_counter() - started
+
+    if values["eager"] != values["lazy"]:
+        raise AssertionError("Результаты ленивого и обычного импорта различаются")
+
+    return {
+        "rows": rows,
+        "inspected": inspected,
+        "eager_seconds": timings["eager"],
+        "lazy_seconds": timings["lazy"],
+        "speedup": timings["eager"] / timings["lazy"] if timings["lazy"] else 0.0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--inspected", type=float, default=0.05)
+    args = parser.parse_args(argv)
+
+    result = run(args.rows, args.inspected)
+    print(
+        f"строк: {result['rows']}, просмотрено: {result['inspected']:.0%}\n"
+        f"Product:     {result['eager_seconds']:.3f} с\n"
+        f"LazyProduct: {result['lazy_seconds']:.3f} с  (ускорение {result['speedup']:.2f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
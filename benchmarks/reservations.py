@@ -0,0 +1,104 @@
+"""
+Тест производительности резервирования остатков.
+
+Заказы (товар, количество) пакетами резервируются и списываются
+через ReservationEngine на каталоге из products товаров; после теста
+проверяется, что списанное количество совпадает с изменением агрегатов категории.
+
+Запуск:
+    python -m benchmarks.reservations --products 1000000 --orders 1000000 --batch-size 1000 --threads 1 4
+"""
+
+import argparse
+import random
+import threading
+import time
+
+from src.product import Category, Product
+from src.reservations import ReservationEngine
+
+
+def make_category(products: int):
+    """Создает категорию из products товаров с остатком 10 шт."""
+    return Category(
+        "Склад", "Нагрузочный тест", [Product(f"Товар {index}", "", 100.0, 10) for index in range(products)]
+    )
+
+
+def run(products: int, orders: int, batch_size: int = 1000, threads: int = 1, category=None, seed: int = 0) -> dict:
+    """
+    Резервирует и списывает orders заказов в threads потоках.
+
+    Returns:
+        dict: products, orders, accepted, committed_quantity, seconds, orders_per_second
+    """
+    if category is None:
+        category = make_category(products)
+    items = category.get_products_list()
+    engine = ReservationEngine()
+    random_numbers = random.Random(seed)
+    per_thread = orders // threads
+    batches = [
+        [
+            [(items[random_numbers.randrange(len(items))], random_numbers.randint(1, 3)) for _ in range(size)]
+            for size in _batch_sizes(per_thread, batch_size)
+        ]
+        for _ in range(threads)
+    ]
+    quantity_before = category.total_quantity
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(thread_batches):
+        barrier.wait()
+        for batch in thread_batches:
+            engine.commit(engine.reserve(batch))
+
+    workers = [threading.Thread(target=worker, args=(thread_batches,)) for thread_batches in batches]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    seconds = time.perf_counter() - started
+
+    committed = quantity_before - category.total_quantity
+    expected = sum(product.quantity for product in items)
+    if category.total_quantity != expected or min(product.quantity for product in items) < 0:
+        raise AssertionError("Остатки категории не согласованы")
+
+    return {
+        "products": len(items),
+        "orders": per_thread * threads,
+        "accepted": engine.accepted,
+        "committed_quantity": committed,
+        "seconds": seconds,
+        "orders_per_second": per_thread * threads / seconds if seconds else 0.0,
+    }
+
+
+def _batch_sizes(total: int, batch_size: int):
+    while total > 0:
+        yield min(batch_size, total)
+        total -= batch_size
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--products", type=int, default=1_000_000)
+    parser.add_argument("--orders", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=1_000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1])
+    args = parser.parse_args(argv)
+
+    category = make_category(args.products)
+    for threads in args.threads:
+        result = run(args.products, args.orders, args.batch_size, threads, category=category)
+        print(
+            f"потоков: {threads:>3}  заказов/с: {result['orders_per_second']:>12.0f}  "
+            f"принято: {result['accepted']} из {result['orders']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""
+Набор тестов производительности для горячих путей Product и Category.
+
+Запуск:
+    python -m benchmarks.run --scales 1000 100000 1000000 --output results.json
+    python -m benchmarks.run --baseline results.json --threshold 0.2
+
+Каждый сценарий выполняется repeat раз, в результат попадает лучшее время.
+Эталон зависит от машины, поэтому в репозитории не хранится: его записывают
+через --output на той же машине перед изменениями и затем передают в --baseline.
+При сравнении с эталоном сценарий считается регрессией, если время
+на операцию выросло больше чем на threshold (доля, 0.2 = 20%).
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from unittest.mock import patch
+
+from src.product import Category, Product
+
+SCALES = (1_000, 100_000, 1_000_000)
+
+# Количество вызовов new_product со списком: линейный поиск по списку из scale товаров
+NEW_PRODUCT_LOOKUPS = 100
+
+
+def make_products(count: int):
+    """Создает count товаров с разными названиями."""
+    return [Product(f"Товар {index}", "Описание", 100.0 + index % 1000, index % 50) for index in range(count)]
+
+
+def make_category(count: int):
+    """Создает категорию из count товаров."""
+    return Category("Категория", "Описание", make_products(count))
+
+
+def bench_product_init(scale):
+    def run():
+        for index in range(scale):
+            Product("Товар", "Описание", 100.0, index)
+
+    return run, scale
+
+
+def bench_new_product(scale):
+    products = make_products(scale)
+    # Поиск отсутствующего товара - худший случай линейного просмотра
+    record = {"name": "Нет в списке", "description": "Описание", "price": 1.0, "quantity": 1}
+
+    def run():
+        for _ in range(NEW_PRODUCT_LOOKUPS):
+            Product.new_product(record, products)
+
+    return run, NEW_PRODUCT_LOOKUPS
+
+
+def bench_add_product(scale):
+    products = make_products(scale)
+
+    def run():
+        category = Category("Категория", "Описание", [])
+        for product in products:
+            category.add_product(product)
+
+    return run, scale
+
+
+def bench_extend(scale):
+    products = make_products(scale)
+
+    def run():
+        category = Category("Категория", "Описание", [])
+        category.extend(products)
+
+    return run, scale
+
+
+def bench_category_products(scale):
+    category = make_category(scale)
+    product = category.get_products_list()[0]
+
+    def run():
+        # Сбрасываем только кэш строки (уведомление об изменении количества за O(1)),
+        # чтобы измерять построение строки без полного пересчета агрегатов
+        product.quantity = product.quantity
+        _ = category.products
+
+    return run, scale
+
+
+def bench_category_str(scale):
+    category = make_category(scale)
+
+    def run():
+        for _ in range(1000):
+            str(category)
+
+    return run, 1000
+
+
+def bench_category_iter(scale):
+    category = make_category(scale)
+
+    def run():
+        for _ in category:
+            pass
+
+    return run, scale
+
+
+def bench_product_add(scale):
+    products = make_products(scale)
+
+    def run():
+        first = products[0]
+        for product in products:
+            _ = first + product
+
+    return run, scale
+
+
+BENCHMARKS = {
+    "product_init": bench_product_init,
+    "new_product": bench_new_product,
+    "add_product": bench_add_product,
+    "extend": bench_extend,
+    "category_products": bench_category_products,
+    "category_str": bench_category_str,
+    "category_iter": bench_category_iter,
+    "product_add": bench_product_add,
+}
+
+
+def run_benchmarks(scales=SCALES, names=None, repeat: int = 3) -> dict:
+    """
+    Выполняет сценарии для каждого масштаба.
+
+    Счетчики Category, которые увеличиваются при подготовке сценариев,
+    после выполнения восстанавливаются.
+
+    Args:
+        scales (Iterable[int]): Масштабы (количество товаров)
+        names (Iterable[str]): Имена сценариев, по умолчанию все
+        repeat (int): Количество повторов каждого сценария
+
+    Returns:
+        dict: Сведения о среде и результаты вида {"сценарий@масштаб": {...}}
+    """
+    results = {}
+    counters = Category.category_count, Category.product_count
+    try:
+        for name in names or BENCHMARKS:
+            for scale in scales:
+                run, operations = BENCHMARKS[name](scale)
+                best = min(_measure(run) for _ in range(repeat))
+                results[f"{name}@{scale}"] = {
+                    "seconds": best,
+                    "operations": operations,
+                    "ns_per_operation": best * 1e9 / operations,
+                }
+    finally:
+        Category.category_count, Category.product_count = counters
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def _measure(run) -> float:
+    started = time.perf_counter()
+    run()
+    return time.perf_counter() - started
+
+
+def compare(results: dict, baseline: dict, threshold: float = 0.2) -> list:
+    """
+    Сравнивает результаты с эталоном.
+
+    Returns:
+        list: Регрессии в виде (сценарий, эталонное время, текущее время, относительное изменение)
+    """
+    regressions = []
+    for key, current in results["results"].items():
+        reference = baseline.get("results", {}).get(key)
+        if reference is None:
+            continue
+        change = current["ns_per_operation"] / reference["ns_per_operation"] - 1
+        if change > threshold:
+            regressions.append((key, reference["ns_per_operation"], current["ns_per_operation"], change))
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Тесты производительности Product и Category")
+    parser.add_argument("--scales", type=int, nargs="+", default=list(SCALES))
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="Выполнить только указанные сценарии")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Файл для сохранения результатов в JSON")
+    parser.add_argument("--baseline", help="Файл эталонных результатов для сравнения")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    # Сценарии не понижают цены, но на всякий случай исключаем интерактивный ввод
+    with patch("builtins.input", return_value="y"):
+        results = run_benchmarks(args.scales, args.only, args.repeat)
+
+    for key, result in results["results"].items():
+        print(f"{key:<32} {result['ns_per_operation']:>14.1f} нс/оп  {result['seconds']:>10.4f} с")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as stream:
+            json.dump(results, stream, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as stream:
+            regressions = compare(results, json.load(stream), args.threshold)
+        for key, reference, current, change in regressions:
+            print(f"РЕГРЕССИЯ {key}: {reference:.1f} -> {current:.1f} нс/оп (+{change:.0%})")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""
+Генератор нагрузки для асинхронного фасада каталога.
+
+Несколько конкурентных клиентов внутри одного процесса отправляют запросы
+добавления товаров и изменения цен в CatalogService.
+
+Запуск:
+    python -m benchmarks.service --clients 100 --requests 1000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from src.pricing import approve_all
+from src.product import Category
+from src.service import CatalogService
+
+
+async def run(clients: int, requests: int, products: int, seed: int = 0) -> dict:
+    """
+    Выполняет нагрузку и возвращает статистику.
+
+    Returns:
+        dict: requests, seconds, requests_per_second, batches, coalesced
+    """
+    service = CatalogService([Category("Нагрузка", "Нагрузочный тест", [])], price_policy=approve_all)
+
+    async def client(number: int):
+        rng = random.Random(seed + number)
+        for _ in range(requests):
+            index = rng.randrange(products)
+            if rng.random() < 0.5:
+                await service.add_product(
+                    "Нагрузка", {"name": f"Товар {index}", "description": "", "price": 100.0, "quantity": 1}
+                )
+            else:
+                await service.reprice(f"Товар {index}", rng.uniform(50.0, 150.0))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client(number) for number in range(clients)))
+    seconds = time.perf_counter() - started
+    total = clients * requests
+    return {
+        "requests": total,
+        "seconds": seconds,
+        "requests_per_second": total / seconds if seconds else 0.0,
+        "batches": service.batches,
+        "coalesced": service.coalesced,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Генератор нагрузки для CatalogService")
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--products", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    result = asyncio.run(run(args.clients, args.requests, args.products))
+    Category.category_count = 0
+    Category.product_count = 0
+    print(
+        f"запросов: {result['requests']}  запросов/с: {result['requests_per_second']:.0f}  "
+        f"пакетов: {result['batches']}  объединено: {result['coalesced']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Нагрузочный тест многопоточного объединения дубликатов.
+
+Потоки одновременно объединяют записи товаров через Product.new_product
+с общим ProductRegistry и синхронизированной категорией, после чего
+проверяется отсутствие потерянных обновлений.
+
+Запуск:
+    python -m benchmarks.threads --threads 1 2 4 8 --operations 200000
+
+Прирост производительности с числом потоков ожидается на сборке Python 3.13
+без GIL (free-threaded); на обычной сборке тест проверяет корректность.
+"""
+
+import argparse
+import sys
+import threading
+import time
+
+from src.product import Category, Product, ProductRegistry
+
+
+def run(threads: int, operations: int, products: int) -> dict:
+    """
+    Выполняет operations объединений в threads потоках.
+
+    Returns:
+        dict: threads, operations, seconds, operations_per_second
+    """
+    registry = ProductRegistry()
+    category = Category("Нагрузка", "Нагрузочный тест", [], synchronized=True)
+    for index in range(products):
+        category.add_product(
+            Product.new_product(
+                {"name": f"Товар {index}", "description": "", "price": 1.0, "quantity": 0}, registry=registry
+            )
+        )
+
+    per_thread = operations // threads
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(offset: int):
+        records = [
+            {"name": f"товар {(offset + index) % products}", "description": "", "price": 1.0, "quantity": 1}
+            for index in range(per_thread)
+        ]
+        barrier.wait()
+        for record in records:
+            Product.new_product(record, registry=registry)
+
+    workers = [threading.Thread(target=worker, args=(number,)) for number in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    seconds = time.perf_counter() - started
+
+    expected = per_thread * threads
+    if category.total_quantity != expected or sum(product.quantity for product in registry) != expected:
+        raise AssertionError("Обнаружены потерянные обновления")
+
+    return {
+        "threads": threads,
+        "operations": expected,
+        "seconds": seconds,
+        "operations_per_second": expected / seconds if seconds else 0.0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--operations", type=int, default=200_000)
+    parser.add_argument("--products", type=int, default=1_000)
+    args = parser.parse_args(argv)
+
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'включен' if gil_enabled else 'отключен'}")
+    baseline = None
+    for threads in args.threads:
+        result = run(threads, args.operations, args.products)
+        baseline = baseline or result["operations_per_second"]
+        print(
+            f"потоков: {threads:>3}  операций/с: {result['operations_per_second']:>12.0f}  "
+            f"ускорение: {result['operations_per_second'] / baseline:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
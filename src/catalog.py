@@ -0,0 +1,122 @@
+from src.product import Category
+
+
+class Catalog:
+    """
+    Каталог, владеющий набором категорий и ведущий собственную статистику.
+
+    В отличие от общих счетчиков Category.category_count и Category.product_count,
+    статистика каталога относится только к его категориям, уменьшается при
+    удалении категорий и товаров и отдельно учитывает уникальные товары:
+    товар, входящий в несколько категорий, считается один раз.
+    Все счетчики обновляются за O(1) на добавление или удаление товара.
+
+    Атрибуты:
+        name (str): Название каталога
+    """
+
+    def __init__(self, name: str = "", categories=()):
+        self.name = name
+        self.__categories = {}
+        self.__product_count = 0
+        self.__product_refs = {}
+        for category in categories:
+            self.add_category(category)
+
+    def create_category(self, name: str, description: str, products: list = None, **kwargs):
+        """Создает категорию и добавляет ее в каталог."""
+        category = Category(name, description, products if products is not None else [], **kwargs)
+        self.add_category(category)
+        return category
+
+    def add_category(self, category):
+        """
+        Добавляет категорию в каталог.
+
+        Raises:
+            TypeError: Если category не является объектом Category
+            ValueError: Если категория с таким названием уже есть в каталоге
+        """
+        if not isinstance(category, Category):
+            raise TypeError("Можно добавлять только объекты класса Category")
+        if category.name in self.__categories:
+            raise ValueError(f"Категория уже есть в каталоге: {category.name}")
+        self.__categories[category.name] = category
+        for product in category:
+            self.product_added(category, product)
+        category.add_listener(self)
+
+    def remove_category(self, name: str):
+        """
+        Удаляет категорию из каталога и возвращает ее.
+
+        Raises:
+            KeyError: Если категории нет в каталоге
+        """
+        try:
+            category = self.__categories.pop(name)
+        except KeyError:
+            raise KeyError(f"Категория не найдена: {name}") from None
+        category.remove_listener(self)
+        for product in category:
+            self.product_removed(category, product)
+        return category
+
+    def get_category(self, name: str):
+        """Возвращает категорию по названию."""
+        try:
+            return self.__categories[name]
+        except KeyError:
+            raise KeyError(f"Категория не найдена: {name}") from None
+
+    def product_added(self, category, product):
+        """Уведомление категории о добавлении товара."""
+        self.__product_count += 1
+        self.__product_refs[product] = self.__product_refs.get(product, 0) + 1
+
+    def product_removed(self, category, product):
+        """Уведомление категории об удалении товара."""
+        self.__product_count -= 1
+        refs = self.__product_refs[product] - 1
+        if refs:
+            self.__product_refs[product] = refs
+        else:
+            del self.__product_refs[product]
+
+    def product_changed(self, category, product, attribute: str, old_value, new_value):
+        """Изменения цены и количества не влияют на статистику каталога."""
+
+    @property
+    def category_count(self):
+        """Количество категорий в каталоге."""
+        return len(self.__categories)
+
+    @property
+    def product_count(self):
+        """Количество товаров во всех категориях каталога (с повторами)."""
+        return self.__product_count
+
+    @property
+    def unique_product_count(self):
+        """Количество различных товаров в каталоге."""
+        return len(self.__product_refs)
+
+    def __contains__(self, name):
+        return name in self.__categories
+
+    def __len__(self):
+        return len(self.__categories)
+
+    def __iter__(self):
+        return iter(self.__categories.values())
+
+    def __str__(self):
+        """Строковое представление каталога."""
+        return (
+            f"{self.name}, категорий: {self.category_count}, "
+            f"товаров: {self.product_count} (уникальных: {self.unique_product_count})"
+        )
+
+    def __repr__(self):
+        """Представление объекта для отладки."""
+        return f"Catalog('{self.name}', {self.category_count} категорий)"
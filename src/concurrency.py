@@ -0,0 +1,59 @@
+import threading
+from contextlib import contextmanager, nullcontext
+
+# Пустой контекстный менеджер для объектов без блокировки (можно использовать повторно)
+NO_LOCK = nullcontext()
+
+
+class LockStripes:
+    """
+    Набор блокировок, распределенных по объектам по их хешу (lock striping).
+
+    Позволяет синхронизировать операции над отдельными объектами без хранения
+    собственной блокировки в каждом объекте: разные объекты с высокой
+    вероятностью получают разные блокировки. Блокировка выбирается по hash(obj):
+    для Product это хеш по идентичности, а представления ProductView,
+    создаваемые колоночным хранилищем при каждом обращении, хешируются
+    по (хранилище, номер строки), поэтому все представления одной строки
+    получают одну блокировку.
+
+    Атрибуты:
+        count (int): Количество блокировок
+    """
+
+    def __init__(self, count: int = 64):
+        if count < 1:
+            raise ValueError("Количество блокировок должно быть положительным")
+        self.count = count
+        self.__locks = [threading.Lock() for _ in range(count)]
+
+    def lock_for(self, obj):
+        """Возвращает блокировку, отвечающую за объект."""
+        return self.__locks[hash(obj) % self.count]
+
+    @contextmanager
+    def locks_for(self, objects):
+        """
+        Захватывает блокировки всех объектов на время блока.
+
+        Каждая блокировка захватывается один раз, в порядке номеров,
+        поэтому одновременные вызовы не приводят к взаимной блокировке.
+        """
+        locks = [self.__locks[number] for number in sorted({hash(obj) % self.count for obj in objects})]
+        acquired = []
+        try:
+            for lock in locks:
+                lock.acquire()
+                acquired.append(lock)
+            yield
+        finally:
+            for lock in reversed(acquired):
+                lock.release()
+
+    def __repr__(self):
+        """Представление объекта для отладки."""
+        return f"LockStripes({self.count})"
+
+
+# Общие блокировки для атомарных операций над товарами
+PRODUCT_LOCKS = LockStripes()
@@ -0,0 +1,216 @@
+from src.product import Category, Product, ProductRegistry
+
+CATEGORY_ADDED = "category_added"
+CATEGORY_REMOVED = "category_removed"
+ADDED = "added"
+REMOVED = "removed"
+PRICE = "price"
+QUANTITY = "quantity"
+
+
+class Change:
+    """
+    Одно изменение каталога.
+
+    Атрибуты:
+        kind (str): Вид изменения: CATEGORY_ADDED, CATEGORY_REMOVED, ADDED, REMOVED, PRICE, QUANTITY
+        category (str): Название категории
+        name (str): Название товара (None для изменений категорий)
+        old_value: Прежнее значение: данные удаленного товара, цена или количество
+        new_value: Новое значение: данные добавленного товара, описание новой категории, цена или количество
+    """
+
+    __slots__ = ("kind", "category", "name", "old_value", "new_value")
+
+    def __init__(self, kind: str, category: str, name: str = None, old_value=None, new_value=None):
+        self.kind = kind
+        self.category = category
+        self.name = name
+        self.old_value = old_value
+        self.new_value = new_value
+
+    def to_dict(self) -> dict:
+        """Изменение в виде словаря (например, для записи в JSON)."""
+        return {
+            "kind": self.kind,
+            "category": self.category,
+            "name": self.name,
+            "old": self.old_value,
+            "new": self.new_value,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """Создает изменение из словаря to_dict()."""
+        return cls(data["kind"], data["category"], data.get("name"), data.get("old"), data.get("new"))
+
+    def __eq__(self, other):
+        return isinstance(other, Change) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        """Представление объекта для отладки."""
+        return f"Change({self.kind}, '{self.category}', {self.name!r}, {self.old_value!r}, {self.new_value!r})"
+
+
+def iter_diff(old_categories, new_categories):
+    """
+    Выдает изменения между двумя наборами категорий.
+
+    Категории сопоставляются по названию, товары внутри категории - по названию
+    без учета регистра, как в new_product; товары с одинаковым названием
+    сопоставляются по порядку следования. Старый каталог индексируется один раз,
+    новый просматривается одним проходом, поэтому время работы линейно
+    по общему числу товаров. Изменения выдаются по мере вычисления.
+
+    Args:
+        old_categories (Category | Iterable[Category]): Прежний каталог
+        new_categories (Category | Iterable[Category]): Новый каталог
+
+    Yields:
+        Change: Изменение каталога
+    """
+    old_index = {}
+    for category in _as_categories(old_categories):
+        old_products = {}
+        for product in category:
+            old_products.setdefault(ProductRegistry.normalize(product.name), []).append(product)
+        old_index[category.name] = (category, old_products)
+
+    for category in _as_categories(new_categories):
+        entry = old_index.pop(category.name, None)
+        if entry is None:
+            yield Change(CATEGORY_ADDED, category.name, new_value=category.description)
+            old_products = {}
+        else:
+            old_products = entry[1]
+
+        for product in category:
+            key = ProductRegistry.normalize(product.name)
+            candidates = old_products.get(key)
+            if not candidates:
+                yield Change(ADDED, category.name, product.name, new_value=_product_data(product))
+                continue
+            old_product = candidates.pop(0)
+            if product.price != old_product.price:
+                yield Change(PRICE, category.name, product.name, old_product.price, product.price)
+            if product.quantity != old_product.quantity:
+                yield Change(QUANTITY, category.name, product.name, old_product.quantity, product.quantity)
+
+        for candidates in old_products.values():
+            for old_product in candidates:
+                yield Change(REMOVED, category.name, old_product.name, old_value=_product_data(old_product))
+
+    for category, old_products in old_index.values():
+        for candidates in old_products.values():
+            for old_product in candidates:
+                yield Change(REMOVED, category.name, old_product.name, old_value=_product_data(old_product))
+        yield Change(CATEGORY_REMOVED, category.name, old_value=category.description)
+
+
+def diff(old_categories, new_categories) -> list:
+    """Список изменений между двумя наборами категорий (см. iter_diff)."""
+    return list(iter_diff(old_categories, new_categories))
+
+
+def apply_changeset(changes, categories=()):
+    """
+    Применяет изменения к категориям.
+
+    Цены записываются без подтверждения понижения: набор изменений
+    считается проверенным при построении. Количество устанавливается
+    в новое значение, поэтому повторное применение изменений цены
+    и количества не меняет результат.
+
+    Товары ищутся, как в iter_diff, по названию без учета регистра. Если
+    таких товаров несколько, выбирается первый по порядку товар с прежним
+    значением из изменения (при равенстве - с точно совпадающим названием),
+    поэтому изменения товаров с одинаковыми названиями не смешиваются.
+
+    Args:
+        changes (Iterable[Change | dict]): Изменения, например результат iter_diff
+        categories (Category | Iterable[Category]): Категории, к которым применяются изменения;
+            отсутствующие категории создаются по изменениям CATEGORY_ADDED
+
+    Returns:
+        list: Категории после применения изменений (без удаленных)
+
+    Raises:
+        ValueError: Если категория или товар из изменения не найдены
+    """
+    by_name = {category.name: category for category in _as_categories(categories)}
+    indexes = {}
+
+    for change in changes:
+        if isinstance(change, dict):
+            change = Change.from_dict(change)
+        if change.kind == CATEGORY_ADDED:
+            if change.category not in by_name:
+                by_name[change.category] = Category(change.category, change.new_value, [])
+            continue
+
+        category = by_name.get(change.category)
+        if category is None:
+            raise ValueError(f"Категория из изменений не найдена: {change.category}")
+        if change.kind == CATEGORY_REMOVED:
+            del by_name[change.category]
+            indexes.pop(change.category, None)
+            continue
+
+        index = indexes.get(change.category)
+        if index is None:
+            index = indexes[change.category] = {}
+            for product in category:
+                index.setdefault(ProductRegistry.normalize(product.name), []).append(product)
+        candidates = index.setdefault(ProductRegistry.normalize(change.name), [])
+        if change.kind == ADDED:
+            category.add_product(Product._from_dict(change.new_value))
+            candidates.append(category.get_products_list()[-1])
+            continue
+
+        product = _find_product(candidates, change)
+        if product is None:
+            raise ValueError(f"Товар из изменений не найден: {change.name}")
+        if change.kind == REMOVED:
+            category.remove_product(product)
+            candidates.remove(product)
+        elif change.kind == PRICE:
+            product._set_price(change.new_value)
+        elif change.kind == QUANTITY:
+            product.quantity = change.new_value
+        else:
+            raise ValueError(f"Неизвестный вид изменения: {change.kind}")
+
+    return list(by_name.values())
+
+
+def _find_product(candidates, change):
+    """Выбирает товар для изменения среди товаров с тем же нормализованным названием."""
+    if change.kind == REMOVED:
+        matches = [product for product in candidates if _product_data(product) == change.old_value]
+    elif change.kind == PRICE:
+        matches = [product for product in candidates if product.price == change.old_value]
+    elif change.kind == QUANTITY:
+        matches = [product for product in candidates if product.quantity == change.old_value]
+    else:
+        matches = []
+    for products in (matches, candidates):
+        for product in products:
+            if product.name == change.name:
+                return product
+        if products:
+            return products[0]
+    return None
+
+
+def _as_categories(categories):
+    """Приводит одну категорию или набор категорий к итерируемому набору."""
+    return [categories] if isinstance(categories, Category) else categories
+
+
+def _product_data(product) -> dict:
+    return {
+        "name": product.name,
+        "description": product.description,
+        "price": product.price,
+        "quantity": product.quantity,
+    }
@@ -0,0 +1,267 @@
+import csv
+import io
+import os
+import struct
+import sys
+from array import array
+from contextlib import contextmanager
+from json.encoder import encode_basestring
+
+from src.product import Category, Product
+from src.storage import ColumnarProductStore
+
+FORMATS = ("csv", "jsonl", "col")
+
+CSV_FIELDS = ("category", "category_description", "name", "description", "price", "quantity")
+
+COLUMNAR_MAGIC = b"OOPCOLS1"
+
+# количество товаров, длины названия и описания категории, размеры таблиц названий и описаний товаров в байтах
+_BLOCK = struct.Struct("<QQQQQ")
+
+# Колонки в файле хранятся в порядке байт little-endian
+_SWAP_BYTES = sys.byteorder != "little"
+
+
+def _padding(size: int) -> int:
+    """Количество байт выравнивания до границы 8 байт."""
+    return -size % 8
+
+
+@contextmanager
+def _open_target(target, binary: bool):
+    """Открывает путь для записи или использует переданный файловый объект (не закрывая его)."""
+    if hasattr(target, "write"):
+        yield target
+    elif binary:
+        with open(target, "wb") as stream:
+            yield stream
+    else:
+        with open(target, "w", encoding="utf-8", newline="") as stream:
+            yield stream
+
+
+def export_csv(categories, target, chunk_size: int = 10_000) -> int:
+    """
+    Потоково записывает категории в CSV.
+
+    Колонки совпадают с ожидаемыми iter_csv_records, поэтому файл можно
+    загрузить обратно через load_catalog. Товары обрабатываются пакетами
+    по chunk_size: строки пакета форматируются модулем csv в буфер в памяти
+    и записываются одной операцией.
+
+    Args:
+        categories (Iterable[Category]): Категории
+        target (str | PathLike | file): Путь или текстовый файловый объект
+        chunk_size (int): Количество товаров в пакете
+
+    Returns:
+        int: Количество записанных товаров
+    """
+    written = 0
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    with _open_target(target, binary=False) as stream:
+        writer.writerow(CSV_FIELDS)
+        for category in categories:
+            name, description = category.name, category.description
+            for chunk in category.iter_chunks(chunk_size):
+                writer.writerows(
+                    (name, description, product.name, product.description, product.price, product.quantity) for product in chunk
+                )
+                written += len(chunk)
+                stream.write(buffer.getvalue())
+                buffer.seek(0)
+                buffer.truncate()
+        stream.write(buffer.getvalue())
+    return written
+
+
+def export_jsonl(categories, target, chunk_size: int = 10_000) -> int:
+    """
+    Потоково записывает категории в JSONL: одна строка на товар.
+
+    Строки имеют формат записей товаров iter_jsonl_records
+    (с ключами category и category_description). Общая для категории часть строки
+    кодируется один раз, строки товаров собираются из заранее закодированных
+    значений без создания словарей и записываются одной операцией на пакет.
+
+    Returns:
+        int: Количество записанных товаров
+    """
+    written = 0
+    with _open_target(target, binary=False) as stream:
+        for category in categories:
+            prefix = (
+                f'{{"category": {encode_basestring(category.name)}, '
+                f'"category_description": {encode_basestring(category.description)}, "name": '
+            )
+            for chunk in category.iter_chunks(chunk_size):
+                stream.write(
+                    "".join(
+                        [
+                            f'{prefix}{encode_basestring(product.name)}, "description": {encode_basestring(product.description)}, '
+                            f'"price": {product.price!r}, "quantity": {product.quantity}}}\n'
+                            for product in chunk
+                        ]
+                    )
+                )
+                written += len(chunk)
+    return written
+
+
+def export_columnar(categories, target, chunk_size: int = 100_000) -> int:
+    """
+    Потоково записывает категории в колоночный бинарный формат.
+
+    Формат: COLUMNAR_MAGIC и последовательность блоков не более чем по chunk_size
+    товаров одной категории. Блок: заголовок, название и описание категории (UTF-8),
+    колонки цен (float64) и количеств (int64), смещения и таблицы названий
+    и описаний товаров (UTF-8); секции выровнены по 8 байт. В отличие от
+    write_snapshot, общий заголовок не нужен, поэтому память ограничена одним блоком.
+
+    Returns:
+        int: Количество записанных товаров
+    """
+    written = 0
+    with _open_target(target, binary=True) as stream:
+        stream.write(COLUMNAR_MAGIC)
+        for category in categories:
+            category_name = category.name.encode("utf-8")
+            category_description = category.description.encode("utf-8")
+            for chunk in category.iter_chunks(chunk_size):
+                names = [product.name.encode("utf-8") for product in chunk]
+                descriptions = [product.description.encode("utf-8") for product in chunk]
+                columns = [
+                    array("d", [product.price for product in chunk]),
+                    array("q", [product.quantity for product in chunk]),
+                    _offsets(names),
+                    _offsets(descriptions),
+                ]
+                if _SWAP_BYTES:
+                    for column in columns:
+                        column.byteswap()
+                names_blob = b"".join(names)
+                descriptions_blob = b"".join(descriptions)
+                parts = [
+                    _BLOCK.pack(
+                        len(chunk), len(category_name), len(category_description), len(names_blob), len(descriptions_blob)
+                    ),
+                    _padded(category_name + category_description),
+                    *(column.tobytes() for column in columns),
+                    _padded(names_blob + descriptions_blob),
+                ]
+                stream.write(b"".join(parts))
+                written += len(chunk)
+    return written
+
+
+def _offsets(values: list):
+    offsets = array("Q", [0])
+    total = 0
+    for value in values:
+        total += len(value)
+        offsets.append(total)
+    return offsets
+
+
+def _padded(data: bytes) -> bytes:
+    return data + b"\0" * _padding(len(data))
+
+
+def iter_columnar_blocks(stream):
+    """
+    Читает блоки колоночного формата export_columnar.
+
+    Yields:
+        tuple: (название категории, описание категории, array цен, array количеств,
+            список названий, список описаний)
+    """
+    if stream.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+        raise ValueError("Файл не является колоночным экспортом каталога")
+    while True:
+        header = stream.read(_BLOCK.size)
+        if not header:
+            return
+        if len(header) < _BLOCK.size:
+            raise ValueError("Неожиданный конец колоночного экспорта")
+        count, name_size, description_size, names_size, descriptions_size = _BLOCK.unpack(header)
+
+        strings = _read_exact(stream, name_size + description_size)
+        category_name = strings[:name_size].decode("utf-8")
+        category_description = strings[name_size:].decode("utf-8")
+        columns = []
+        for format_char in ("d", "q", "Q", "Q"):
+            column = array(format_char)
+            column.frombytes(_read_exact(stream, (count + (format_char == "Q")) * 8))
+            if _SWAP_BYTES:
+                column.byteswap()
+            columns.append(column)
+        prices, quantities, name_offsets, description_offsets = columns
+
+        blob = _read_exact(stream, names_size + descriptions_size)
+        names = [blob[name_offsets[i]:name_offsets[i + 1]].decode("utf-8") for i in range(count)]
+        descriptions_blob = blob[names_size:]
+        descriptions = [
+            descriptions_blob[description_offsets[i]:description_offsets[i + 1]].decode("utf-8") for i in range(count)
+        ]
+        yield category_name, category_description, prices, quantities, names, descriptions
+
+
+def _read_exact(stream, size: int) -> bytes:
+    """Читает size байт и пропускает выравнивание секции."""
+    data = stream.read(size + _padding(size))
+    if len(data) < size + _padding(size):
+        raise ValueError("Неожиданный конец колоночного экспорта")
+    return data[:size]
+
+
+def load_columnar(source, columnar: bool = False):
+    """
+    Загружает категории из колоночного экспорта.
+
+    Блоки одной категории объединяются в порядке следования.
+
+    Args:
+        source (str | PathLike | file): Путь или двоичный файловый объект
+        columnar (bool): Хранить товары в ColumnarProductStore
+
+    Returns:
+        list: Категории
+    """
+    if not hasattr(source, "read"):
+        with open(os.fspath(source), "rb") as stream:
+            return load_columnar(stream, columnar)
+
+    categories = {}
+    for name, description, prices, quantities, names, descriptions in iter_columnar_blocks(source):
+        products = [Product(*fields) for fields in zip(names, descriptions, prices, quantities)]
+        category = categories.get(name)
+        if category is None:
+            categories[name] = Category(name, description, ColumnarProductStore(products) if columnar else products)
+        else:
+            category.extend(products)
+    return list(categories.values())
+
+
+def export_catalog(categories, path, file_format: str = None, chunk_size: int = None) -> int:
+    """
+    Потоково записывает категории в файл.
+
+    Args:
+        categories (Iterable[Category]): Категории
+        path (str | PathLike): Путь к файлу
+        file_format (str): Формат ("csv", "jsonl", "col"), по умолчанию по расширению
+        chunk_size (int): Количество товаров в пакете, по умолчанию как у функции формата
+
+    Returns:
+        int: Количество записанных товаров
+    """
+    if file_format is None:
+        file_format = os.path.splitext(os.fspath(path))[1].lstrip(".").lower()
+    exporters = {"csv": export_csv, "jsonl": export_jsonl, "col": export_columnar}
+    if file_format not in exporters:
+        raise ValueError(f"Неизвестный формат каталога: {file_format}")
+    if chunk_size is None:
+        return exporters[file_format](categories, path)
+    return exporters[file_format](categories, path, chunk_size)
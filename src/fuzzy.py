@@ -0,0 +1,204 @@
+import re
+import unicodedata
+from math import ceil
+
+from src.product import Product
+
+# Транслитерация кириллицы, чтобы "Айфон" и "Aifon" давали одинаковые триграммы
+_TRANSLITERATION = str.maketrans(
+    {
+        "а": "a", "б": "b", "в": "v", "г": "g", "д": "d", "е": "e", "ё": "e", "ж": "zh",
+        "з": "z", "и": "i", "й": "i", "к": "k", "л": "l", "м": "m", "н": "n", "о": "o",
+        "п": "p", "р": "r", "с": "s", "т": "t", "у": "u", "ф": "f", "х": "h", "ц": "ts",
+        "ч": "ch", "ш": "sh", "щ": "sch", "ъ": "", "ы": "y", "ь": "", "э": "e", "ю": "yu",
+        "я": "ya",
+    }
+)  # fmt: skip
+
+_SEPARATORS = re.compile(r"[\W_]+")
+
+
+def normalize_name(name: str, transliterate: bool = True) -> str:
+    """
+    Нормализует название товара для нечеткого сравнения.
+
+    Регистр и диакритика отбрасываются, кириллица (по желанию) транслитерируется,
+    знаки препинания и повторные пробелы заменяются одним пробелом.
+    """
+    name = unicodedata.normalize("NFKD", name.casefold())
+    name = "".join(character for character in name if not unicodedata.combining(character))
+    if transliterate:
+        name = name.translate(_TRANSLITERATION)
+    return " ".join(_SEPARATORS.sub(" ", name).split())
+
+
+def _signature(key: str):
+    """Триграммы нормализованного названия (с границами слов) и его числа."""
+    padded = f" {key} "
+    trigrams = frozenset(padded[index:index + 3] for index in range(len(padded) - 2))
+    numbers = frozenset(token for token in key.split() if token.isdigit())
+    return trigrams, numbers
+
+
+class FuzzyProductIndex:
+    """
+    Индекс товаров с поиском приближенных дубликатов по названию.
+
+    Названия нормализуются (normalize_name) и сравниваются по коэффициенту
+    Жаккара множеств триграмм. Кандидаты отбираются по инвертированному
+    индексу триграмм с префиксной фильтрацией: товар со сходством не ниже threshold
+    обязан содержать хотя бы одну из самых редких триграмм запроса, поэтому
+    просматриваются только их списки, а не все товары. При match_numbers=True
+    числа в названиях должны совпадать ("iPhone 14" и "iPhone 15" - разные товары).
+
+    Индекс реализует интерфейс ProductRegistry (get, add, discard), поэтому
+    его можно передать в Product.new_product(..., registry=index).
+
+    Атрибуты:
+        threshold (float): Минимальное сходство для дубликата (от 0 до 1)
+        transliterate (bool): Транслитерировать кириллицу при нормализации
+        match_numbers (bool): Требовать совпадения чисел в названиях
+    """
+
+    def __init__(self, products=None, threshold: float = 0.8, transliterate: bool = True, match_numbers: bool = True):
+        if not 0 < threshold <= 1:
+            raise ValueError("Порог сходства должен быть в диапазоне (0, 1]")
+        self.threshold = threshold
+        self.transliterate = transliterate
+        self.match_numbers = match_numbers
+        self.__products = {}
+        self.__signatures = {}
+        self.__exact = {}
+        self.__postings = {}
+        self.__next_id = 0
+        if products:
+            for product in products:
+                self.add(product)
+
+    def normalize(self, name: str) -> str:
+        """Нормализует название по настройкам индекса."""
+        return normalize_name(name, self.transliterate)
+
+    def candidates(self, name: str):
+        """
+        Товары, похожие на name не меньше чем на threshold.
+
+        Returns:
+            list: Пары (сходство, товар) по убыванию сходства
+        """
+        key = self.normalize(name)
+        product_id = self.__exact.get(key)
+        if product_id is not None:
+            return [(1.0, self.__products[product_id])]
+
+        trigrams, numbers = _signature(key)
+        if not trigrams:
+            return []
+        # Префиксная фильтрация: при сходстве >= threshold общих триграмм не меньше
+        # ceil(threshold * len(trigrams)), значит хотя бы одна из остальных самых редких - общая
+        required = ceil(self.threshold * len(trigrams))
+        rarest = sorted(trigrams, key=lambda trigram: len(self.__postings.get(trigram, ())))
+        candidate_ids = set()
+        for trigram in rarest[: len(trigrams) - required + 1]:
+            candidate_ids.update(self.__postings.get(trigram, ()))
+
+        matches = []
+        for product_id in candidate_ids:
+            other_trigrams, other_numbers = self.__signatures[product_id]
+            if self.match_numbers and numbers != other_numbers:
+                continue
+            common = len(trigrams & other_trigrams)
+            score = common / (len(trigrams) + len(other_trigrams) - common)
+            if score >= self.threshold:
+                matches.append((score, product_id))
+        matches.sort(key=lambda match: (-match[0], match[1]))
+        return [(score, self.__products[product_id]) for score, product_id in matches]
+
+    def get(self, name: str):
+        """Возвращает наиболее похожий товар или None."""
+        matches = self.candidates(name)
+        return matches[0][1] if matches else None
+
+    def add(self, product):
+        """
+        Регистрирует товар, если похожего товара еще нет.
+
+        Returns:
+            Product: Найденный похожий товар или сам product
+        """
+        if not isinstance(product, Product):
+            raise TypeError("Можно добавлять только объекты класса Product")
+        existing_product = self.get(product.name)
+        if existing_product is not None:
+            return existing_product
+
+        key = self.normalize(product.name)
+        product_id = self.__next_id
+        self.__next_id += 1
+        signature = _signature(key)
+        self.__products[product_id] = product
+        self.__signatures[product_id] = signature
+        self.__exact[key] = product_id
+        for trigram in signature[0]:
+            self.__postings.setdefault(trigram, set()).add(product_id)
+        return product
+
+    def discard(self, product):
+        """Удаляет товар из индекса, если он зарегистрирован."""
+        key = self.normalize(product.name)
+        product_id = self.__exact.get(key)
+        if product_id is None or self.__products[product_id] is not product:
+            return
+        del self.__exact[key]
+        del self.__products[product_id]
+        for trigram in self.__signatures.pop(product_id)[0]:
+            self.__postings[trigram].discard(product_id)
+
+    def get_products_list(self):
+        """Метод для получения списка уникальных товаров."""
+        return list(self.__products.values())
+
+    def __contains__(self, name):
+        return isinstance(name, str) and self.get(name) is not None
+
+    def __len__(self):
+        return len(self.__products)
+
+    def __iter__(self):
+        return iter(self.__products.values())
+
+    def __repr__(self):
+        """Представление объекта для отладки."""
+        return f"FuzzyProductIndex({len(self.__products)} продуктов, порог {self.threshold})"
+
+
+def dedupe_category(category, threshold: float = 0.8, index: FuzzyProductIndex = None):
+    """
+    Объединяет приближенные дубликаты внутри категории.
+
+    Первый товар из группы похожих остается, остальные объединяются с ним
+    по правилам new_product (количества складываются, выбирается максимальная цена)
+    и удаляются из категории.
+
+    Args:
+        category (Category): Категория
+        threshold (float): Порог сходства (если index не передан)
+        index (FuzzyProductIndex): Индекс для поиска; может уже содержать товары
+
+    Returns:
+        list: Пары (оставленный товар, удаленный дубликат)
+    """
+    if index is None:
+        index = FuzzyProductIndex(threshold=threshold)
+    duplicates = []
+    for position, product in enumerate(category.iter_snapshot()):
+        existing_product = index.add(product)
+        if existing_product is not product:
+            duplicates.append((position, existing_product, product))
+
+    for _, existing_product, product in duplicates:
+        existing_product._merge({"price": product.price, "quantity": product.quantity})
+    # Удаление с конца не сдвигает позиции оставшихся элементов колоночного хранилища
+    for _, _, product in reversed(duplicates):
+        category.remove_product(product)
+    return [(existing_product, product) for _, existing_product, product in duplicates]
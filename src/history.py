@@ -0,0 +1,193 @@
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+class PriceHistory:
+    """
+    История цены одного товара в кольцевом буфере.
+
+    Время и цена хранятся в двух массивах array("d"); после заполнения
+    буфера новые записи вытесняют самые старые. Отметки времени не убывают:
+    запись со временем меньше последнего сохраняется с последним временем.
+    Поиск цены на момент времени выполняется двоичным поиском за O(log n).
+
+    История подключается к товару как наблюдатель (attach) и записывает
+    каждое принятое изменение цены: через сеттер price, при объединении
+    дубликатов в new_product и при пакетном обновлении цен. Товар хранит
+    только слабую ссылку на историю, поэтому история, на которую
+    не осталось ссылок, перестает записываться.
+
+    Атрибуты:
+        capacity (int): Размер кольцевого буфера
+    """
+
+    def __init__(self, capacity: int = 1024, clock=time.time):
+        if capacity < 1:
+            raise ValueError("Размер истории должен быть положительным")
+        self.capacity = capacity
+        self.clock = clock
+        self.__times = array("d")
+        self.__prices = array("d")
+        self.__start = 0
+
+    @classmethod
+    def attach(cls, product, capacity: int = 1024, clock=time.time):
+        """Создает историю с текущей ценой товара и подписывает ее на изменения цены."""
+        history = cls(capacity, clock)
+        history.record(product.price)
+        product._add_observer(history)
+        return history
+
+    def detach(self, product):
+        """Отписывает историю от товара."""
+        product._remove_observer(self)
+
+    def _product_changed(self, product, attribute: str, old_value, new_value):
+        if attribute == "price":
+            self.record(new_value)
+
+    def record(self, price: float, timestamp: float = None):
+        """Добавляет запись цены (по умолчанию с текущим временем)."""
+        if timestamp is None:
+            timestamp = self.clock()
+        times = self.__times
+        if len(times) < self.capacity:
+            if times and timestamp < times[-1]:
+                timestamp = times[-1]
+            times.append(timestamp)
+            self.__prices.append(price)
+            return
+        last = times[self.__start - 1]
+        if timestamp < last:
+            timestamp = last
+        times[self.__start] = timestamp
+        self.__prices[self.__start] = price
+        self.__start = (self.__start + 1) % self.capacity
+
+    def price_at(self, timestamp: float):
+        """
+        Цена на момент времени timestamp.
+
+        Returns:
+            float: Последняя цена, записанная не позже timestamp,
+                или None, если момент раньше самой старой записи
+        """
+        times = self.__times
+        start = self.__start
+        # Буфер состоит из двух отсортированных участков: [start, len) и [0, start)
+        if start and timestamp >= times[0]:
+            position = bisect_right(times, timestamp, 0, start)
+        else:
+            position = bisect_right(times, timestamp, start, len(times))
+            if position == start:
+                return None
+        return self.__prices[position - 1]
+
+    def between(self, start_time: float, end_time: float):
+        """
+        Записи в интервале [start_time, end_time].
+
+        Returns:
+            tuple: (array времен, array цен) в хронологическом порядке
+        """
+        times, prices = self.columns()
+        low = bisect_left(times, start_time)
+        high = bisect_right(times, end_time)
+        return times[low:high], prices[low:high]
+
+    def columns(self):
+        """Копии колонок времени и цены в хронологическом порядке."""
+        start = self.__start
+        return self.__times[start:] + self.__times[:start], self.__prices[start:] + self.__prices[:start]
+
+    def __len__(self):
+        return len(self.__times)
+
+    def __repr__(self):
+        """Представление объекта для отладки."""
+        return f"PriceHistory({len(self)} записей из {self.capacity})"
+
+
+class CategoryPriceHistory:
+    """
+    История цен всех товаров категории.
+
+    Подключается к категории как слушатель: для каждого товара (в том числе
+    добавленного позже) ведется PriceHistory, изменения цены приходят
+    через product_changed, поэтому история работает и с колоночным хранилищем:
+    его представления сравниваются по постоянному номеру строки, который
+    не меняется при удалении других товаров.
+    Запросы выполняются сразу по всей категории.
+
+    Атрибуты:
+        category (Category): Категория
+        capacity (int): Размер истории каждого товара
+    """
+
+    def __init__(self, category, capacity: int = 1024, clock=time.time):
+        self.category = category
+        self.capacity = capacity
+        self.clock = clock
+        self.__histories = {}
+        for product in category:
+            self.product_added(category, product)
+        category.add_listener(self)
+
+    def detach(self):
+        """Отписывает историю от категории."""
+        self.category.remove_listener(self)
+
+    def product_added(self, category, product):
+        """Уведомление категории о добавлении товара."""
+        if product not in self.__histories:
+            history = PriceHistory(self.capacity, self.clock)
+            history.record(product.price)
+            self.__histories[product] = history
+
+    def product_removed(self, category, product):
+        """Уведомление категории об удалении товара."""
+        self.__histories.pop(product, None)
+
+    def product_changed(self, category, product, attribute: str, old_value, new_value):
+        """Уведомление категории об изменении товара."""
+        if attribute == "price":
+            self.__histories[product].record(new_value)
+
+    def history(self, product):
+        """История цены товара категории."""
+        return self.__histories[product]
+
+    def prices_at(self, timestamp: float):
+        """
+        Цены всех товаров категории на момент времени.
+
+        Returns:
+            array: Цены в порядке товаров категории; NaN для товаров без истории на этот момент
+        """
+        prices = array("d")
+        for product in self.category:
+            price = self.__histories[product].price_at(timestamp)
+            prices.append(float("nan") if price is None else price)
+        return prices
+
+    def changes_between(self, start_time: float, end_time: float):
+        """
+        Изменения цен товаров категории в интервале [start_time, end_time].
+
+        Returns:
+            list: (товар, array времен, array цен) для товаров, у которых были записи в интервале
+        """
+        changes = []
+        for product in self.category:
+            times, prices = self.__histories[product].between(start_time, end_time)
+            if times:
+                changes.append((product, times, prices))
+        return changes
+
+    def __len__(self):
+        return len(self.__histories)
+
+    def __repr__(self):
+        """Представление объекта для отладки."""
+        return f"CategoryPriceHistory('{self.category.name}', {len(self)} товаров)"
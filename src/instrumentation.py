@@ -0,0 +1,257 @@
+import functools
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from src.product import Category, Product
+
+# Границы корзин гистограммы задержек в секундах
+BUCKETS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0)
+
+# Горячие пути: (метрика, класс, атрибут, что оборачивается)
+HOT_PATHS = (
+    ("Product.new_product", Product, "new_product", "classmethod"),
+    ("Category.add_product", Category, "add_product", "method"),
+    ("Product.price", Product, "price", "setter"),
+    ("Category.products", Category, "products", "getter"),
+)
+
+
+class MethodStats:
+    """
+    Статистика вызовов одного метода.
+
+    Атрибуты:
+        count (int): Количество вызовов
+        seconds (float): Суммарное время выполнения
+        buckets (list): Количество вызовов по корзинам BUCKETS (последняя - выше всех границ)
+        allocations (int): Прирост числа выделенных блоков памяти
+    """
+
+    def __init__(self, bounds=BUCKETS):
+        self.bounds = bounds
+        self.reset()
+
+    def observe(self, seconds: float, allocations: int = 0):
+        """Учитывает один вызов."""
+        self.count += 1
+        self.seconds += seconds
+        for position, bound in enumerate(self.bounds):
+            if seconds <= bound:
+                break
+        else:
+            position = len(self.bounds)
+        self.buckets[position] += 1
+        if allocations > 0:
+            self.allocations += allocations
+
+    def reset(self):
+        """Обнуляет статистику; объект остается тем же, поэтому подключенные обертки продолжают учет."""
+        self.count = 0
+        self.seconds = 0.0
+        self.buckets = [0] * (len(self.bounds) + 1)
+        self.allocations = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "seconds": self.seconds,
+            "buckets": dict(zip([*map(str, self.bounds), "+Inf"], self.buckets)),
+            "allocations": self.allocations,
+        }
+
+    def __repr__(self):
+        """Представление объекта для отладки."""
+        return f"MethodStats({self.count} вызовов, {self.seconds:.6f} с)"
+
+
+class Instrumentation:
+    """
+    Подключаемые измерения горячих путей каталога.
+
+    Пока измерения выключены, классы Product и Category не изменены и накладных
+    расходов нет. enable() заменяет методы из targets обертками, которые считают
+    вызовы, собирают гистограмму задержек и (при track_allocations=True) прирост
+    числа выделенных блоков памяти; disable() возвращает исходные методы.
+    Счетчики не защищены блокировкой и при многопоточной нагрузке приблизительны.
+
+    Атрибуты:
+        targets (tuple): Горячие пути в формате HOT_PATHS
+        stats (dict): Статистика по именам метрик
+    """
+
+    def __init__(self, targets=HOT_PATHS, buckets=BUCKETS):
+        self.targets = tuple(targets)
+        self.stats = {name: MethodStats(buckets) for name, *_ in self.targets}
+        self.__originals = None
+
+    @property
+    def enabled(self):
+        """Признак включенных измерений."""
+        return self.__originals is not None
+
+    def enable(self, track_allocations: bool = False):
+        """Подключает обертки к горячим путям (повторный вызов ничего не делает)."""
+        if self.enabled:
+            return
+        self.__originals = []
+        for name, owner, attribute, kind in self.targets:
+            original = owner.__dict__[attribute]
+            self.__originals.append((owner, attribute, original))
+            setattr(owner, attribute, _instrument(original, kind, self.stats[name], track_allocations))
+
+    def disable(self):
+        """Возвращает исходные методы."""
+        if not self.enabled:
+            return
+        for owner, attribute, original in reversed(self.__originals):
+            setattr(owner, attribute, original)
+        self.__originals = None
+
+    def reset(self):
+        """Обнуляет собранную статистику (в том числе при включенных измерениях)."""
+        for stats in self.stats.values():
+            stats.reset()
+
+    def to_dict(self) -> dict:
+        """Статистика в виде словаря по именам метрик."""
+        return {name: stats.to_dict() for name, stats in self.stats.items()}
+
+    def to_prometheus(self, prefix: str = "catalog") -> str:
+        """Статистика в текстовом формате Prometheus."""
+        lines = [
+            f"# HELP {prefix}_calls_total Количество вызовов метода",
+            f"# TYPE {prefix}_calls_total counter",
+        ]
+        for name, stats in self.stats.items():
+            lines.append(f'{prefix}_calls_total{{method="{name}"}} {stats.count}')
+
+        lines += [
+            f"# HELP {prefix}_call_duration_seconds Время выполнения метода",
+            f"# TYPE {prefix}_call_duration_seconds histogram",
+        ]
+        for name, stats in self.stats.items():
+            cumulative = 0
+            for bound, count in zip([*map(repr, stats.bounds), "+Inf"], stats.buckets):
+                cumulative += count
+                lines.append(f'{prefix}_call_duration_seconds_bucket{{method="{name}",le="{bound}"}} {cumulative}')
+            lines.append(f'{prefix}_call_duration_seconds_sum{{method="{name}"}} {stats.seconds!r}')
+            lines.append(f'{prefix}_call_duration_seconds_count{{method="{name}"}} {stats.count}')
+
+        lines += [
+            f"# HELP {prefix}_allocated_blocks_total Прирост числа выделенных блоков памяти",
+            f"# TYPE {prefix}_allocated_blocks_total counter",
+        ]
+        for name, stats in self.stats.items():
+            lines.append(f'{prefix}_allocated_blocks_total{{method="{name}"}} {stats.allocations}')
+        return "\n".join(lines) + "\n"
+
+    def __repr__(self):
+        """Представление объекта для отладки."""
+        return f"Instrumentation({len(self.targets)} методов, {'включено' if self.enabled else 'выключено'})"
+
+
+def _instrument(original, kind: str, stats: MethodStats, track_allocations: bool):
+    """Создает замену атрибута класса с оберткой нужной функции."""
+    if kind == "classmethod":
+        return classmethod(_wrap(original.__func__, stats, track_allocations))
+    if kind == "method":
+        return _wrap(original, stats, track_allocations)
+    if kind == "getter":
+        return original.getter(_wrap(original.fget, stats, track_allocations))
+    if kind == "setter":
+        return original.setter(_wrap(original.fset, stats, track_allocations))
+    raise ValueError(f"Неизвестный вид атрибута: {kind}")
+
+
+def _wrap(function, stats: MethodStats, track_allocations: bool):
+    if track_allocations:
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            blocks = sys.getallocatedblocks()
+            started = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                stats.observe(time.perf_counter() - started, sys.getallocatedblocks() - blocks)
+
+    else:
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                stats.observe(time.perf_counter() - started)
+
+    return wrapper
+
+
+INSTRUMENTATION = Instrumentation()
+
+
+class ProfileReport:
+    """
+    Результат профилирования блока кода.
+
+    Атрибуты:
+        seconds (float): Время выполнения блока
+        memory_allocated (int): Прирост занятой памяти по данным tracemalloc, байт
+        memory_peak (int): Пиковый прирост памяти, байт
+        metrics (dict): Статистика горячих путей в формате Instrumentation.to_dict()
+    """
+
+    def __init__(self):
+        self.seconds = 0.0
+        self.memory_allocated = 0
+        self.memory_peak = 0
+        self.metrics = {}
+
+    def __repr__(self):
+        """Представление объекта для отладки."""
+        return f"ProfileReport({self.seconds:.6f} с, пик памяти {self.memory_peak} байт)"
+
+
+@contextmanager
+def profile(instrumentation: Instrumentation = None, track_allocations: bool = True):
+    """
+    Профилирует блок кода: горячие пути и память через tracemalloc.
+
+    Статистика instrumentation перед началом блока обнуляется; если измерения
+    были выключены, после блока они выключаются снова.
+
+    Пример:
+        with profile() as report:
+            load_catalog("catalog.json")
+        print(report.metrics["Category.add_product"]["count"])
+
+    Yields:
+        ProfileReport: Отчет, заполняемый при выходе из блока
+    """
+    if instrumentation is None:
+        instrumentation = INSTRUMENTATION
+    report = ProfileReport()
+    was_enabled = instrumentation.enabled
+    instrumentation.reset()
+    instrumentation.enable(track_allocations)
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    memory_before = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    try:
+        yield report
+    finally:
+        report.seconds = time.perf_counter() - started
+        memory_current, memory_peak = tracemalloc.get_traced_memory()
+        report.memory_allocated = memory_current - memory_before
+        report.memory_peak = memory_peak - memory_before
+        if not was_tracing:
+            tracemalloc.stop()
+        report.metrics = instrumentation.to_dict()
+        if not was_enabled:
+            instrumentation.disable()
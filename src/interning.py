@@ -0,0 +1,98 @@
+import sys
+
+from src.product import Product, ProductRegistry
+
+
+class ProductInterner(ProductRegistry):
+    """
+    Слой интернирования товаров, общий для нескольких категорий.
+
+    Каждому нормализованному имени (без учета регистра, как в new_product)
+    соответствует один общий объект Product, на который ссылаются все категории.
+    Названия и описания зарегистрированных товаров интернируются через sys.intern,
+    поэтому одинаковые строки хранятся в памяти один раз.
+    Дубликат объединяется с общим товаром по правилам new_product
+    (количества складываются, выбирается максимальная цена) за O(1).
+
+    Интернер реализует интерфейс ProductRegistry, поэтому его можно передать
+    в Product.new_product(..., registry=interner).
+    """
+
+    def add(self, product):
+        """
+        Регистрирует товар и интернирует его строки.
+
+        Returns:
+            Product: Общий товар с этим именем
+        """
+        existing_product = super().add(product)
+        if existing_product is product:
+            product.name = sys.intern(product.name)
+            product.description = sys.intern(product.description)
+        return existing_product
+
+    def intern(self, product):
+        """
+        Возвращает общий товар для product.
+
+        Если под этим именем уже зарегистрирован другой объект, данные product
+        объединяются с ним. Каждый объект-дубликат следует интернировать один раз,
+        иначе его количество будет учтено повторно.
+        """
+        existing_product = self.add(product)
+        if existing_product is not product:
+            existing_product._merge({"price": product.price, "quantity": product.quantity})
+        return existing_product
+
+    def new_product(self, product_data: dict):
+        """Создает товар из словаря или объединяет его с общим товаром."""
+        return Product.new_product(product_data, registry=self)
+
+    def intern_categories(self, categories) -> int:
+        """
+        Заменяет товары категорий общими товарами.
+
+        Дубликаты объединяются с общим товаром и заменяются им на своей позиции;
+        если общий товар уже есть в категории, дубликат из нее удаляется.
+        Колоночные категории не поддерживаются: хранилище копирует данные товаров
+        и не может ссылаться на общий объект.
+
+        Returns:
+            int: Количество замененных или удаленных дубликатов
+        """
+        categories = list(categories)
+        for category in categories:
+            if hasattr(category.get_products_list(), "_add_observer"):
+                raise TypeError(f"Категория с колоночным хранилищем не поддерживает общие товары: {category.name}")
+
+        # Дубликат, входящий в несколько категорий, объединяется только один раз
+        interned = {}
+        replaced = 0
+        for category in categories:
+            products = tuple(category.iter_snapshot())
+            present = {id(product) for product in products}
+            for product in products:
+                entry = interned.get(id(product))
+                if entry is None:
+                    entry = interned[id(product)] = (product, self.intern(product))
+                shared_product = entry[1]
+                if shared_product is product:
+                    continue
+                if id(shared_product) in present:
+                    category.remove_product(product)
+                else:
+                    category.replace_product(product, shared_product)
+                    present.add(id(shared_product))
+                replaced += 1
+        return replaced
+
+    def intern_category(self, category) -> int:
+        """Заменяет товары одной категории общими товарами (см. intern_categories)."""
+        return self.intern_categories([category])
+
+    def __repr__(self):
+        """Представление объекта для отладки."""
+        return f"ProductInterner({len(self)} продуктов)"
+
+
+PRODUCT_INTERNER = ProductInterner()
@@ -0,0 +1,286 @@
+import json
+import os
+
+from src.product import Category, Product
+from src.snapshot import open_snapshot, write_snapshot
+
+
+class ChangeJournal:
+    """
+    Журнал изменений каталога с дозаписью (write-ahead log).
+
+    Журнал подписывается на категории и записывает каждое изменение отдельной
+    JSON-строкой: создание категории, добавление и удаление товара, изменение количества
+    (в виде разницы) и изменение цены. Записи накапливаются в буфере и
+    сбрасываются на диск группами по group_size записей (group commit).
+    compact() сохраняет текущее состояние в снимок и очищает журнал,
+    поэтому при восстановлении (recover) повторно применяется только хвост журнала.
+
+    Каждая запись получает возрастающий номер seq, который не сбрасывается
+    при сжатии. Товары в записях обозначаются номером id внутри категории:
+    товары, которые уже есть в категории при подключении или сжатии, нумеруются
+    по позиции, добавленные позже - следующими номерами. Поэтому товары
+    с названиями, различающимися только регистром, не путаются при восстановлении.
+
+    Атрибуты:
+        path (str): Путь к файлу журнала
+        group_size (int): Количество записей в группе
+        sync (bool): Вызывать os.fsync при каждом сбросе группы
+        records (int): Количество записей с момента открытия или последнего сжатия
+        sequence (int): Номер последней записи журнала
+    """
+
+    def __init__(self, path, group_size: int = 100, sync: bool = False):
+        if group_size < 1:
+            raise ValueError("Размер группы должен быть положительным")
+        self.path = os.fspath(path)
+        self.group_size = group_size
+        self.sync = sync
+        self.records = 0
+        self.sequence = _last_sequence(self.path)
+        self.__buffer = []
+        self.__categories = []
+        self.__product_ids = {}
+        self.__next_ids = {}
+        self.__stream = open(self.path, "a", encoding="utf-8")
+
+    def attach(self, category, include_products: bool = True):
+        """
+        Подписывает журнал на изменения категории.
+
+        Args:
+            category (Category): Категория
+            include_products (bool): Записать текущие товары категории как добавления
+                (не нужно, если категория уже сохранена в снимке)
+        """
+        self.__append({"op": "category", "name": category.name, "description": category.description})
+        if include_products:
+            self.__product_ids[category] = {}
+            self.__next_ids[category] = 0
+            for product in category:
+                self.product_added(category, product)
+        else:
+            self.__number_products(category)
+        category.add_listener(self)
+        self.__categories.append(category)
+
+    def detach(self):
+        """Отписывает журнал от всех категорий."""
+        for category in self.__categories:
+            category.remove_listener(self)
+        self.__categories = []
+        self.__product_ids = {}
+        self.__next_ids = {}
+
+    def __number_products(self, category):
+        """Нумерует товары категории по позиции, как они будут прочитаны из снимка."""
+        self.__product_ids[category] = {product: position for position, product in enumerate(category)}
+        self.__next_ids[category] = len(self.__product_ids[category])
+
+    def product_added(self, category, product):
+        """Уведомление категории о добавлении товара."""
+        product_id = self.__next_ids[category]
+        self.__next_ids[category] = product_id + 1
+        self.__product_ids[category][product] = product_id
+        self.__append(
+            {
+                "op": "add",
+                "category": category.name,
+                "id": product_id,
+                "name": product.name,
+                "description": product.description,
+                "price": product.price,
+                "quantity": product.quantity,
+            }
+        )
+
+    def product_removed(self, category, product):
+        """Уведомление категории об удалении товара."""
+        product_id = self.__product_ids[category].pop(product)
+        self.__append({"op": "remove", "category": category.name, "id": product_id, "name": product.name})
+
+    def product_changed(self, category, product, attribute: str, old_value, new_value):
+        """Уведомление категории об изменении цены или количества товара."""
+        product_id = self.__product_ids[category][product]
+        if attribute == "quantity":
+            self.__append(
+                {"op": "quantity", "category": category.name, "id": product_id, "name": product.name, "delta": new_value - old_value}
+            )
+        elif attribute == "price":
+            self.__append({"op": "price", "category": category.name, "id": product_id, "name": product.name, "price": new_value})
+
+    def __append(self, record: dict):
+        self.sequence += 1
+        record["seq"] = self.sequence
+        self.__buffer.append(json.dumps(record, ensure_ascii=False))
+        self.records += 1
+        if len(self.__buffer) >= self.group_size:
+            self.commit()
+
+    def commit(self):
+        """Сбрасывает накопленные записи на диск одной операцией записи."""
+        if self.__buffer:
+            self.__buffer.append("")
+            self.__stream.write("\n".join(self.__buffer))
+            self.__buffer = []
+        self.__stream.flush()
+        if self.sync:
+            os.fsync(self.__stream.fileno())
+
+    def compact(self, snapshot_path, categories=None):
+        """
+        Сохраняет категории в снимок и очищает журнал.
+
+        Снимок сначала записывается во временный файл и атомарно заменяет старый,
+        затем журнал так же атомарно заменяется файлом с единственной записью
+        "checkpoint", хранящей номер последней записи. Снимок содержит этот же номер,
+        поэтому, если процесс прервется между заменами, recover пропустит записи
+        хвоста журнала, уже вошедшие в снимок. Сжатие следует выполнять
+        при отсутствии параллельных изменений.
+
+        Args:
+            snapshot_path (str | PathLike): Путь к файлу снимка
+            categories (Iterable[Category]): Категории для сохранения,
+                по умолчанию все подписанные категории
+        """
+        self.commit()
+        if categories is None:
+            categories = self.__categories
+        temporary_path = f"{os.fspath(snapshot_path)}.tmp"
+        write_snapshot(categories, temporary_path, self.sequence)
+        os.replace(temporary_path, snapshot_path)
+
+        self.__stream.close()
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as stream:
+            stream.write(json.dumps({"op": "checkpoint", "seq": self.sequence}) + "\n")
+            stream.flush()
+            if self.sync:
+                os.fsync(stream.fileno())
+        os.replace(temporary_path, self.path)
+        self.__stream = open(self.path, "a", encoding="utf-8")
+        self.records = 0
+        for category in self.__categories:
+            self.__number_products(category)
+
+    def close(self):
+        """Сбрасывает записи, отписывается от категорий и закрывает файл журнала."""
+        self.commit()
+        self.detach()
+        self.__stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __repr__(self):
+        """Представление объекта для отладки."""
+        return f"ChangeJournal('{self.path}', {self.records} записей)"
+
+
+def _last_sequence(path) -> int:
+    """
+    Номер последней полной записи журнала (0 для пустого или отсутствующего журнала).
+
+    Оборванная последняя строка (сбой во время записи) отрезается, чтобы следующие
+    записи не дописывались в ее конец.
+    """
+    if not os.path.exists(path):
+        return 0
+    last_line = None
+    complete_size = 0
+    with open(path, "r+b") as stream:
+        for line in stream:
+            if line.endswith(b"\n"):
+                last_line = line
+                complete_size += len(line)
+        if stream.tell() != complete_size:
+            stream.truncate(complete_size)
+    return json.loads(last_line).get("seq", 0) if last_line else 0
+
+
+def replay(path, categories=(), after: int = 0):
+    """
+    Применяет записи журнала к категориям.
+
+    Неполная последняя строка (обрыв записи при сбое) пропускается.
+    Товары категорий, переданных в categories, сопоставляются с номерами id
+    записей по позиции (как при подключении журнала к категории из снимка).
+
+    Args:
+        path (str | PathLike): Путь к файлу журнала
+        categories (Iterable[Category]): Категории, к которым применяются изменения;
+            отсутствующие категории создаются по записям "category"
+        after (int): Номер последней записи, уже примененной к категориям
+            (например, вошедшей в снимок); записи с номерами не больше after пропускаются
+
+    Returns:
+        list: Категории после применения журнала
+    """
+    by_name = {category.name: category for category in categories}
+    products = {name: dict(enumerate(category)) for name, category in by_name.items()}
+
+    with open(path, encoding="utf-8") as stream:
+        lines = stream.read().split("\n")
+
+    for line_number, line in enumerate(lines, 1):
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            if line_number == len(lines):
+                break
+            raise ValueError(f"Поврежденная запись журнала в строке {line_number}")
+
+        operation = record["op"]
+        if operation == "checkpoint" or record.get("seq", after + 1) <= after:
+            continue
+        if operation == "category":
+            if record["name"] not in by_name:
+                by_name[record["name"]] = Category(record["name"], record["description"], [])
+                products[record["name"]] = {}
+            continue
+
+        category = by_name[record["category"]]
+        category_products = products[record["category"]]
+        if operation == "add":
+            category.add_product(Product._from_dict(record))
+            category_products[record["id"]] = category.get_products_list()[-1]
+            continue
+
+        product = category_products.get(record["id"])
+        if product is None:
+            raise ValueError(f"Товар из журнала не найден: {record['name']}")
+        if operation == "remove":
+            category.remove_product(product)
+            del category_products[record["id"]]
+        elif operation == "quantity":
+            product.quantity += record["delta"]
+        elif operation == "price":
+            # Цена уже была подтверждена при записи в журнал
+            product._set_price(record["price"])
+        else:
+            raise ValueError(f"Неизвестная операция журнала: {operation}")
+
+    return list(by_name.values())
+
+
+def recover(snapshot_path, journal_path):
+    """
+    Восстанавливает каталог из снимка и хвоста журнала.
+
+    Returns:
+        list: Восстановленные категории
+    """
+    categories = []
+    sequence = 0
+    if os.path.exists(snapshot_path):
+        with open_snapshot(snapshot_path) as snapshot:
+            categories = snapshot.to_categories(columnar=False)
+            sequence = snapshot.sequence
+    if os.path.exists(journal_path):
+        categories = replay(journal_path, categories, after=sequence)
+    return categories
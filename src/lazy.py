@@ -0,0 +1,92 @@
+from src.product import Product
+
+# Слот товара -> (ключ записи, преобразование значения)
+_FIELDS = {
+    "name": ("name", str),
+    "description": ("description", str),
+    "_Product__price": ("price", float),
+    "_quantity": ("quantity", int),
+}
+
+_PRICE_SLOT = Product.__dict__["_Product__price"]
+_QUANTITY_SLOT = Product.__dict__["_quantity"]
+
+
+class LazyProduct(Product):
+    """
+    Товар, который хранит исходную запись и создает атрибуты при первом обращении.
+
+    Запись - словарь с ключами name, description, price, quantity; значения
+    могут быть строками (например, строки csv.DictReader), цена и количество
+    преобразуются в float и int только при чтении. Пока слот Product не заполнен,
+    обращение к нему попадает в __getattr__, который берет значение из записи
+    и сохраняет его в слоте, поэтому последующие обращения не отличаются
+    по скорости от обычного Product.
+
+    LazyProduct можно передать в Product.new_product вместо словаря: новый товар
+    не копируется, а регистрируется как есть, при этом читается только название.
+    Category.add_product и extend принимают LazyProduct, но сразу читают цену
+    и количество для агрегатов, поэтому в категории ленивыми остаются только
+    название и описание. Цена и количество заполняются вместе одним обращением
+    без исключений, но и оно стоит примерно как создание обычного Product:
+    выигрыш есть, только если большая часть записей отбрасывается
+    или объединяется по названию до добавления в категорию.
+    """
+
+    __slots__ = ("_record", "_numbers_pending")
+
+    def __init__(self, record):
+        self._record = record
+        self._observers = None
+        self._numbers_pending = True
+
+    def _load_numbers(self):
+        """Заполняет цену и количество из записи."""
+        record = self._record
+        _PRICE_SLOT.__set__(self, float(record["price"]))
+        _QUANTITY_SLOT.__set__(self, int(record["quantity"]))
+        self._numbers_pending = False
+
+    @property
+    def price(self):
+        """Геттер для цены (заполняет цену и количество при первом обращении)."""
+        if self._numbers_pending:
+            self._load_numbers()
+        return _PRICE_SLOT.__get__(self)
+
+    price = price.setter(Product.price.fset)
+
+    @property
+    def quantity(self):
+        """Геттер для количества (заполняет цену и количество при первом обращении)."""
+        if self._numbers_pending:
+            self._load_numbers()
+        return _QUANTITY_SLOT.__get__(self)
+
+    quantity = quantity.setter(Product.quantity.fset)
+
+    def __getattr__(self, attribute: str):
+        field = _FIELDS.get(attribute)
+        if field is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{attribute}'")
+        if attribute in ("_Product__price", "_quantity"):
+            # Обращение к слоту из методов Product
+            self._load_numbers()
+            return getattr(self, attribute)
+        key, convert = field
+        value = convert(self._record[key])
+        setattr(self, attribute, value)
+        return value
+
+    def __getitem__(self, key: str):
+        """Доступ к полям как у словаря товара (для new_product и _merge)."""
+        if key in ("name", "description", "price", "quantity"):
+            return getattr(self, key)
+        return self._record[key]
+
+    def materialize(self):
+        """Заполняет все атрибуты из записи и освобождает ее."""
+        for attribute in _FIELDS:
+            getattr(self, attribute)
+        self._record = None
+        return self
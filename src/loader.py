@@ -0,0 +1,281 @@
+import csv
+import json
+import os
+import re
+import time
+
+from src.product import Category, Product, ProductRegistry
+from src.storage import ColumnarProductStore
+
+FORMATS = ("json", "jsonl", "csv")
+
+_SCALAR_END = re.compile(r"[,\]\s]")
+# Самый длинный незавершенный токен в конце блока: "-Infinity" без последнего символа или "\uXXX"
+_PARTIAL_TOKEN = len("-Infinity")
+
+
+def iter_json_array(stream, chunk_size: int = 1 << 16):
+    """
+    Потоково разбирает JSON-массив верхнего уровня и выдает его элементы по одному.
+
+    Файл читается блоками по chunk_size символов, в памяти держится только
+    текущий элемент массива (для каталога - категория целиком вместе с товарами).
+    Если ошибка разбора находится внутри прочитанного блока, а не на его конце,
+    элемент некорректен независимо от продолжения файла, и ValueError
+    выдается сразу, без дочитывания файла до конца.
+
+    Args:
+        stream: Текстовый файловый объект
+        chunk_size (int): Размер блока чтения
+
+    Yields:
+        Элементы массива
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    eof = False
+
+    def fill(size):
+        nonlocal buffer, position, eof
+        chunk = stream.read(size)
+        if chunk:
+            buffer = buffer[position:] + chunk
+            position = 0
+        else:
+            eof = True
+
+    def skip_whitespace():
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position] in " \t\r\n":
+                position += 1
+            if position < len(buffer) or eof:
+                return
+            fill(chunk_size)
+
+    skip_whitespace()
+    if position >= len(buffer) or buffer[position] != "[":
+        raise ValueError("Ожидался JSON-массив")
+    position += 1
+
+    expect_separator = False
+    while True:
+        skip_whitespace()
+        if position >= len(buffer):
+            raise ValueError("Неожиданный конец JSON-массива")
+        char = buffer[position]
+        if char == "]":
+            return
+        if expect_separator:
+            if char != ",":
+                raise ValueError(f"Ожидалась запятая в позиции {position}")
+            position += 1
+            skip_whitespace()
+            if position >= len(buffer):
+                raise ValueError("Неожиданный конец JSON-массива")
+
+        # Число или литерал разбираются по префиксу, поэтому сначала дочитываем их до разделителя
+        if buffer[position] not in '{["':
+            while not eof and not _SCALAR_END.search(buffer, position):
+                fill(chunk_size)
+
+        while True:
+            try:
+                element, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError as error:
+                if eof or not _may_be_truncated(error, buffer):
+                    raise ValueError(f"Некорректный JSON-элемент массива: {error.msg}")
+                # Читаем не меньше, чем уже накоплено, чтобы повторный разбор был амортизированно линейным
+                fill(max(chunk_size, len(buffer) - position))
+                continue
+            break
+
+        position = end
+        expect_separator = True
+        yield element
+
+
+def _may_be_truncated(error, buffer: str) -> bool:
+    """Может ли ошибка разбора исчезнуть, если дочитать файл."""
+    # Незавершенная строка сообщается с позицией ее начала, остальные ошибки
+    # обрыва элемента - с позицией в последнем незавершенном токене
+    return error.pos >= len(buffer) - _PARTIAL_TOKEN or error.msg.startswith("Unterminated string")
+
+
+def iter_json_records(stream, chunk_size: int = 1 << 16):
+    """
+    Выдает записи категорий из JSON-файла вида [{"name", "description", "products": [...]}, ...].
+
+    Потоковый разбор идет по категориям: товары одной категории читаются
+    в память вместе с ней. Для категорий, не помещающихся в память,
+    используйте JSONL с записями товаров.
+    """
+    return iter_json_array(stream, chunk_size)
+
+
+def iter_jsonl_records(stream):
+    """
+    Выдает записи из JSONL-файла построчно.
+
+    Строка может быть записью категории (с ключом "products")
+    или записью товара с ключами "category" и "category_description".
+    """
+    for line_number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as error:
+            raise ValueError(f"Некорректная JSON-строка {line_number}: {error.msg}")
+
+
+def iter_csv_records(stream):
+    """
+    Выдает записи товаров из CSV-файла.
+
+    Ожидаемые колонки: category, category_description (необязательна),
+    name, description, price, quantity.
+    """
+    for row in csv.DictReader(stream):
+        yield {
+            "category": row["category"],
+            "category_description": row.get("category_description") or "",
+            "name": row["name"],
+            "description": row["description"],
+            "price": float(row["price"]),
+            "quantity": int(row["quantity"]),
+        }
+
+
+class LoadStats:
+    """
+    Статистика загрузки каталога.
+
+    Атрибуты:
+        records (int): Количество прочитанных записей товаров
+        products (int): Количество уникальных товаров после объединения дубликатов
+        categories (int): Количество категорий
+        seconds (float): Время загрузки в секундах
+    """
+
+    def __init__(self):
+        self.records = 0
+        self.products = 0
+        self.categories = 0
+        self.seconds = 0.0
+
+    @property
+    def records_per_second(self):
+        """Пропускная способность загрузки (записей в секунду)."""
+        return self.records / self.seconds if self.seconds else 0.0
+
+    def __repr__(self):
+        """Представление объекта для отладки."""
+        return (
+            f"LoadStats({self.records} записей, {self.products} продуктов, "
+            f"{self.categories} категорий, {self.records_per_second:.0f} записей/с)"
+        )
+
+
+class CatalogBuilder:
+    """
+    Построитель категорий из потока записей с объединением дубликатов.
+
+    Дубликаты внутри категории объединяются по правилам Product.new_product.
+
+    Атрибуты:
+        columnar (bool): Хранить товары категорий в ColumnarProductStore
+        stats (LoadStats): Статистика загрузки
+    """
+
+    def __init__(self, columnar: bool = False):
+        self.columnar = columnar
+        self.stats = LoadStats()
+        self.__categories = {}
+        self.__registries = {}
+
+    def add_record(self, record: dict):
+        """Добавляет запись категории (с ключом "products") или запись товара."""
+        if "products" in record:
+            category = self.__get_category(record["name"], record.get("description", ""))
+            for product_data in record["products"]:
+                self.__add_product(category, product_data)
+        else:
+            category = self.__get_category(record["category"], record.get("category_description", ""))
+            self.__add_product(category, record)
+
+    def add_records(self, records):
+        """Добавляет записи из итерируемого источника."""
+        started = time.perf_counter()
+        for record in records:
+            self.add_record(record)
+        self.stats.seconds += time.perf_counter() - started
+
+    def get_categories(self):
+        """Метод для получения списка построенных категорий."""
+        return list(self.__categories.values())
+
+    def __get_category(self, name: str, description: str):
+        category = self.__categories.get(name)
+        if category is None:
+            products = ColumnarProductStore() if self.columnar else []
+            category = Category(name, description, products)
+            self.__categories[name] = category
+            self.__registries[name] = ProductRegistry()
+            self.stats.categories += 1
+        return category
+
+    def __add_product(self, category, product_data: dict):
+        self.stats.records += 1
+        registry = self.__registries[category.name]
+        existing_product = registry.get(product_data["name"])
+        if existing_product is not None:
+            existing_product._merge(product_data)
+            return
+        category.add_product(Product._from_dict(product_data))
+        # В индекс кладется элемент хранилища категории, чтобы объединение
+        # дубликатов работало и для колоночного хранилища
+        registry.add(category.get_products_list()[-1])
+        self.stats.products += 1
+
+
+def detect_format(path) -> str:
+    """Определяет формат файла каталога по расширению."""
+    file_format = os.path.splitext(os.fspath(path))[1].lstrip(".").lower()
+    if file_format not in FORMATS:
+        raise ValueError(f"Неизвестный формат каталога: {path}")
+    return file_format
+
+
+def iter_records(stream, file_format: str, chunk_size: int = 1 << 16):
+    """Выдает записи каталога из файлового объекта в указанном формате."""
+    if file_format == "json":
+        return iter_json_records(stream, chunk_size)
+    if file_format == "jsonl":
+        return iter_jsonl_records(stream)
+    if file_format == "csv":
+        return iter_csv_records(stream)
+    raise ValueError(f"Неизвестный формат каталога: {file_format}")
+
+
+def load_catalog(path, file_format: str = None, columnar: bool = False, chunk_size: int = 1 << 16):
+    """
+    Потоково загружает каталог из файла JSON, JSONL или CSV.
+
+    Args:
+        path (str | PathLike): Путь к файлу
+        file_format (str): Формат файла ("json", "jsonl", "csv"), по умолчанию по расширению
+        columnar (bool): Хранить товары в ColumnarProductStore
+        chunk_size (int): Размер блока чтения для JSON
+
+    Returns:
+        tuple: (список категорий, LoadStats)
+    """
+    if file_format is None:
+        file_format = detect_format(path)
+    builder = CatalogBuilder(columnar=columnar)
+    with open(path, encoding="utf-8", newline="") as stream:
+        builder.add_records(iter_records(stream, file_format, chunk_size))
+    return builder.get_categories(), builder.stats
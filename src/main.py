@@ -193,6 +193,12 @@ def demonstrate_magic_methods():
     print("\n--- Строковое представление категории ---")
     print(f"Категория: {category}")
 
+    # Пакетная оценка стоимости категории
+    print("\n--- Оценка стоимости категории ---")
+    print(f"Общая стоимость категории: {category.total_value()} руб.")
+    stats = category.stats()
+    print(f"Цены: от {stats['min_price']} до {stats['max_price']}, средняя {stats['mean_price']} руб.")
+
     # Демонстрация итератора
     print("\n--- Итерация по продуктам категории ---")
     print("Продукты в категории:")
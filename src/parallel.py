@@ -0,0 +1,144 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from src.product import Category, Product
+from src.valuation import column_stats
+
+TASKS = ("value", "render", "dedupe")
+
+
+def pack_category(category) -> tuple:
+    """
+    Упаковывает категорию в компактную форму для передачи в другой процесс.
+
+    Вместо сериализации объектов Product передаются колонки цен и количеств
+    в виде байтов и списки строк. Цены передаются как float64 вместе с флагами
+    целых цен, поэтому после распаковки цена 100 выводится как "100 руб.", а не "100.0 руб.".
+
+    Returns:
+        tuple: (name, description, байты цен, байты количеств, названия, описания, байты флагов целых цен)
+    """
+    return _pack_products(category.name, category.description, category)
+
+
+def _unpack_prices(packed: tuple):
+    """Цены упакованной категории в исходном типе (int или float)."""
+    prices = array("d")
+    prices.frombytes(packed[2])
+    if not any(packed[6]):
+        return prices
+    return [int(price) if is_int else price for price, is_int in zip(prices, packed[6])]
+
+
+def unpack_products(packed: tuple):
+    """Восстанавливает список товаров из упакованной категории."""
+    quantities = array("q")
+    quantities.frombytes(packed[3])
+    return [Product(*fields) for fields in zip(packed[4], packed[5], _unpack_prices(packed), quantities)]
+
+
+def unpack_category(packed: tuple):
+    """Восстанавливает категорию из упакованной формы (счетчики Category увеличиваются)."""
+    return Category(packed[0], packed[1], unpack_products(packed))
+
+
+def process_packed(packed: tuple, tasks=TASKS) -> dict:
+    """
+    Выполняет задачи над упакованной категорией (функция рабочего процесса).
+
+    Задачи:
+        value - агрегаты стоимости в формате column_stats;
+        render - строковое представление товаров как у Category.products;
+        dedupe - объединение дубликатов по правилам Product.new_product,
+            результат возвращается в упакованной форме.
+
+    Returns:
+        dict: Результаты задач по их именам
+    """
+    result = {}
+    if "value" in tasks:
+        prices = array("d")
+        prices.frombytes(packed[2])
+        quantities = array("q")
+        quantities.frombytes(packed[3])
+        result["value"] = column_stats(prices, quantities)
+    if "render" in tasks or "dedupe" in tasks:
+        products = unpack_products(packed)
+        if "render" in tasks:
+            result["render"] = "".join(f"{product}\n" for product in products)
+        if "dedupe" in tasks:
+            registry = Product.new_products(
+                {
+                    "name": product.name,
+                    "description": product.description,
+                    "price": product.price,
+                    "quantity": product.quantity,
+                }
+                for product in products
+            )
+            result["dedupe"] = _pack_products(packed[0], packed[1], registry.get_products_list())
+    return result
+
+
+def _pack_products(name: str, description: str, products) -> tuple:
+    """Упаковывает товары в форму pack_category за один проход."""
+    prices = array("d")
+    int_prices = bytearray()
+    quantities = array("q")
+    names = []
+    descriptions = []
+    for product in products:
+        price = product.price
+        prices.append(price)
+        int_prices.append(isinstance(price, int))
+        quantities.append(product.quantity)
+        names.append(product.name)
+        descriptions.append(product.description)
+    return name, description, prices.tobytes(), quantities.tobytes(), names, descriptions, bytes(int_prices)
+
+
+def process_categories(categories, tasks=("value",), max_workers: int = None, executor=None):
+    """
+    Параллельно выполняет задачи над категориями в пуле процессов.
+
+    Категории передаются в рабочие процессы в упакованной форме (pack_category).
+    Результаты возвращаются в порядке входных категорий. Категория, полученная
+    задачей dedupe, считается заменой исходной: Category.category_count не меняется,
+    а Category.product_count уменьшается на число объединенных дубликатов,
+    поэтому счетчики не зависят от порядка завершения процессов.
+
+    Args:
+        categories (Iterable[Category]): Категории
+        tasks (Iterable[str]): Задачи из TASKS
+        max_workers (int): Количество процессов (по умолчанию по числу ядер)
+        executor (Executor): Готовый пул исполнителей вместо создания нового
+
+    Returns:
+        list: Для каждой категории словарь с ключом "name" и результатами задач;
+            для dedupe - новая категория Category вместо исходной
+    """
+    tasks = tuple(tasks)
+    unknown = set(tasks) - set(TASKS)
+    if unknown:
+        raise ValueError(f"Неизвестные задачи: {', '.join(sorted(unknown))}")
+
+    packed_categories = [pack_category(category) for category in categories]
+    if not packed_categories:
+        return []
+
+    if executor is None:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            outputs = list(pool.map(process_packed, packed_categories, [tasks] * len(packed_categories)))
+    else:
+        outputs = list(executor.map(process_packed, packed_categories, [tasks] * len(packed_categories)))
+
+    results = []
+    for packed, output in zip(packed_categories, outputs):
+        if "dedupe" in output:
+            output["dedupe"] = unpack_category(output["dedupe"])
+            with Category._counter_lock:
+                Category.category_count -= 1
+                Category.product_count -= len(packed[4])
+        output["name"] = packed[0]
+        results.append(output)
+    return results
@@ -0,0 +1,138 @@
+from contextlib import contextmanager
+
+from src.product import Product, ProductRegistry
+
+REASON_NOT_FOUND = "not_found"
+REASON_INVALID_PRICE = "invalid_price"
+REASON_REJECTED_BY_POLICY = "rejected_by_policy"
+
+
+def approve_all(product, old_price: float, new_price: float) -> bool:
+    """Политика, подтверждающая любое понижение цены."""
+    return True
+
+
+def reject_all(product, old_price: float, new_price: float) -> bool:
+    """Политика, отклоняющая любое понижение цены."""
+    return False
+
+
+class ThresholdPolicy:
+    """
+    Политика, подтверждающая понижение цены не более чем на заданный процент.
+
+    Атрибуты:
+        max_decrease_percent (float): Максимально допустимое понижение в процентах
+    """
+
+    def __init__(self, max_decrease_percent: float):
+        if not 0 <= max_decrease_percent <= 100:
+            raise ValueError("Процент понижения должен быть в диапазоне от 0 до 100")
+        self.max_decrease_percent = max_decrease_percent
+
+    def __call__(self, product, old_price: float, new_price: float) -> bool:
+        return (old_price - new_price) * 100 <= old_price * self.max_decrease_percent
+
+    def __repr__(self):
+        """Представление объекта для отладки."""
+        return f"ThresholdPolicy({self.max_decrease_percent})"
+
+
+@contextmanager
+def use_price_policy(policy):
+    """
+    Контекстный менеджер, временно заменяющий политику подтверждения понижения цены.
+
+    Политикой может быть любая функция обратного вызова
+    callable(product, old_price, new_price) -> bool.
+    """
+    previous_policy = Product.price_policy
+    Product.price_policy = policy
+    try:
+        yield policy
+    finally:
+        Product.price_policy = previous_policy
+
+
+class PriceUpdateReport:
+    """
+    Результат пакетного обновления цен.
+
+    Атрибуты:
+        accepted (list): Примененные изменения (name, old_price, new_price)
+        rejected (list): Отклоненные изменения (name, new_price, reason)
+        batches (int): Количество обработанных пакетов
+    """
+
+    def __init__(self):
+        self.accepted = []
+        self.rejected = []
+        self.batches = 0
+
+    def __repr__(self):
+        """Представление объекта для отладки."""
+        return f"PriceUpdateReport(принято: {len(self.accepted)}, отклонено: {len(self.rejected)})"
+
+
+def bulk_update_prices(updates, products, policy=reject_all, batch_size: int = 1000) -> PriceUpdateReport:
+    """
+    Пакетное обновление цен без интерактивного ввода и вывода.
+
+    Изменения проверяются и применяются пакетами по batch_size строк:
+    сначала весь пакет проверяется (товар найден, цена положительна,
+    понижение подтверждено политикой), затем принятые цены записываются.
+    Повторные строки одного товара в пакете сравниваются с последней
+    принятой в пакете ценой, а не с ценой до начала пакета.
+
+    Args:
+        updates (Mapping[str, float] | Iterable[tuple[str, float]]): Новые цены по названиям товаров
+        products (ProductRegistry | Iterable[Product]): Товары для обновления
+        policy (Callable): Политика подтверждения понижения цены,
+            по умолчанию понижения отклоняются
+        batch_size (int): Размер пакета
+
+    Returns:
+        PriceUpdateReport: Принятые и отклоненные изменения
+    """
+    if batch_size < 1:
+        raise ValueError("Размер пакета должен быть положительным")
+    if not isinstance(products, ProductRegistry):
+        products = ProductRegistry(products)
+    if hasattr(updates, "items"):
+        updates = updates.items()
+
+    report = PriceUpdateReport()
+    batch = []
+    for update in updates:
+        batch.append(update)
+        if len(batch) == batch_size:
+            _apply_batch(batch, products, policy, report)
+            batch = []
+    if batch:
+        _apply_batch(batch, products, policy, report)
+    return report
+
+
+def _apply_batch(batch, products, policy, report):
+    accepted = []
+    # Последняя принятая в пакете цена товара: следующие строки сравниваются с ней
+    pending_prices = {}
+    for name, new_price in batch:
+        product = products.get(name)
+        if product is None:
+            report.rejected.append((name, new_price, REASON_NOT_FOUND))
+            continue
+        if not isinstance(new_price, (int, float)) or new_price <= 0:
+            report.rejected.append((name, new_price, REASON_INVALID_PRICE))
+            continue
+        old_price = pending_prices.get(product, product.price)
+        if new_price < old_price and not policy(product, old_price, new_price):
+            report.rejected.append((name, new_price, REASON_REJECTED_BY_POLICY))
+            continue
+        pending_prices[product] = new_price
+        accepted.append((product, old_price, new_price))
+
+    for product, old_price, new_price in accepted:
+        product._set_price(new_price)
+        report.accepted.append((product.name, old_price, new_price))
+    report.batches += 1
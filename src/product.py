@@ -1,3 +1,31 @@
+import threading
+from array import array
+from itertools import islice
+from weakref import ref
+
+from src.concurrency import NO_LOCK, PRODUCT_LOCKS
+
+
+def confirm_price_decrease(product, old_price: float, new_price: float) -> bool:
+    """
+    Политика подтверждения понижения цены по умолчанию: запрос через input().
+
+    Returns:
+        bool: True, если пользователь ввел 'y' или ввод недоступен
+    """
+    try:
+        confirmation = input(
+            f"Цена понижается с {old_price} до {new_price}. Подтвердите изменение (y/n): "
+        )
+        if confirmation.lower() != "y":
+            print("Изменение цены отменено.")
+            return False
+    except EOFError:
+        # Для тестов, где input недоступен
+        pass
+    return True
+
+
 class Product:
     """
     Класс для представления товара.
@@ -7,13 +35,24 @@ class Product:
         description (str): Описание товара
         __price (float): Приватная цена товара
         quantity (int): Количество товара в наличии
+        _observers (list): Слабые ссылки на наблюдателей (например, категории), получающих
+            уведомления об изменении цены и количества через метод _product_changed;
+            товар не продлевает жизнь наблюдателям
+        price_policy (Callable): Политика подтверждения понижения цены,
+            общая для всех товаров: callable(product, old_price, new_price) -> bool.
+            Готовые политики находятся в src.pricing
     """
 
+    __slots__ = ("name", "description", "__price", "_quantity", "_observers")
+
+    price_policy = confirm_price_decrease
+
     def __init__(self, name: str, description: str, price: float, quantity: int):
         self.name = name
         self.description = description
         self.__price = price
-        self.quantity = quantity
+        self._quantity = quantity
+        self._observers = None
 
     def __str__(self):
         """Строковое представление продукта."""
@@ -38,19 +77,67 @@ class Product:
         return (self.price * self.quantity) + (other.price * other.quantity)
 
     @classmethod
-    def new_product(cls, product_data: dict, products_list: list = None):
+    def new_product(cls, product_data: dict, products_list: list = None, registry: "ProductRegistry" = None):
         """
         Класс-метод для создания нового продукта из словаря.
         С проверкой дубликатов.
+
+        Args:
+            product_data (dict): Данные товара (name, description, price, quantity)
+                или LazyProduct из src.lazy
+            products_list (list): Список товаров для линейного поиска дубликатов
+            registry (ProductRegistry): Индекс товаров по имени; если передан,
+                поиск дубликата выполняется за O(1), а новый товар регистрируется в индексе
+
+        Returns:
+            Product: Существующий товар (при дубликате) или новый товар
         """
+        if registry is not None:
+            existing_product = registry.get(product_data["name"])
+            if existing_product is None:
+                product = cls._from_dict(product_data)
+                existing_product = registry.add(product)
+                # Другой поток мог зарегистрировать товар с тем же именем раньше нас
+                if existing_product is product:
+                    return product
+            existing_product._merge(product_data)
+            return existing_product
+
         if products_list:
+            name = product_data["name"].lower()
             for existing_product in products_list:
-                if existing_product.name.lower() == product_data["name"].lower():
-                    existing_product.quantity += product_data["quantity"]
-                    if product_data["price"] > existing_product.price:
-                        existing_product.price = product_data["price"]
+                if existing_product.name.lower() == name:
+                    existing_product._merge(product_data)
                     return existing_product
 
+        return cls._from_dict(product_data)
+
+    @classmethod
+    def new_products(cls, products_data, registry: "ProductRegistry" = None):
+        """
+        Массовое создание товаров из итерируемого набора словарей за один проход.
+
+        Дубликаты объединяются по тем же правилам, что и в new_product:
+        количества складываются, выбирается максимальная цена.
+
+        Args:
+            products_data (Iterable[dict]): Данные товаров
+            registry (ProductRegistry): Индекс для пополнения; по умолчанию создается новый
+
+        Returns:
+            ProductRegistry: Индекс с уникальными товарами в порядке первого появления
+        """
+        if registry is None:
+            registry = ProductRegistry()
+        for product_data in products_data:
+            cls.new_product(product_data, registry=registry)
+        return registry
+
+    @classmethod
+    def _from_dict(cls, product_data: dict):
+        """Создает товар из словаря без проверки дубликатов; готовый товар (LazyProduct) возвращается как есть."""
+        if isinstance(product_data, Product):
+            return product_data
         return cls(
             name=product_data["name"],
             description=product_data["description"],
@@ -58,6 +145,40 @@ class Product:
             quantity=product_data["quantity"],
         )
 
+    def _merge(self, product_data: dict):
+        """Атомарно объединяет дубликат с товаром: суммирует количество и берет максимальную цену."""
+        with PRODUCT_LOCKS.lock_for(self):
+            self.quantity += product_data["quantity"]
+            if product_data["price"] > self.price:
+                self.price = product_data["price"]
+
+    def add_quantity(self, delta: int):
+        """
+        Атомарно изменяет количество товара на delta.
+
+        В отличие от product.quantity += delta, безопасно при одновременном
+        вызове из нескольких потоков.
+
+        Returns:
+            int: Новое количество
+        """
+        with PRODUCT_LOCKS.lock_for(self):
+            self.quantity += delta
+            return self._quantity
+
+    @property
+    def quantity(self):
+        """Геттер для количества."""
+        return self._quantity
+
+    @quantity.setter
+    def quantity(self, new_quantity: int):
+        """Сеттер для количества с уведомлением наблюдателей."""
+        old_quantity = self._quantity
+        self._quantity = new_quantity
+        if self._observers:
+            self._notify("quantity", old_quantity, new_quantity)
+
     @property
     def price(self):
         """Геттер для цены."""
@@ -74,25 +195,111 @@ class Product:
             return
 
         # Подтверждение понижения цены
-        if new_price < self.__price:
-            try:
-                confirmation = input(
-                    f"Цена понижается с {self.__price} до {new_price}. Подтвердите изменение (y/n): "
-                )
-                if confirmation.lower() != "y":
-                    print("Изменение цены отменено.")
-                    return
-            except EOFError:
-                # Для тестов, где input недоступен
-                pass
+        if new_price < self.__price and not Product.price_policy(self, self.__price, new_price):
+            return
 
+        self._set_price(new_price)
+
+    def _set_price(self, new_price: float):
+        """Записывает уже проверенную цену и уведомляет наблюдателей."""
+        old_price = self.__price
         self.__price = new_price
+        if self._observers:
+            self._notify("price", old_price, new_price)
+
+    def _add_observer(self, observer):
+        """Подписывает наблюдателя на изменения товара по слабой ссылке."""
+        if self._observers is None:
+            self._observers = [ref(observer)]
+        else:
+            # Заодно убираем ссылки на удаленных наблюдателей, чтобы список не рос
+            self._observers[:] = [reference for reference in self._observers if reference() is not None]
+            self._observers.append(ref(observer))
+
+    def _remove_observer(self, observer):
+        """Отписывает наблюдателя (одно вхождение) от изменений товара."""
+        if self._observers:
+            for position, reference in enumerate(self._observers):
+                if reference() is observer:
+                    del self._observers[position]
+                    return
+
+    def _notify(self, attribute: str, old_value, new_value):
+        """Уведомляет наблюдателей об изменении атрибута, пропуская удаленных."""
+        for reference in tuple(self._observers):
+            observer = reference()
+            if observer is not None:
+                observer._product_changed(self, attribute, old_value, new_value)
 
     def __repr__(self):
         """Представление объекта для отладки."""
         return f"Product('{self.name}', '{self.description}', {self.price}, {self.quantity})"
 
 
+class ProductRegistry:
+    """
+    Индекс товаров по имени без учета регистра.
+
+    Позволяет находить дубликаты за O(1) вместо линейного просмотра списка.
+    Хранит товары в порядке добавления.
+
+    Атрибуты:
+        __index (dict): Словарь «нормализованное имя -> товар»
+    """
+
+    def __init__(self, products: list = None):
+        self.__index = {}
+        if products:
+            for product in products:
+                self.add(product)
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        """Нормализует имя товара так же, как new_product при поиске дубликатов."""
+        return name.lower()
+
+    def get(self, name: str):
+        """Возвращает товар с указанным именем или None."""
+        return self.__index.get(name.lower())
+
+    def add(self, product):
+        """
+        Регистрирует товар в индексе.
+
+        Если товар с таким именем уже зарегистрирован, индекс не изменяется
+        (как и при линейном поиске, побеждает первый найденный товар).
+
+        Returns:
+            Product: Товар, хранящийся в индексе под этим именем
+        """
+        if not isinstance(product, Product):
+            raise TypeError("Можно добавлять только объекты класса Product")
+        return self.__index.setdefault(product.name.lower(), product)
+
+    def discard(self, product):
+        """Удаляет товар из индекса, если он зарегистрирован под своим именем."""
+        key = product.name.lower()
+        if self.__index.get(key) is product:
+            del self.__index[key]
+
+    def get_products_list(self):
+        """Метод для получения списка уникальных товаров."""
+        return list(self.__index.values())
+
+    def __contains__(self, name):
+        return isinstance(name, str) and name.lower() in self.__index
+
+    def __len__(self):
+        return len(self.__index)
+
+    def __iter__(self):
+        return iter(self.__index.values())
+
+    def __repr__(self):
+        """Представление объекта для отладки."""
+        return f"ProductRegistry({len(self.__index)} продуктов)"
+
+
 class Category:
     """
     Класс для представления категории товаров.
@@ -100,44 +307,449 @@ class Category:
     Атрибуты:
         name (str): Название категории
         description (str): Описание категории
-        __products (list): Приватный список товаров категории
+        __products (list): Приватный список товаров категории. Вместо списка
+            можно передать любое хранилище с интерфейсом списка, например
+            ColumnarProductStore из src.storage
+
+    Категория подписывается на изменения своих товаров и поддерживает
+    агрегаты (количество, стоимость, минимальная и максимальная цена)
+    инкрементально, поэтому их чтение выполняется за O(1).
+    Строковое представление товаров (геттер products) кэшируется и сбрасывается
+    при добавлении товаров и изменении цены или количества.
+    Внешние слушатели (индексы, журналы), подключенные через add_listener,
+    получают уведомления product_added(category, product),
+    product_removed(category, product) и
+    product_changed(category, product, attribute, old_value, new_value).
+
+    При synchronized=True добавление товаров, обновление агрегатов и их чтение
+    выполняются под блокировкой категории, что позволяет изменять категорию
+    и ее товары из нескольких потоков.
+    Изменения, сделанные в обход add_product (например, прямое добавление
+    в список из get_products_list()) или переименование товаров,
+    не учитываются до вызова recalculate().
     """
 
     category_count = 0
     product_count = 0
+    _counter_lock = threading.Lock()
 
-    def __init__(self, name: str, description: str, products: list):
+    def __init__(self, name: str, description: str, products: list, synchronized: bool = False):
         self.name = name
         self.description = description
         self.__products = products
+        # Колоночное хранилище уведомляет категорию само, обычные товары - по отдельности
+        self.__watch_products = not hasattr(products, "_add_observer")
+        if not self.__watch_products:
+            products._add_observer(self)
+        self.__lock = threading.RLock() if synchronized else NO_LOCK
+        self.__rendered = None
+        self.__listeners = []
+        self.__reset_aggregates()
+        for product in products:
+            self.__account(product, 1)
+            if self.__watch_products:
+                product._add_observer(self)
+
+        with Category._counter_lock:
+            Category.category_count += 1
+            Category.product_count += len(products)
 
-        Category.category_count += 1
-        Category.product_count += len(products)
+    @property
+    def synchronized(self):
+        """Признак потокобезопасного режима категории."""
+        return self.__lock is not NO_LOCK
 
     def __str__(self):
         """Строковое представление категории."""
-        total_quantity = sum(product.quantity for product in self.__products)
-        return f"{self.name}, количество продуктов: {total_quantity} шт."
+        return f"{self.name}, количество продуктов: {self.__total_quantity} шт."
 
     def __iter__(self):
-        """Возвращает итератор для категории."""
-        return CategoryIterator(self.__products)
+        """
+        Возвращает итератор для категории.
+
+        Используется встроенный итератор хранилища товаров: он видит товары,
+        добавленные во время итерации. Для согласованного среза используйте iter_snapshot().
+        """
+        return iter(self.__products)
+
+    def iter_snapshot(self):
+        """Итератор по копии списка товаров на момент вызова; последующие add_product его не затрагивают."""
+        with self.__lock:
+            return iter(tuple(self.__products))
+
+    def iter_chunks(self, size: int, snapshot: bool = False):
+        """
+        Выдает товары категории пакетами (списками) размером не более size.
+
+        Args:
+            size (int): Размер пакета
+            snapshot (bool): Работать с копией списка товаров на момент вызова
+
+        Yields:
+            list: Пакет товаров
+        """
+        if size < 1:
+            raise ValueError("Размер пакета должен быть положительным")
+        products = self.iter_snapshot() if snapshot else iter(self.__products)
+        # Срез итератора выполняется на уровне C без обращения к товарам по одному
+        while True:
+            chunk = list(islice(products, size))
+            if not chunk:
+                return
+            yield chunk
 
     def add_product(self, product):
         """Метод для добавления товара в категорию."""
         if isinstance(product, Product):
-            self.__products.append(product)
-            Category.product_count += 1
+            with self.__lock:
+                self.__products.append(product)
+                # Колоночное хранилище копирует данные, слушатели получают его элемент
+                if not self.__watch_products:
+                    product = self.__products[-1]
+                self.__rendered = None
+                self.__account(product, 1)
+                if self.__watch_products:
+                    product._add_observer(self)
+            with Category._counter_lock:
+                Category.product_count += 1
+            for listener in tuple(self.__listeners):
+                listener.product_added(self, product)
         else:
             raise TypeError("Можно добавлять только объекты класса Product")
 
+    def extend(self, products):
+        """
+        Пакетное добавление товаров в категорию.
+
+        Все элементы проверяются до изменения категории, поэтому при ошибке
+        категория остается прежней. Счетчик Category.product_count
+        обновляется один раз на пакет.
+
+        Raises:
+            TypeError: Если хотя бы один элемент не является объектом Product
+        """
+        products = list(products)
+        if not all(isinstance(product, Product) for product in products):
+            raise TypeError("Можно добавлять только объекты класса Product")
+        if not products:
+            return
+        with self.__lock:
+            start = len(self.__products)
+            self.__products.extend(products)
+            # Колоночное хранилище копирует данные, слушатели получают его элементы
+            if not self.__watch_products:
+                products = self.__products[start:]
+            self.__rendered = None
+            for product in products:
+                self.__account(product, 1)
+                if self.__watch_products:
+                    product._add_observer(self)
+        with Category._counter_lock:
+            Category.product_count += len(products)
+        for listener in tuple(self.__listeners):
+            for product in products:
+                listener.product_added(self, product)
+
+    def merge(self, other, dedupe: bool = True):
+        """
+        Добавляет в категорию товары другой категории (или любого набора товаров).
+
+        При dedupe=True дубликаты ищутся по индексу имен без учета регистра
+        и объединяются по правилам new_product: количества складываются,
+        выбирается максимальная цена. Товар, уже имеющийся в категории, обновляется,
+        дубликаты внутри other объединяются с первым из них, а объекты,
+        уже входящие в категорию, пропускаются.
+
+        Объединение выполняется вне блокировки категории: _merge захватывает
+        блокировку товара, а уведомление категории - блокировку категории,
+        и обратный порядок захвата привел бы к взаимной блокировке с add_quantity.
+
+        Returns:
+            int: Количество объединенных дубликатов
+        """
+        products = list(other.iter_snapshot() if isinstance(other, Category) else other)
+        if not all(isinstance(product, Product) for product in products):
+            raise TypeError("Можно добавлять только объекты класса Product")
+        if not dedupe:
+            self.extend(products)
+            return 0
+        present = list(self.iter_snapshot())
+        unique_products, merged = Category._dedupe(products, ProductRegistry(present), present)
+        self.extend(unique_products)
+        return merged
+
+    @classmethod
+    def from_iterable(cls, name: str, description: str, products, dedupe: bool = False, synchronized: bool = False):
+        """
+        Создает категорию из итерируемого набора товаров или словарей товаров.
+
+        Словари преобразуются в товары, при dedupe=True дубликаты объединяются
+        по правилам new_product. Агрегаты и счетчики обновляются один раз.
+
+        Raises:
+            TypeError: Если элемент не является объектом Product или словарем
+        """
+        items = []
+        for item in products:
+            if isinstance(item, dict):
+                item = Product._from_dict(item)
+            elif not isinstance(item, Product):
+                raise TypeError("Можно добавлять только объекты класса Product")
+            items.append(item)
+        if dedupe:
+            items = Category._dedupe(items, ProductRegistry())[0]
+        return cls(name, description, items, synchronized=synchronized)
+
+    @staticmethod
+    def _dedupe(products, registry, present=()):
+        """
+        Объединяет проверенные товары с уже зарегистрированными в registry.
+
+        Товары из present и уже обработанные товары пропускаются (сравнение
+        по объекту, для представлений колоночного хранилища - по строке):
+        товар, уже входящий в набор, не объединяется сам с собой.
+
+        Returns:
+            tuple: (список новых уникальных товаров, количество объединенных дубликатов)
+        """
+        unique_products = []
+        merged = 0
+        seen = set(present)
+        for product in products:
+            if product in seen:
+                continue
+            seen.add(product)
+            existing_product = registry.add(product)
+            if existing_product is product:
+                unique_products.append(product)
+            else:
+                existing_product._merge({"price": product.price, "quantity": product.quantity})
+                merged += 1
+        return unique_products, merged
+
+    def remove_product(self, product):
+        """
+        Метод для удаления товара из категории.
+
+        Агрегаты и счетчик Category.product_count уменьшаются,
+        слушатели уведомляются до фактического удаления товара.
+
+        Raises:
+            ValueError: Если товара нет в категории
+        """
+        with self.__lock:
+            try:
+                position = self.__products.index(product)
+            except ValueError:
+                raise ValueError("Товар не найден в категории") from None
+            self.__account(product, -1)
+            for listener in tuple(self.__listeners):
+                listener.product_removed(self, product)
+            del self.__products[position]
+            self.__rendered = None
+            if self.__watch_products:
+                product._remove_observer(self)
+        with Category._counter_lock:
+            Category.product_count -= 1
+
+    def replace_product(self, old_product, new_product):
+        """
+        Заменяет товар в категории другим товаром с сохранением позиции.
+
+        Агрегаты пересчитываются по разнице между товарами, счетчик
+        Category.product_count не меняется; слушатели получают product_removed
+        для старого товара и product_added для нового.
+
+        Raises:
+            TypeError: Если new_product не является объектом Product
+            ValueError: Если старого товара нет в категории
+        """
+        if not isinstance(new_product, Product):
+            raise TypeError("Можно добавлять только объекты класса Product")
+        with self.__lock:
+            try:
+                position = self.__products.index(old_product)
+            except ValueError:
+                raise ValueError("Товар не найден в категории") from None
+            self.__account(old_product, -1)
+            for listener in tuple(self.__listeners):
+                listener.product_removed(self, old_product)
+            self.__products[position] = new_product
+            if self.__watch_products:
+                old_product._remove_observer(self)
+                new_product._add_observer(self)
+            else:
+                new_product = self.__products[position]
+            self.__rendered = None
+            self.__account(new_product, 1)
+        for listener in tuple(self.__listeners):
+            listener.product_added(self, new_product)
+
+    def add_listener(self, listener):
+        """
+        Подключает слушателя изменений категории.
+
+        Слушатель должен реализовать методы product_added(category, product),
+        product_removed(category, product) и
+        product_changed(category, product, attribute, old_value, new_value).
+        """
+        self.__listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """Отключает слушателя изменений категории."""
+        if listener in self.__listeners:
+            self.__listeners.remove(listener)
+
+    def __reset_aggregates(self):
+        self.__total_quantity = 0
+        self.__total_value = 0
+        self.__sum_price = 0
+        self.__price_counts = {}
+        self.__min_price = None
+        self.__max_price = None
+
+    def __account(self, product, sign: int):
+        """Учитывает товар в агрегатах (sign=1) или исключает его (sign=-1)."""
+        price = product.price
+        quantity = product.quantity
+        self.__total_quantity += sign * quantity
+        self.__total_value += sign * price * quantity
+        self.__sum_price += sign * price
+        if sign > 0:
+            self.__add_price(price)
+        else:
+            self.__remove_price(price)
+
+    def __add_price(self, price: float):
+        counts = self.__price_counts
+        counts[price] = counts.get(price, 0) + 1
+        # Если экстремум не сброшен, обновляем его сразу, иначе он будет вычислен при чтении
+        if self.__min_price is not None and price < self.__min_price:
+            self.__min_price = price
+        if self.__max_price is not None and price > self.__max_price:
+            self.__max_price = price
+
+    def __remove_price(self, price: float):
+        counts = self.__price_counts
+        counts[price] -= 1
+        if not counts[price]:
+            del counts[price]
+            if price == self.__min_price:
+                self.__min_price = None
+            if price == self.__max_price:
+                self.__max_price = None
+
+    def _product_changed(self, product, attribute: str, old_value, new_value):
+        """Обновляет агрегаты и сбрасывает кэш вывода при изменении цены или количества товара."""
+        with self.__lock:
+            self.__rendered = None
+            if attribute == "quantity":
+                delta = new_value - old_value
+                self.__total_quantity += delta
+                self.__total_value += product.price * delta
+            elif attribute == "price":
+                self.__total_value += (new_value - old_value) * product.quantity
+                self.__sum_price += new_value - old_value
+                self.__remove_price(old_value)
+                self.__add_price(new_value)
+        for listener in tuple(self.__listeners):
+            listener.product_changed(self, product, attribute, old_value, new_value)
+
+    def recalculate(self):
+        """Полностью пересчитывает агрегаты по текущему списку товаров и сбрасывает кэш вывода."""
+        with self.__lock:
+            self.__rendered = None
+            self.__reset_aggregates()
+            for product in self.__products:
+                self.__account(product, 1)
+
+    @property
+    def total_quantity(self):
+        """Общее количество единиц товара в категории."""
+        return self.__total_quantity
+
+    @property
+    def min_price(self):
+        """Минимальная цена товара в категории или None для пустой категории."""
+        with self.__lock:
+            if self.__min_price is None and self.__price_counts:
+                self.__min_price = min(self.__price_counts)
+            return self.__min_price
+
+    @property
+    def max_price(self):
+        """Максимальная цена товара в категории или None для пустой категории."""
+        with self.__lock:
+            if self.__max_price is None and self.__price_counts:
+                self.__max_price = max(self.__price_counts)
+            return self.__max_price
+
+    def columns(self):
+        """
+        Возвращает колонки цен и количеств товаров категории.
+
+        Для колоночного хранилища возвращаются его собственные массивы без копирования.
+
+        Returns:
+            tuple: (array цен, array количеств)
+        """
+        products = self.__products
+        if hasattr(products, "columns"):
+            return products.columns()
+        return (
+            array("d", [product.price for product in products]),
+            array("q", [product.quantity for product in products]),
+        )
+
+    def total_value(self):
+        """Общая стоимость товаров категории (сумма цена × количество)."""
+        return self.__total_value
+
+    def stats(self):
+        """
+        Агрегаты по товарам категории за O(1).
+
+        Returns:
+            dict: count, total_quantity, total_value, sum_price, min_price, max_price, mean_price
+        """
+        with self.__lock:
+            count = len(self.__products)
+            return {
+                "count": count,
+                "total_quantity": self.__total_quantity,
+                "total_value": self.__total_value,
+                "sum_price": self.__sum_price,
+                "min_price": self.min_price,
+                "max_price": self.max_price,
+                "mean_price": self.__sum_price / count if count else None,
+            }
+
     @property
     def products(self):
-        """Геттер для списка товаров в виде строки."""
-        products_str = ""
+        """Геттер для списка товаров в виде строки (строится за один проход и кэшируется)."""
+        with self.__lock:
+            if self.__rendered is None:
+                self.__rendered = "".join(self.iter_product_lines())
+            return self.__rendered
+
+    def iter_product_lines(self):
+        """Генератор строк товаров в формате геттера products."""
         for product in self.__products:
-            products_str += f"{product}\n"
-        return products_str
+            yield f"{product}\n"
+
+    def write_products(self, stream):
+        """
+        Записывает строки товаров в файловый объект без сборки общей строки.
+
+        Если вывод уже закэширован, записывается готовая строка.
+
+        Args:
+            stream: Объект с методом write (файл, io.StringIO, sys.stdout)
+        """
+        if self.__rendered is not None:
+            stream.write(self.__rendered)
+        else:
+            stream.writelines(self.iter_product_lines())
 
     def get_products_list(self):
         """Метод для получения списка продуктов."""
@@ -151,8 +763,13 @@ class Category:
 class CategoryIterator:
     """
     Класс-итератор для перебора товаров в категории.
+
+    Category.__iter__ использует встроенный итератор списка, который заметно быстрее;
+    класс сохранен для явного пошагового обхода списка товаров.
     """
 
+    __slots__ = ("products", "index")
+
     def __init__(self, products: list):
         self.products = products
         self.index = 0
@@ -161,9 +778,9 @@ class CategoryIterator:
         return self
 
     def __next__(self):
-        if self.index < len(self.products):
+        try:
             product = self.products[self.index]
-            self.index += 1
-            return product
-        else:
+        except IndexError:
             raise StopIteration
+        self.index += 1
+        return product
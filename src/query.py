@@ -0,0 +1,219 @@
+from bisect import bisect_left, bisect_right, insort
+from itertools import compress
+
+from src.product import ProductRegistry
+
+
+class CatalogIndex:
+    """
+    Вторичные индексы для быстрых запросов к товарам нескольких категорий.
+
+    Поддерживаемые индексы:
+        - отсортированный индекс цен (запросы диапазона через bisect);
+        - отсортированный индекс стоимости (цена × количество) для выборки лидеров;
+        - отсортированный индекс названий для поиска по префиксу и
+          индекс триграмм для поиска по подстроке;
+        - битовая карта товаров в наличии (количество > 0).
+
+    Индекс подписывается на категории и поддерживается при add_product
+    и изменении цены и количества товаров. Переименование товаров не отслеживается.
+    Товар, входящий в несколько категорий, индексируется один раз и
+    удаляется из индекса, когда его удалили из всех категорий.
+    """
+
+    def __init__(self, categories=()):
+        self.__products = []
+        self.__ids = {}
+        self.__memberships = []
+        self.__prices = []
+        self.__values = []
+        self.__names = []
+        self.__price_index = []
+        self.__value_index = []
+        self.__name_index = []
+        self.__trigrams = {}
+        self.__in_stock = bytearray()
+        self.__categories = []
+        for category in categories:
+            self.add_category(category)
+
+    def add_category(self, category):
+        """Индексирует товары категории и подписывается на ее изменения."""
+        category.add_listener(self)
+        self.__categories.append(category)
+        # Пакетная индексация: записи добавляются в конец, а индексы сортируются один раз
+        for product in category:
+            self.__add(product, bulk=True)
+        self.__price_index.sort()
+        self.__value_index.sort()
+        self.__name_index.sort()
+
+    def detach(self):
+        """Отписывается от всех категорий; индекс перестает обновляться."""
+        for category in self.__categories:
+            category.remove_listener(self)
+        self.__categories = []
+
+    def product_added(self, category, product):
+        """Уведомление категории о добавлении товара."""
+        self.__add(product)
+
+    def product_removed(self, category, product):
+        """Уведомление категории об удалении товара."""
+        product_id = self.__ids.get(product)
+        if product_id is None:
+            return
+        self.__memberships[product_id] -= 1
+        if not self.__memberships[product_id]:
+            self.__discard(product_id, product)
+
+    def product_changed(self, category, product, attribute: str, old_value, new_value):
+        """Уведомление категории об изменении цены или количества товара."""
+        product_id = self.__ids.get(product)
+        if product_id is not None:
+            self.__update(product_id, product)
+
+    def __add(self, product, bulk: bool = False):
+        product_id = self.__ids.get(product)
+        if product_id is not None:
+            self.__memberships[product_id] += 1
+            return
+        product_id = len(self.__products)
+        price = product.price
+        value = price * product.quantity
+        name = ProductRegistry.normalize(product.name)
+
+        self.__ids[product] = product_id
+        self.__products.append(product)
+        self.__memberships.append(1)
+        self.__prices.append(price)
+        self.__values.append(value)
+        self.__names.append(name)
+        self.__in_stock.append(product.quantity > 0)
+        if bulk:
+            self.__price_index.append((price, product_id))
+            self.__value_index.append((value, product_id))
+            self.__name_index.append((name, product_id))
+        else:
+            insort(self.__price_index, (price, product_id))
+            insort(self.__value_index, (value, product_id))
+            insort(self.__name_index, (name, product_id))
+        for trigram in _trigrams(name):
+            self.__trigrams.setdefault(trigram, set()).add(product_id)
+
+    def __discard(self, product_id: int, product):
+        del self.__ids[product]
+        name = self.__names[product_id]
+        _delete(self.__price_index, self.__prices[product_id], product_id)
+        _delete(self.__value_index, self.__values[product_id], product_id)
+        _delete(self.__name_index, name, product_id)
+        for trigram in _trigrams(name):
+            self.__trigrams[trigram].discard(product_id)
+        # Позиция остается занятой, чтобы не сдвигать идентификаторы остальных товаров
+        self.__products[product_id] = None
+        self.__names[product_id] = None
+        self.__in_stock[product_id] = False
+
+    def __update(self, product_id: int, product):
+        # Товар из нескольких категорий присылает одно и то же изменение несколько раз,
+        # поэтому индекс сверяется с текущим состоянием товара, а не применяет дельты
+        price = product.price
+        value = price * product.quantity
+        if price != self.__prices[product_id]:
+            _move(self.__price_index, self.__prices[product_id], price, product_id)
+            self.__prices[product_id] = price
+        if value != self.__values[product_id]:
+            _move(self.__value_index, self.__values[product_id], value, product_id)
+            self.__values[product_id] = value
+        self.__in_stock[product_id] = product.quantity > 0
+
+    def find_by_price_range(self, min_price: float = None, max_price: float = None, in_stock_only: bool = False):
+        """
+        Товары с ценой в диапазоне [min_price, max_price], упорядоченные по цене.
+
+        Args:
+            min_price (float): Нижняя граница (None - без ограничения)
+            max_price (float): Верхняя граница (None - без ограничения)
+            in_stock_only (bool): Только товары в наличии
+
+        Returns:
+            list: Список товаров
+        """
+        index = self.__price_index
+        start = 0 if min_price is None else bisect_left(index, (min_price, -1))
+        stop = len(index) if max_price is None else bisect_right(index, (max_price, float("inf")))
+        in_stock = self.__in_stock
+        products = self.__products
+        return [
+            products[product_id]
+            for _, product_id in index[start:stop]
+            if not in_stock_only or in_stock[product_id]
+        ]
+
+    def search_name(self, query: str, prefix: bool = False):
+        """
+        Поиск товаров по названию без учета регистра.
+
+        Args:
+            query (str): Искомая строка
+            prefix (bool): Искать только названия, начинающиеся с query
+
+        Returns:
+            list: Товары в порядке индексации (для prefix=True - в порядке названий)
+        """
+        query = ProductRegistry.normalize(query)
+        if prefix:
+            index = self.__name_index
+            result = []
+            for position in range(bisect_left(index, (query,)), len(index)):
+                name, product_id = index[position]
+                if not name.startswith(query):
+                    break
+                result.append(self.__products[product_id])
+            return result
+
+        names = self.__names
+        trigrams = _trigrams(query)
+        if trigrams:
+            candidate_sets = sorted((self.__trigrams.get(trigram, set()) for trigram in trigrams), key=len)
+            candidates = sorted(set.intersection(*candidate_sets))
+        else:
+            candidates = range(len(names))
+        return [
+            self.__products[product_id]
+            for product_id in candidates
+            if names[product_id] is not None and query in names[product_id]
+        ]
+
+    def top_n_by_value(self, n: int):
+        """Товары с наибольшей стоимостью (цена × количество), по убыванию."""
+        if n <= 0:
+            return []
+        return [self.__products[product_id] for _, product_id in reversed(self.__value_index[-n:])]
+
+    def in_stock(self):
+        """Товары в наличии в порядке индексации."""
+        return list(compress(self.__products, self.__in_stock))
+
+    def __len__(self):
+        return len(self.__ids)
+
+    def __repr__(self):
+        """Представление объекта для отладки."""
+        return f"CatalogIndex({len(self.__ids)} продуктов, {len(self.__categories)} категорий)"
+
+
+def _trigrams(name: str):
+    """Множество триграмм строки."""
+    return {name[index:index + 3] for index in range(len(name) - 2)}
+
+
+def _delete(index: list, key, product_id: int):
+    """Удаляет запись товара из отсортированного индекса."""
+    del index[bisect_left(index, (key, product_id))]
+
+
+def _move(index: list, old_key, new_key, product_id: int):
+    """Переставляет запись товара в отсортированном индексе."""
+    _delete(index, old_key, product_id)
+    insort(index, (new_key, product_id))
@@ -0,0 +1,166 @@
+from src.concurrency import PRODUCT_LOCKS
+
+RESERVED = "reserved"
+COMMITTED = "committed"
+RELEASED = "released"
+
+
+class Reservation:
+    """
+    Резерв количества товара по одному заказу.
+
+    Атрибуты:
+        product (Product): Товар
+        quantity (int): Зарезервированное количество
+        state (str): Состояние: RESERVED, COMMITTED или RELEASED
+    """
+
+    __slots__ = ("product", "quantity", "state")
+
+    def __init__(self, product, quantity: int):
+        self.product = product
+        self.quantity = quantity
+        self.state = RESERVED
+
+    def __repr__(self):
+        """Представление объекта для отладки."""
+        return f"Reservation('{self.product.name}', {self.quantity}, {self.state})"
+
+
+class ReservationEngine:
+    """
+    Резервирование остатков товаров с пакетной проверкой и списанием.
+
+    reserve() принимает пакет заказов (товар, количество) и резервирует каждый заказ,
+    если свободного остатка (quantity за вычетом резервов) достаточно.
+    commit() списывает зарезервированное количество с Product.quantity,
+    release() возвращает его в свободный остаток. Каждый пакет обрабатывается
+    под блокировками всех своих товаров из общих LockStripes (тех же, что
+    у Product.add_quantity и объединения дубликатов), захваченными один раз,
+    поэтому остаток не уходит в минус и обновления не теряются.
+    Категории, в которых находятся товары, получают изменения количества
+    как обычно - через уведомления товаров.
+
+    Атрибуты:
+        accepted (int): Количество принятых заказов
+        rejected (int): Количество отклоненных заказов
+    """
+
+    def __init__(self, locks=PRODUCT_LOCKS):
+        self.locks = locks
+        self.accepted = 0
+        self.rejected = 0
+        self.__reserved = {}
+
+    def available(self, product) -> int:
+        """Свободный остаток товара."""
+        return product.quantity - self.__reserved.get(product, 0)
+
+    def reserved(self, product) -> int:
+        """Зарезервированное количество товара."""
+        return self.__reserved.get(product, 0)
+
+    def reserve(self, orders):
+        """
+        Резервирует пакет заказов.
+
+        Args:
+            orders (Iterable[tuple]): Заказы (товар, количество)
+
+        Returns:
+            list: Для каждого заказа Reservation или None, если остатка недостаточно
+
+        Raises:
+            ValueError: Если количество в заказе не положительное
+        """
+        orders = list(orders)
+        for _, quantity in orders:
+            if quantity <= 0:
+                raise ValueError("Количество в заказе должно быть положительным")
+
+        results = []
+        reserved = self.__reserved
+        with self.locks.locks_for(product for product, _ in orders):
+            for product, quantity in orders:
+                current = reserved.get(product, 0)
+                if product.quantity - current >= quantity:
+                    reserved[product] = current + quantity
+                    results.append(Reservation(product, quantity))
+                else:
+                    results.append(None)
+        accepted = len(results) - results.count(None)
+        self.accepted += accepted
+        self.rejected += len(results) - accepted
+        return results
+
+    def commit(self, reservations):
+        """
+        Списывает зарезервированное количество с остатков товаров.
+
+        Количество каждого товара изменяется один раз на пакет.
+
+        Raises:
+            ValueError: Если резерв уже завершен, передан в пакете повторно
+                или остаток товара был уменьшен в обход резервирования ниже зарезервированного
+        """
+        reservations, totals = self.__group(reservations)
+        with self.locks.locks_for(totals):
+            _check_reserved(reservations)
+            for product, quantity in totals.items():
+                if product.quantity < quantity:
+                    raise ValueError(f"Остаток товара меньше резерва: {product.name}")
+            for product, quantity in totals.items():
+                product.quantity -= quantity
+                self.__unreserve(product, quantity)
+            for reservation in reservations:
+                reservation.state = COMMITTED
+
+    def release(self, reservations):
+        """
+        Отменяет резервы и возвращает количество в свободный остаток.
+
+        Raises:
+            ValueError: Если резерв уже завершен или передан в пакете повторно
+        """
+        reservations, totals = self.__group(reservations)
+        with self.locks.locks_for(totals):
+            _check_reserved(reservations)
+            for product, quantity in totals.items():
+                self.__unreserve(product, quantity)
+            for reservation in reservations:
+                reservation.state = RELEASED
+
+    def __group(self, reservations):
+        """
+        Проверяет резервы и суммирует количества по товарам.
+
+        Состояние резервов проверяется здесь заранее и повторно под блокировками
+        товаров (_check_reserved): параллельный commit или release того же резерва
+        может завершить его между проверками.
+        """
+        reservations = [reservation for reservation in reservations if reservation is not None]
+        if len({id(reservation) for reservation in reservations}) != len(reservations):
+            raise ValueError("Резерв передан в пакете повторно")
+        _check_reserved(reservations)
+        totals = {}
+        for reservation in reservations:
+            totals[reservation.product] = totals.get(reservation.product, 0) + reservation.quantity
+        return reservations, totals
+
+    def __unreserve(self, product, quantity: int):
+        remaining = self.__reserved[product] - quantity
+        if remaining:
+            self.__reserved[product] = remaining
+        else:
+            del self.__reserved[product]
+
+    def __repr__(self):
+        """Представление объекта для отладки."""
+        return f"ReservationEngine({len(self.__reserved)} товаров в резерве)"
+
+
+def _check_reserved(reservations):
+    """Проверяет, что все резервы еще не завершены."""
+    for reservation in reservations:
+        if reservation.state != RESERVED:
+            raise ValueError("Резерв уже завершен")
@@ -0,0 +1,169 @@
+import asyncio
+
+from src.pricing import bulk_update_prices, reject_all
+from src.product import Product, ProductRegistry
+
+
+class CatalogService:
+    """
+    Асинхронный фасад каталога для использования в asyncio-приложениях.
+
+    Запросы на запись не выполняются сразу, а накапливаются и применяются
+    одним пакетом на следующей итерации цикла событий (или через flush_delay секунд).
+    Повторные запросы изменения цены одного товара в пределах пакета
+    объединяются: применяется последняя цена, а все ожидающие получают общий результат.
+    Понижение цены подтверждается политикой price_policy без интерактивного ввода,
+    поэтому цикл событий никогда не блокируется на input().
+
+    Атрибуты:
+        price_policy (Callable): Политика подтверждения понижения цены
+        flush_delay (float): Задержка применения пакета в секундах
+        batches (int): Количество примененных пакетов
+        coalesced (int): Количество объединенных запросов изменения цены
+    """
+
+    def __init__(self, categories=(), price_policy=reject_all, flush_delay: float = 0.0):
+        self.price_policy = price_policy
+        self.flush_delay = flush_delay
+        self.batches = 0
+        self.coalesced = 0
+        self.__categories = {}
+        self.__registries = {}
+        self.__products = ProductRegistry()
+        self.__pending_adds = []
+        self.__pending_prices = {}
+        self.__flush_handle = None
+        for category in categories:
+            self.add_category(category)
+
+    def add_category(self, category):
+        """Регистрирует категорию в каталоге."""
+        self.__categories[category.name] = category
+        self.__registries[category.name] = ProductRegistry(category)
+        for product in category:
+            self.__products.add(product)
+
+    def get_category(self, name: str):
+        """Возвращает категорию по названию."""
+        try:
+            return self.__categories[name]
+        except KeyError:
+            raise KeyError(f"Категория не найдена: {name}") from None
+
+    async def add_product(self, category_name: str, product_data: dict):
+        """
+        Добавляет товар в категорию с объединением дубликатов по правилам new_product.
+
+        Returns:
+            Product: Новый или существующий товар
+        """
+        future = asyncio.get_running_loop().create_future()
+        self.__pending_adds.append((category_name, product_data, future))
+        self.__schedule_flush()
+        return await future
+
+    async def reprice(self, product_name: str, price: float) -> bool:
+        """
+        Изменяет цену товара.
+
+        Returns:
+            bool: True, если цена применена
+        """
+        future = asyncio.get_running_loop().create_future()
+        key = ProductRegistry.normalize(product_name)
+        pending = self.__pending_prices.get(key)
+        if pending is None:
+            self.__pending_prices[key] = [product_name, price, [future]]
+        else:
+            pending[1] = price
+            pending[2].append(future)
+            self.coalesced += 1
+        self.__schedule_flush()
+        return await future
+
+    async def iter_category(self, category_name: str, chunk_size: int = 1000):
+        """
+        Асинхронный обход товаров категории.
+
+        Обход идет по снимку списка товаров; после каждого пакета из chunk_size
+        товаров управление возвращается циклу событий.
+        """
+        for chunk in self.get_category(category_name).iter_chunks(chunk_size, snapshot=True):
+            for product in chunk:
+                yield product
+            await asyncio.sleep(0)
+
+    async def flush(self):
+        """Немедленно применяет накопленные запросы."""
+        if self.__flush_handle is not None:
+            self.__flush_handle.cancel()
+            self.__flush()
+        await asyncio.sleep(0)
+
+    def __schedule_flush(self):
+        if self.__flush_handle is None:
+            loop = asyncio.get_running_loop()
+            if self.flush_delay:
+                self.__flush_handle = loop.call_later(self.flush_delay, self.__flush)
+            else:
+                self.__flush_handle = loop.call_soon(self.__flush)
+
+    def __flush(self):
+        self.__flush_handle = None
+        adds, self.__pending_adds = self.__pending_adds, []
+        prices, self.__pending_prices = self.__pending_prices, {}
+
+        for category_name, product_data, future in adds:
+            try:
+                result = self.__apply_add(category_name, product_data)
+            except Exception as error:
+                _resolve(future, exception=error)
+            else:
+                _resolve(future, result)
+
+        if prices:
+            try:
+                report = bulk_update_prices(
+                    [(name, price) for name, price, _ in prices.values()],
+                    self.__products,
+                    policy=self.price_policy,
+                    batch_size=len(prices),
+                )
+            except Exception as error:
+                # Ошибка пакета (например, исключение политики цены) передается всем ожидающим
+                for _, _, futures in prices.values():
+                    for future in futures:
+                        _resolve(future, exception=error)
+            else:
+                accepted = {ProductRegistry.normalize(name) for name, _, _ in report.accepted}
+                for key, (_, _, futures) in prices.items():
+                    for future in futures:
+                        _resolve(future, key in accepted)
+        self.batches += 1
+
+    def __apply_add(self, category_name: str, product_data: dict):
+        category = self.get_category(category_name)
+        registry = self.__registries[category_name]
+        existing_product = registry.get(product_data["name"])
+        if existing_product is not None:
+            existing_product._merge(product_data)
+            return existing_product
+        category.add_product(Product._from_dict(product_data))
+        product = category.get_products_list()[-1]
+        registry.add(product)
+        self.__products.add(product)
+        return product
+
+    def __repr__(self):
+        """Представление объекта для отладки."""
+        return f"CatalogService({len(self.__categories)} категорий, {len(self.__products)} продуктов)"
+
+
+def _resolve(future, result=None, exception=None):
+    """Завершает future, если ожидающий его запрос еще не отменен."""
+    if future.done():
+        return
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
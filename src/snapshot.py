@@ -0,0 +1,259 @@
+import mmap
+import struct
+import sys
+from array import array
+
+from src.product import Category, Product
+from src.storage import ColumnarProductStore
+
+MAGIC = b"OOPSNAP2"
+# Снимки первой версии не содержат номера записи журнала
+LEGACY_MAGIC = b"OOPSNAP1"
+
+# magic, количество категорий, товаров, строк, длина таблицы строк в байтах
+# и номер последней записи журнала, вошедшей в снимок
+_HEADER = struct.Struct("<8sQQQQQ")
+_LEGACY_HEADER = struct.Struct("<8sQQQQ")
+# id названия, id описания, индекс первого товара, количество товаров
+_CATEGORY = struct.Struct("<IIQQ")
+
+
+def _padding(size: int) -> int:
+    """Количество байт выравнивания до границы 8 байт."""
+    return -size % 8
+
+
+def _check_byteorder():
+    # Колонки читаются без копирования через memoryview.cast, который использует порядок байт платформы
+    if sys.byteorder != "little":
+        raise OSError("Формат снимка поддерживается только на платформах с порядком байт little-endian")
+
+
+def write_snapshot(categories, path, sequence: int = 0):
+    """
+    Записывает набор категорий в бинарный снимок.
+
+    Формат: заголовок, колонки фиксированной ширины (цены float64, количества int64,
+    id названий и описаний uint32), таблица категорий и таблица строк UTF-8.
+    Каждая секция выровнена по 8 байт, поэтому колонки можно читать без копирования.
+
+    Args:
+        categories (Iterable[Category]): Категории
+        path (str | PathLike): Путь к файлу снимка
+        sequence (int): Номер последней записи журнала изменений, вошедшей в снимок
+
+    Returns:
+        int: Количество записанных товаров
+    """
+    _check_byteorder()
+    prices = array("d")
+    quantities = array("q")
+    name_ids = array("I")
+    description_ids = array("I")
+    category_rows = []
+    strings = {}
+
+    def intern(value: str) -> int:
+        return strings.setdefault(value, len(strings))
+
+    for category in categories:
+        start = len(prices)
+        category_prices, category_quantities = category.columns()
+        prices.extend(category_prices)
+        quantities.extend(category_quantities)
+        for product in category:
+            name_ids.append(intern(product.name))
+            description_ids.append(intern(product.description))
+        category_rows.append((intern(category.name), intern(category.description), start, len(prices) - start))
+
+    encoded = [value.encode("utf-8") for value in strings]
+    offsets = array("Q", [0])
+    for value in encoded:
+        offsets.append(offsets[-1] + len(value))
+
+    with open(path, "wb") as stream:
+        stream.write(_HEADER.pack(MAGIC, len(category_rows), len(prices), len(encoded), offsets[-1], sequence))
+        for column in (prices, quantities, name_ids, description_ids):
+            data = column.tobytes()
+            stream.write(data)
+            stream.write(b"\0" * _padding(len(data)))
+        for row in category_rows:
+            stream.write(_CATEGORY.pack(*row))
+        stream.write(offsets.tobytes())
+        stream.write(b"".join(encoded))
+    return len(prices)
+
+
+class Snapshot:
+    """
+    Снимок каталога, открытый через mmap.
+
+    Колонки цен и количеств доступны как memoryview поверх отображенного файла:
+    данные не копируются и не читаются с диска, пока к ним нет обращений,
+    а несколько процессов, открывших один файл, разделяют одни и те же страницы памяти.
+
+    Атрибуты:
+        prices (memoryview): Колонка цен всех товаров
+        quantities (memoryview): Колонка количеств всех товаров
+        sequence (int): Номер последней записи журнала, вошедшей в снимок
+            (0 для снимков без журнала)
+    """
+
+    def __init__(self, path):
+        _check_byteorder()
+        with open(path, "rb") as stream:
+            self.__mmap = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.__map_sections()
+        except Exception:
+            self.close()
+            raise
+
+    def __map_sections(self):
+        buffer = memoryview(self.__mmap)
+        self.__buffer = buffer
+        magic = bytes(buffer[:len(MAGIC)])
+        if magic == MAGIC:
+            header = _HEADER
+        elif magic == LEGACY_MAGIC:
+            header = _LEGACY_HEADER
+        else:
+            raise ValueError("Файл не является снимком каталога")
+        if len(buffer) < header.size:
+            raise ValueError("Файл снимка поврежден")
+        _, category_count, product_count, string_count, strings_size, *sequence = header.unpack_from(buffer)
+        self.sequence = sequence[0] if sequence else 0
+
+        offset = header.size
+        self.__views = []
+
+        def section(size, format_char):
+            nonlocal offset
+            if offset + size > len(buffer):
+                raise ValueError("Файл снимка поврежден")
+            view = buffer[offset:offset + size].cast(format_char)
+            self.__views.append(view)
+            offset += size + _padding(size)
+            return view
+
+        self.prices = section(product_count * 8, "d")
+        self.quantities = section(product_count * 8, "q")
+        self.__name_ids = section(product_count * 4, "I")
+        self.__description_ids = section(product_count * 4, "I")
+        self.__categories = [
+            _CATEGORY.unpack_from(buffer, offset + index * _CATEGORY.size) for index in range(category_count)
+        ]
+        offset += category_count * _CATEGORY.size
+        self.__string_offsets = section((string_count + 1) * 8, "Q")
+        self.__strings = buffer[offset:offset + strings_size]
+        self.__views.append(self.__strings)
+
+    def string(self, string_id: int) -> str:
+        """Возвращает строку из таблицы строк по ее id."""
+        return str(self.__strings[self.__string_offsets[string_id]:self.__string_offsets[string_id + 1]], "utf-8")
+
+    def __len__(self):
+        return len(self.__categories)
+
+    def __getitem__(self, index: int):
+        return SnapshotCategory(self, index, *self.__categories[index])
+
+    def __iter__(self):
+        for index in range(len(self.__categories)):
+            yield self[index]
+
+    def product(self, index: int):
+        """Создает объект Product для товара с указанным глобальным индексом."""
+        return Product(
+            self.string(self.__name_ids[index]),
+            self.string(self.__description_ids[index]),
+            self.prices[index],
+            self.quantities[index],
+        )
+
+    def to_categories(self, columnar: bool = True):
+        """
+        Материализует снимок в объекты Category.
+
+        Args:
+            columnar (bool): Хранить товары в ColumnarProductStore
+
+        Returns:
+            list: Список категорий
+        """
+        categories = []
+        for snapshot_category in self:
+            products = [snapshot_category.product(index) for index in range(len(snapshot_category))]
+            if columnar:
+                products = ColumnarProductStore(products)
+            categories.append(Category(snapshot_category.name, snapshot_category.description, products))
+        return categories
+
+    def close(self):
+        """
+        Освобождает представления памяти и закрывает отображение файла.
+
+        Если снаружи еще остаются срезы колонок (например, prices категорий),
+        отображение будет закрыто автоматически после их освобождения.
+        """
+        for view in getattr(self, "_Snapshot__views", ()):
+            view.release()
+        if hasattr(self, "_Snapshot__buffer"):
+            self.__buffer.release()
+        try:
+            self.__mmap.close()
+        except BufferError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __repr__(self):
+        """Представление объекта для отладки."""
+        return f"Snapshot({len(self.__categories)} категорий, {len(self.prices)} продуктов)"
+
+
+class SnapshotCategory:
+    """
+    Категория внутри снимка с ленивым доступом к данным.
+
+    Атрибуты:
+        name (str): Название категории
+        description (str): Описание категории
+        prices (memoryview): Срез колонки цен товаров категории
+        quantities (memoryview): Срез колонки количеств товаров категории
+    """
+
+    def __init__(self, snapshot: Snapshot, index: int, name_id: int, description_id: int, start: int, count: int):
+        self.__snapshot = snapshot
+        self.__start = start
+        self.index = index
+        self.name = snapshot.string(name_id)
+        self.description = snapshot.string(description_id)
+        self.prices = snapshot.prices[start:start + count]
+        self.quantities = snapshot.quantities[start:start + count]
+
+    def __len__(self):
+        return len(self.prices)
+
+    def columns(self):
+        """Возвращает колонки цен и количеств без копирования."""
+        return self.prices, self.quantities
+
+    def product(self, index: int):
+        """Создает объект Product для товара категории."""
+        if not 0 <= index < len(self):
+            raise IndexError("Индекс товара вне диапазона")
+        return self.__snapshot.product(self.__start + index)
+
+    def __repr__(self):
+        """Представление объекта для отладки."""
+        return f"SnapshotCategory('{self.name}', {len(self)} продуктов)"
+
+
+def open_snapshot(path) -> Snapshot:
+    """Открывает снимок каталога через mmap."""
+    return Snapshot(path)
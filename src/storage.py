@@ -0,0 +1,252 @@
+from array import array
+from bisect import bisect_left
+
+from src.product import Product
+
+
+class ColumnarProductStore:
+    """
+    Компактное колоночное хранилище товаров для Category.
+
+    Цены и количества хранятся в массивах array, названия и описания —
+    в общей таблице строк без повторов (в колонках лежат только индексы строк).
+    Хранилище поддерживает интерфейс списка (append, len, индексация, итерация),
+    поэтому его можно передать в Category вместо списка товаров.
+    При обращении к элементу создается легковесное представление ProductView,
+    которое читает и изменяет данные прямо в колонках.
+
+    Каждая строка получает постоянный номер, по которому представление находит
+    свою позицию, поэтому удаление строк не сдвигает уже выданные представления
+    (равенство и хеш представлений тоже определяются номером строки).
+    Цены хранятся как float64; если цена товара была целым числом, это отмечается
+    в отдельной колонке флагов (создается при первой такой цене), и представление
+    возвращает int, поэтому вывод совпадает с категорией на списке ("100 руб.").
+
+    Пока строки не удалялись, номер совпадает с позицией и таблица номеров не хранится;
+    после удаления номера хранятся в возрастающей колонке, и позиция находится
+    двоичным поиском, поэтому удаление не требует перенумерации остальных строк.
+
+    Атрибуты:
+        prices (array): Колонка цен
+        quantities (array): Колонка количеств
+    """
+
+    def __init__(self, products=()):
+        self.prices = array("d")
+        self.quantities = array("q")
+        self._int_prices = None
+        self._name_ids = array("I")
+        self._description_ids = array("I")
+        self._strings = []
+        self._string_ids = {}
+        self._observers = None
+        # Колонка номеров строк появляется только после первого удаления
+        self._next_row = 0
+        self._row_ids = None
+        self.extend(products)
+
+    # Наблюдатели хранятся на уровне хранилища, поскольку представления товаров
+    # создаются заново при каждом обращении
+    _add_observer = Product._add_observer
+    _remove_observer = Product._remove_observer
+
+    def _intern(self, value: str) -> int:
+        """Возвращает индекс строки в таблице строк, добавляя ее при необходимости."""
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = len(self._strings)
+            self._strings.append(value)
+            self._string_ids[value] = string_id
+        return string_id
+
+    def append(self, product):
+        """Копирует данные товара в колонки хранилища."""
+        if not isinstance(product, Product):
+            raise TypeError("Можно добавлять только объекты класса Product")
+        self._name_ids.append(self._intern(product.name))
+        self._description_ids.append(self._intern(product.description))
+        price = product.price
+        self.prices.append(price)
+        if self._int_prices is not None:
+            self._int_prices.append(0)
+        self._mark_price_type(len(self.prices) - 1, price)
+        self.quantities.append(product.quantity)
+        if self._row_ids is not None:
+            self._row_ids.append(self._next_row)
+        self._next_row += 1
+
+    def extend(self, products):
+        """Добавляет несколько товаров."""
+        for product in products:
+            self.append(product)
+
+    def _mark_price_type(self, index: int, price):
+        """Отмечает, была ли цена на позиции index целым числом."""
+        is_int = isinstance(price, int)
+        if self._int_prices is None:
+            if not is_int:
+                return
+            self._int_prices = array("b", bytes(len(self.prices)))
+        self._int_prices[index] = is_int
+
+    def _price(self, index: int):
+        """Цена на позиции index в исходном типе (int или float)."""
+        price = self.prices[index]
+        if self._int_prices is not None and self._int_prices[index]:
+            return int(price)
+        return price
+
+    def _set_price(self, index: int, price):
+        """Записывает цену на позицию index."""
+        self.prices[index] = price
+        self._mark_price_type(index, price)
+
+    def columns(self):
+        """Возвращает колонки цен и количеств без копирования."""
+        return self.prices, self.quantities
+
+    def index(self, product) -> int:
+        """Позиция представления товара в хранилище."""
+        if isinstance(product, ProductView) and product._store is self:
+            position = self._position(product._row)
+            if position is not None:
+                return position
+        raise ValueError("Товар не найден в хранилище")
+
+    def _position(self, row: int):
+        """Текущая позиция строки с номером row или None, если строка удалена."""
+        row_ids = self._row_ids
+        if row_ids is None:
+            return row if row < len(self.prices) else None
+        # Номера строк возрастают: добавление выдает новые номера, удаление сохраняет порядок
+        position = bisect_left(row_ids, row)
+        return position if position < len(row_ids) and row_ids[position] == row else None
+
+    def _row_at(self, index: int) -> int:
+        """Номер строки на позиции index."""
+        return index if self._row_ids is None else self._row_ids[index]
+
+    def __setitem__(self, index: int, product):
+        """Копирует данные товара в колонки на место существующего товара."""
+        if not isinstance(product, Product):
+            raise TypeError("Можно добавлять только объекты класса Product")
+        self._name_ids[index] = self._intern(product.name)
+        self._description_ids[index] = self._intern(product.description)
+        self._set_price(index, product.price)
+        self.quantities[index] = product.quantity
+
+    def __delitem__(self, index: int):
+        """
+        Удаляет товар из колонок.
+
+        Представления остальных товаров остаются действительными, обращение
+        к данным представления удаленного товара вызывает IndexError.
+        """
+        if self._row_ids is None:
+            self._row_ids = array("Q", range(len(self.prices)))
+        del self._row_ids[index]
+        del self.prices[index]
+        if self._int_prices is not None:
+            del self._int_prices[index]
+        del self.quantities[index]
+        del self._name_ids[index]
+        del self._description_ids[index]
+
+    def __len__(self):
+        return len(self.prices)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [ProductView(self, self._row_at(i)) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Индекс товара вне диапазона")
+        return ProductView(self, self._row_at(index))
+
+    def __iter__(self):
+        rows = range(len(self)) if self._row_ids is None else tuple(self._row_ids)
+        for row in rows:
+            yield ProductView(self, row)
+
+    def __repr__(self):
+        """Представление объекта для отладки."""
+        return f"ColumnarProductStore({len(self)} продуктов, {len(self._strings)} строк)"
+
+
+class ProductView(Product):
+    """
+    Легковесное представление товара, хранящегося в ColumnarProductStore.
+
+    Поддерживает весь интерфейс Product (включая сеттер цены с проверками),
+    но данные читаются и записываются напрямую в колонки хранилища.
+    Два представления одной и той же строки хранилища равны между собой.
+    """
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: ColumnarProductStore, row: int):
+        self._store = store
+        self._row = row
+
+    @property
+    def _index(self):
+        """Текущая позиция строки в колонках хранилища."""
+        if self._store._row_ids is None:
+            return self._row
+        position = self._store._position(self._row)
+        if position is None:
+            raise IndexError("Товар удален из хранилища")
+        return position
+
+    @property
+    def name(self):
+        """Название товара из таблицы строк."""
+        return self._store._strings[self._store._name_ids[self._index]]
+
+    @name.setter
+    def name(self, value: str):
+        self._store._name_ids[self._index] = self._store._intern(value)
+
+    @property
+    def description(self):
+        """Описание товара из таблицы строк."""
+        return self._store._strings[self._store._description_ids[self._index]]
+
+    @description.setter
+    def description(self, value: str):
+        self._store._description_ids[self._index] = self._store._intern(value)
+
+    @property
+    def _quantity(self):
+        return self._store.quantities[self._index]
+
+    @_quantity.setter
+    def _quantity(self, value: int):
+        self._store.quantities[self._index] = value
+
+    @property
+    def _observers(self):
+        return self._store._observers
+
+    @_observers.setter
+    def _observers(self, value):
+        self._store._observers = value
+
+    # Product хранит данные в атрибутах __price и _quantity,
+    # поэтому достаточно перенаправить их в колонки хранилища.
+    @property
+    def _Product__price(self):
+        return self._store._price(self._index)
+
+    @_Product__price.setter
+    def _Product__price(self, value: float):
+        self._store._set_price(self._index, value)
+
+    def __eq__(self, other):
+        if isinstance(other, ProductView):
+            return self._store is other._store and self._row == other._row
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((id(self._store), self._row))
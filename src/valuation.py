@@ -0,0 +1,77 @@
+from array import array
+from operator import mul
+
+
+def columns_value(prices, quantities) -> float:
+    """Сумма произведений цены на количество по колонкам."""
+    return sum(map(mul, prices, quantities))
+
+
+def column_stats(prices, quantities) -> dict:
+    """
+    Считает агрегаты по колонкам цен и количеств.
+
+    Все вычисления выполняются встроенными функциями (sum, min, max, map)
+    над целыми колонками, без попарного сложения товаров в Python-цикле.
+
+    Args:
+        prices (Sequence[float]): Колонка цен
+        quantities (Sequence[int]): Колонка количеств той же длины
+
+    Returns:
+        dict: count, total_quantity, total_value, sum_price, min_price, max_price, mean_price
+            (для пустых колонок min_price, max_price и mean_price равны None)
+    """
+    count = len(prices)
+    sum_price = sum(prices)
+    return {
+        "count": count,
+        "total_quantity": sum(quantities),
+        "total_value": columns_value(prices, quantities),
+        "sum_price": sum_price,
+        "min_price": min(prices) if count else None,
+        "max_price": max(prices) if count else None,
+        "mean_price": sum_price / count if count else None,
+    }
+
+
+def total_value(categories) -> float:
+    """
+    Общая стоимость товаров (цена × количество) в нескольких категориях.
+
+    Args:
+        categories (Iterable[Category]): Категории
+
+    Returns:
+        float: Суммарная стоимость
+    """
+    return sum(category.total_value() for category in categories)
+
+
+def aggregate(categories, key=None) -> dict:
+    """
+    Групповые агрегаты по категориям.
+
+    Args:
+        categories (Iterable[Category]): Категории
+        key (Callable[[Category], Hashable]): Функция группировки,
+            по умолчанию группировка по названию категории
+
+    Returns:
+        dict: Группа -> агрегаты в формате column_stats
+    """
+    if key is None:
+        key = _category_name
+
+    groups = {}
+    for category in categories:
+        prices, quantities = category.columns()
+        group = groups.setdefault(key(category), (array("d"), array("q")))
+        group[0].extend(prices)
+        group[1].extend(quantities)
+
+    return {group: column_stats(prices, quantities) for group, (prices, quantities) in groups.items()}
+
+
+def _category_name(category):
+    return category.name
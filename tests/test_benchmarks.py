@@ -0,0 +1,61 @@
+import json
+from unittest.mock import patch
+
+from benchmarks import run as benchmark_run
+from src.product import Category, Product
+
+
+class TestBenchmarkSuite:
+    """Тесты для набора тестов производительности"""
+
+    def test_run_benchmarks(self):
+        """Тест выполнения всех сценариев на малом масштабе"""
+        Category("Test", "Desc", [])
+        counters = Category.category_count, Category.product_count
+
+        results = benchmark_run.run_benchmarks(scales=[10], repeat=1)
+
+        assert set(results["results"]) == {f"{name}@10" for name in benchmark_run.BENCHMARKS}
+        assert all(result["ns_per_operation"] > 0 for result in results["results"].values())
+        assert (Category.category_count, Category.product_count) == counters
+
+    def test_category_products_rebuilds_string(self):
+        """Тест, что сценарий category_products строит строку заново без пересчета агрегатов"""
+        run, _ = benchmark_run.bench_category_products(10)
+
+        with patch.object(Category, "recalculate", side_effect=AssertionError("полный пересчет")):
+            with patch.object(Product, "__str__", autospec=True, side_effect=lambda product: product.name) as render:
+                run()
+                run()
+
+        assert render.call_count == 20
+
+    def test_compare_detects_regression(self):
+        """Тест обнаружения регрессии относительно эталона"""
+        baseline = {"results": {"a@10": {"ns_per_operation": 100.0}, "b@10": {"ns_per_operation": 100.0}}}
+        results = {
+            "results": {
+                "a@10": {"ns_per_operation": 130.0},
+                "b@10": {"ns_per_operation": 110.0},
+                "c@10": {"ns_per_operation": 500.0},
+            }
+        }
+
+        regressions = benchmark_run.compare(results, baseline, threshold=0.2)
+
+        assert [key for key, *_ in regressions] == ["a@10"]
+
+    def test_main_writes_json_and_compares(self, tmp_path, capsys):
+        """Тест сохранения результатов и сравнения с эталоном из командной строки"""
+        output = tmp_path / "results.json"
+        args = ["--scales", "10", "--only", "product_init", "--repeat", "1", "--output", str(output)]
+
+        assert benchmark_run.main(args) == 0
+        results = json.loads(output.read_text(encoding="utf-8"))
+        assert "product_init@10" in results["results"]
+
+        results["results"]["product_init@10"]["ns_per_operation"] = 1e-6
+        output.write_text(json.dumps(results), encoding="utf-8")
+
+        assert benchmark_run.main(args[:-2] + ["--baseline", str(output)]) == 1
+        assert "РЕГРЕССИЯ" in capsys.readouterr().out
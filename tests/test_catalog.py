@@ -0,0 +1,103 @@
+import pytest
+
+from src.catalog import Catalog
+from src.product import Category, Product
+from src.storage import ColumnarProductStore
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    """Сброс счетчиков перед каждым тестом"""
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+class TestCatalog:
+    """Тесты для каталога с собственной статистикой"""
+
+    def test_counts_scoped_per_catalog(self):
+        """Тест, что статистика каталогов не смешивается"""
+        first = Catalog("Магазин 1")
+        second = Catalog("Магазин 2")
+        first.create_category("Смартфоны", "Desc", [Product("Phone", "Desc", 100.0, 1)])
+        second.create_category("Телевизоры", "Desc", [])
+
+        assert (first.category_count, first.product_count) == (1, 1)
+        assert (second.category_count, second.product_count) == (1, 0)
+        assert Category.category_count == 2
+
+    def test_unique_products(self):
+        """Тест учета товара, входящего в несколько категорий"""
+        shared = Product("Phone", "Desc", 100.0, 1)
+        catalog = Catalog("Магазин")
+        catalog.create_category("Смартфоны", "Desc", [shared])
+        sale = catalog.create_category("Распродажа", "Desc", [])
+        sale.add_product(shared)
+        sale.add_product(Product("Tablet", "Desc", 200.0, 1))
+
+        assert catalog.product_count == 3
+        assert catalog.unique_product_count == 2
+        assert str(catalog) == "Магазин, категорий: 2, товаров: 3 (уникальных: 2)"
+
+    def test_remove_product(self):
+        """Тест уменьшения счетчиков при удалении товара"""
+        shared = Product("Phone", "Desc", 100.0, 1)
+        catalog = Catalog("Магазин")
+        phones = catalog.create_category("Смартфоны", "Desc", [shared])
+        sale = catalog.create_category("Распродажа", "Desc", [shared])
+
+        sale.remove_product(shared)
+        assert (catalog.product_count, catalog.unique_product_count) == (1, 1)
+
+        phones.remove_product(shared)
+        assert (catalog.product_count, catalog.unique_product_count) == (0, 0)
+        assert Category.product_count == 0
+
+    def test_remove_category(self):
+        """Тест удаления категории из каталога"""
+        catalog = Catalog("Магазин")
+        phones = catalog.create_category("Смартфоны", "Desc", [Product("Phone", "Desc", 100.0, 1)])
+
+        assert catalog.remove_category("Смартфоны") is phones
+        assert catalog.category_count == 0
+        assert catalog.product_count == 0
+        assert "Смартфоны" not in catalog
+
+        phones.add_product(Product("Tablet", "Desc", 200.0, 1))
+        assert catalog.product_count == 0
+
+    def test_errors(self):
+        """Тест ошибок при работе с каталогом"""
+        catalog = Catalog("Магазин")
+        catalog.create_category("Смартфоны", "Desc")
+
+        with pytest.raises(ValueError, match="уже есть"):
+            catalog.create_category("Смартфоны", "Desc")
+        with pytest.raises(TypeError):
+            catalog.add_category("not a category")
+        with pytest.raises(KeyError, match="не найдена"):
+            catalog.get_category("ТВ")
+        with pytest.raises(KeyError):
+            catalog.remove_category("ТВ")
+
+    def test_iteration(self):
+        """Тест перебора категорий каталога"""
+        catalog = Catalog("Магазин")
+        catalog.create_category("A", "Desc")
+        catalog.create_category("B", "Desc")
+
+        assert [category.name for category in catalog] == ["A", "B"]
+        assert len(catalog) == 2
+
+    def test_remove_from_columnar_category(self):
+        """Тест повторного удаления товаров из колоночной категории"""
+        store = ColumnarProductStore([Product(f"P{index}", "Desc", 10.0, index) for index in range(4)])
+        catalog = Catalog("Магазин")
+        category = Category("Склад", "Desc", store)
+        catalog.add_category(category)
+
+        category.remove_product(store[0])
+        category.remove_product(store[0])
+
+        assert (catalog.product_count, catalog.unique_product_count) == (2, 2)
+        assert category.total_quantity == 5
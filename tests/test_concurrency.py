@@ -0,0 +1,151 @@
+import sys
+import threading
+
+import pytest
+
+from benchmarks import threads as threads_benchmark
+from src.concurrency import LockStripes
+from src.product import Category, Product, ProductRegistry
+from src.storage import ColumnarProductStore
+
+
+def run_in_threads(target, count: int = 8):
+    """Запускает target в нескольких потоках одновременно"""
+    barrier = threading.Barrier(count)
+
+    def worker():
+        barrier.wait()
+        target()
+
+    workers = [threading.Thread(target=worker) for _ in range(count)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+
+
+class TestLockStripes:
+    """Тесты для распределенных блокировок"""
+
+    def test_same_object_same_lock(self):
+        """Тест, что один объект всегда получает одну блокировку"""
+        stripes = LockStripes(8)
+        product = Product("Test", "Desc", 100.0, 5)
+
+        assert stripes.lock_for(product) is stripes.lock_for(product)
+
+    def test_invalid_count(self):
+        """Тест проверки количества блокировок"""
+        with pytest.raises(ValueError):
+            LockStripes(0)
+
+    def test_locks_for_acquires_each_stripe_once(self):
+        """Тест захвата блокировок нескольких объектов"""
+        stripes = LockStripes(4)
+        products = [Product(f"Test {index}", "Desc", 100.0, 5) for index in range(20)]
+
+        with stripes.locks_for(products + products):
+            assert all(stripes.lock_for(product).locked() for product in products)
+
+        assert not any(stripes.lock_for(product).locked() for product in products)
+
+    def test_columnar_views_share_lock(self):
+        """Тест, что представления одной строки колоночного хранилища получают одну блокировку"""
+        stripes = LockStripes(64)
+        store = ColumnarProductStore([Product(f"Test {index}", "Desc", 100.0, 5) for index in range(3)])
+
+        assert store[0] is not store[0]
+        assert stripes.lock_for(store[0]) is stripes.lock_for(store[0])
+        del store[0]
+        assert stripes.lock_for(store[1]) is stripes.lock_for(store[1])
+
+
+class TestThreadSafety:
+    """Тесты потокобезопасности товаров и категорий"""
+
+    def setup_method(self):
+        """Сброс счетчиков перед каждым тестом"""
+        Category.category_count = 0
+        Category.product_count = 0
+
+    def test_add_quantity_atomic(self):
+        """Тест атомарного изменения количества"""
+        product = Product("Test", "Desc", 100.0, 0)
+
+        run_in_threads(lambda: [product.add_quantity(1) for _ in range(2000)])
+
+        assert product.quantity == 16000
+
+    def test_concurrent_new_product_with_registry(self):
+        """Тест параллельного объединения дубликатов через общий индекс"""
+        registry = ProductRegistry()
+        record = {"name": "Phone", "description": "Desc", "price": 100.0, "quantity": 1}
+
+        run_in_threads(lambda: [Product.new_product(record, registry=registry) for _ in range(1000)])
+
+        assert len(registry) == 1
+        assert registry.get("phone").quantity == 8000
+
+    def test_synchronized_category(self):
+        """Тест синхронизированной категории при параллельных изменениях"""
+        category = Category("Test", "Desc", [], synchronized=True)
+
+        def worker():
+            for _ in range(200):
+                product = Product("Test", "Desc", 10.0, 1)
+                category.add_product(product)
+                product.add_quantity(1)
+
+        run_in_threads(worker)
+
+        assert category.synchronized
+        assert len(category.get_products_list()) == 1600
+        assert category.total_quantity == 3200
+        assert category.total_value() == 32000.0
+        assert Category.product_count == 1600
+
+    def test_merge_with_concurrent_add_quantity(self):
+        """Тест, что объединение дубликатов и add_quantity не блокируют друг друга"""
+        phone = Product("Phone", "Desc", 100.0, 0)
+        category = Category("Test", "Desc", [phone], synchronized=True)
+
+        def add_quantity():
+            for _ in range(2000):
+                phone.add_quantity(1)
+
+        def merge():
+            for _ in range(200):
+                category.merge([Product("phone", "Desc", 100.0, 1)])
+
+        workers = [threading.Thread(target=target, daemon=True) for target in (add_quantity, merge) * 2]
+        interval = sys.getswitchinterval()
+        # Частое переключение потоков, чтобы обратный порядок захвата блокировок проявился
+        sys.setswitchinterval(1e-6)
+        try:
+            for thread in workers:
+                thread.start()
+            for thread in workers:
+                thread.join(timeout=10)
+        finally:
+            sys.setswitchinterval(interval)
+
+        assert not any(thread.is_alive() for thread in workers)
+        assert phone.quantity == 4400
+        assert category.total_quantity == 4400
+
+    def test_concurrent_category_counter(self):
+        """Тест счетчика категорий при параллельном создании"""
+        run_in_threads(lambda: [Category("Test", "Desc", []) for _ in range(500)])
+
+        assert Category.category_count == 4000
+
+    def test_category_not_synchronized_by_default(self):
+        """Тест, что категория по умолчанию не синхронизирована"""
+        assert not Category("Test", "Desc", []).synchronized
+
+    def test_threads_benchmark(self):
+        """Тест нагрузочного сценария на малом объеме"""
+        result = threads_benchmark.run(threads=4, operations=4000, products=10)
+
+        assert result["operations"] == 4000
+        assert result["operations_per_second"] > 0
@@ -0,0 +1,128 @@
+import json
+
+import pytest
+
+from src.diff import ADDED, CATEGORY_ADDED, CATEGORY_REMOVED, PRICE, QUANTITY, REMOVED, Change, apply_changeset, diff, iter_diff
+from src.product import Category, Product
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    """Сброс счетчиков перед каждым тестом"""
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+def yesterday():
+    """Вчерашний каталог"""
+    return [
+        Category(
+            "Смартфоны",
+            "Desc",
+            [
+                Product("iPhone 15", "Desc", 210000.0, 8),
+                Product("Galaxy S23", "Desc", 180000.0, 5),
+                Product("Redmi", "Desc", 31000.0, 14),
+            ],
+        ),
+        Category("Плееры", "Desc", [Product("iPod", "Desc", 10000.0, 1)]),
+    ]
+
+
+def today():
+    """Сегодняшний каталог"""
+    return [
+        Category(
+            "Смартфоны",
+            "Desc",
+            [
+                Product("IPHONE 15", "Desc", 200000.0, 8),
+                Product("Galaxy S23", "Desc", 180000.0, 3),
+                Product("Pixel 8", "Desc", 90000.0, 2),
+            ],
+        ),
+        Category("Телевизоры", "Desc TV", [Product("OLED", "Desc", 150000.0, 4)]),
+    ]
+
+
+def kinds(changes):
+    return [(change.kind, change.category, change.name) for change in changes]
+
+
+class TestDiff:
+    """Тесты для сравнения каталогов"""
+
+    def test_diff(self):
+        """Тест вычисления изменений между каталогами"""
+        changes = diff(yesterday(), today())
+
+        assert kinds(changes) == [
+            (PRICE, "Смартфоны", "IPHONE 15"),
+            (QUANTITY, "Смартфоны", "Galaxy S23"),
+            (ADDED, "Смартфоны", "Pixel 8"),
+            (REMOVED, "Смартфоны", "Redmi"),
+            (CATEGORY_ADDED, "Телевизоры", None),
+            (ADDED, "Телевизоры", "OLED"),
+            (REMOVED, "Плееры", "iPod"),
+            (CATEGORY_REMOVED, "Плееры", None),
+        ]
+        assert (changes[0].old_value, changes[0].new_value) == (210000.0, 200000.0)
+        assert (changes[1].old_value, changes[1].new_value) == (5, 3)
+
+    def test_identical_catalogs(self):
+        """Тест отсутствия изменений для одинаковых каталогов"""
+        assert diff(yesterday(), yesterday()) == []
+
+    def test_names_differing_in_case(self):
+        """Тест сопоставления товаров с названиями, различающимися только регистром"""
+        category = Category("Test", "Desc", [Product("X", "Desc", 100.0, 1), Product("x", "Desc", 200.0, 2)])
+        changed = Category("Test", "Desc", [Product("X", "Desc", 100.0, 1), Product("x", "Desc", 250.0, 2)])
+
+        assert diff(category, category) == []
+        assert diff(category, changed) == [Change(PRICE, "Test", "x", 200.0, 250.0)]
+        assert [change.kind for change in diff(category, Category("Test", "Desc", []))] == [REMOVED, REMOVED]
+
+    def test_apply_names_differing_in_case(self):
+        """Тест применения изменений к товарам с названиями, различающимися регистром"""
+        old = Category("Test", "Desc", [Product("Phone", "Desc", 10.0, 1), Product("phone", "Desc", 20.0, 1)])
+        new = Category("Test", "Desc", [Product("Phone", "Desc", 10.0, 1), Product("phone", "Desc", 30.0, 1)])
+        target = Category("Test", "Desc", [Product("Phone", "Desc", 10.0, 1), Product("phone", "Desc", 20.0, 1)])
+
+        (restored,) = apply_changeset(diff(old, new), target)
+
+        assert [product.price for product in restored] == [10.0, 30.0]
+        assert diff(restored, new) == []
+
+        apply_changeset(diff(new, Category("Test", "Desc", [Product("Phone", "Desc", 10.0, 1)])), restored)
+        assert [str(product) for product in restored] == ["Phone, 10.0 руб. Остаток: 1 шт."]
+
+    def test_streaming(self):
+        """Тест выдачи изменений по мере вычисления"""
+        changes = iter_diff(yesterday()[0], today()[0])
+
+        assert next(changes).kind == PRICE
+
+    def test_apply_changeset(self):
+        """Тест применения изменений к каталогу"""
+        target = yesterday()
+        changes = [Change.from_dict(json.loads(json.dumps(change.to_dict()))) for change in iter_diff(target, today())]
+
+        result = apply_changeset(changes, target)
+
+        assert [category.name for category in result] == ["Смартфоны", "Телевизоры"]
+        assert [str(product) for product in result[0]] == [
+            "iPhone 15, 200000.0 руб. Остаток: 8 шт.",
+            "Galaxy S23, 180000.0 руб. Остаток: 3 шт.",
+            "Pixel 8, 90000.0 руб. Остаток: 2 шт.",
+        ]
+        assert result[1].description == "Desc TV"
+        assert diff(result, today()) == []
+
+    def test_apply_missing_product(self):
+        """Тест ошибки при отсутствии товара из изменения"""
+        category = Category("Смартфоны", "Desc", [])
+
+        with pytest.raises(ValueError, match="Товар из изменений не найден"):
+            apply_changeset([{"kind": PRICE, "category": "Смартфоны", "name": "Pixel", "old": 1.0, "new": 2.0}], category)
+        with pytest.raises(ValueError, match="Категория из изменений не найдена"):
+            apply_changeset([Change(ADDED, "ТВ", "OLED", new_value={})], category)
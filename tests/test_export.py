@@ -0,0 +1,107 @@
+import io
+import json
+
+import pytest
+
+from benchmarks import export as export_benchmark
+from src.export import export_catalog, export_columnar, export_csv, export_jsonl, iter_columnar_blocks, load_columnar
+from src.loader import load_catalog
+from src.product import Category, Product
+from src.storage import ColumnarProductStore
+
+
+@pytest.fixture
+def categories():
+    """Категории со строками, требующими экранирования"""
+    Category.category_count = 0
+    Category.product_count = 0
+    return [
+        Category(
+            "Смартфоны",
+            'Телефоны, "умные"',
+            [Product("iPhone 15", "Desc, with comma", 210000.0, 8), Product('Galaxy "S23"', "Строка\nвторая", 180000.5, 0)],
+        ),
+        Category("Телевизоры", "TV", ColumnarProductStore([Product("OLED", "Desc", 150000.0, 4)])),
+    ]
+
+
+def dump(categories):
+    return [(category.name, category.description, [repr(product) for product in category]) for category in categories]
+
+
+class TestExport:
+    """Тесты для потокового экспорта"""
+
+    @pytest.mark.parametrize("extension", ["csv", "jsonl"])
+    def test_text_round_trip(self, categories, tmp_path, extension):
+        """Тест экспорта в CSV и JSONL с повторной загрузкой"""
+        path = tmp_path / f"catalog.{extension}"
+
+        assert export_catalog(categories, path, chunk_size=1) == 3
+
+        loaded, _ = load_catalog(path)
+        assert dump(loaded) == dump(categories)
+
+    def test_columnar_round_trip(self, categories, tmp_path):
+        """Тест экспорта в колоночный формат с повторной загрузкой"""
+        path = tmp_path / "catalog.col"
+
+        assert export_catalog(categories, path, chunk_size=1) == 3
+
+        assert dump(load_columnar(path)) == dump(categories)
+        assert dump(load_columnar(path, columnar=True)) == dump(categories)
+
+    def test_columnar_blocks(self, categories):
+        """Тест разбиения колоночного экспорта на блоки"""
+        stream = io.BytesIO()
+        export_columnar(categories, stream, chunk_size=1)
+        stream.seek(0)
+
+        blocks = list(iter_columnar_blocks(stream))
+
+        assert [(block[0], list(block[2]), block[4]) for block in blocks] == [
+            ("Смартфоны", [210000.0], ["iPhone 15"]),
+            ("Смартфоны", [180000.5], ['Galaxy "S23"']),
+            ("Телевизоры", [150000.0], ["OLED"]),
+        ]
+
+    def test_columnar_errors(self, categories):
+        """Тест ошибок чтения колоночного экспорта"""
+        stream = io.BytesIO()
+        export_columnar(categories, stream)
+
+        with pytest.raises(ValueError, match="не является"):
+            list(iter_columnar_blocks(io.BytesIO(b"garbage!")))
+        with pytest.raises(ValueError, match="Неожиданный конец"):
+            list(iter_columnar_blocks(io.BytesIO(stream.getvalue()[:-8])))
+
+    def test_file_objects(self, categories):
+        """Тест записи в переданные файловые объекты"""
+        csv_stream = io.StringIO()
+        jsonl_stream = io.StringIO()
+
+        export_csv(categories, csv_stream)
+        export_jsonl(categories, jsonl_stream)
+
+        assert csv_stream.getvalue().splitlines()[0] == "category,category_description,name,description,price,quantity"
+        records = [json.loads(line) for line in jsonl_stream.getvalue().splitlines()]
+        assert records[1] == {
+            "category": "Смартфоны",
+            "category_description": 'Телефоны, "умные"',
+            "name": 'Galaxy "S23"',
+            "description": "Строка\nвторая",
+            "price": 180000.5,
+            "quantity": 0,
+        }
+
+    def test_unknown_format(self, categories, tmp_path):
+        """Тест ошибки для неизвестного формата"""
+        with pytest.raises(ValueError, match="Неизвестный формат"):
+            export_catalog(categories, tmp_path / "catalog.xml")
+
+    def test_benchmark(self):
+        """Тест сценария производительности на малом масштабе"""
+        results = export_benchmark.run(products=100)
+
+        assert set(results) == {"csv", "jsonl", "col"}
+        assert all(result["bytes"] > 0 for result in results.values())
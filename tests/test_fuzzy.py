@@ -0,0 +1,114 @@
+import pytest
+
+from src.fuzzy import FuzzyProductIndex, dedupe_category, normalize_name
+from src.product import Category, Product
+from src.storage import ColumnarProductStore
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    """Сброс счетчиков перед каждым тестом"""
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+class TestNormalizeName:
+    """Тесты для нормализации названий"""
+
+    def test_normalize(self):
+        """Тест приведения регистра, пробелов, знаков и диакритики"""
+        assert normalize_name("  Iphone   15 ") == "iphone 15"
+        assert normalize_name("iPhone-15,") == "iphone 15"
+        assert normalize_name("Café Noir") == "cafe noir"
+
+    def test_transliterate(self):
+        """Тест транслитерации кириллицы"""
+        assert normalize_name("Самсунг Галакси") == "samsung galaksi"
+        assert normalize_name("Самсунг", transliterate=False) == "самсунг"
+
+
+class TestFuzzyProductIndex:
+    """Тесты для индекса приближенных дубликатов"""
+
+    def test_finds_near_duplicates(self):
+        """Тест поиска похожих названий"""
+        phone = Product("iPhone 15 Pro Max", "Desc", 100.0, 1)
+        index = FuzzyProductIndex([phone, Product("Samsung Galaxy S23", "Desc", 1.0, 1)])
+
+        assert index.get("Iphone 15 pro max ") is phone
+        assert index.get("iPhone 15 Pro Maxx") is phone
+        assert index.get("iPhone 14 Pro Max") is None
+        assert index.get("Xiaomi Redmi Note 11") is None
+        assert "iphone-15 pro max" in index
+
+    def test_threshold_and_numbers(self):
+        """Тест настроек порога и сравнения чисел"""
+        phone = Product("iPhone 15 Pro Max", "Desc", 100.0, 1)
+        strict = FuzzyProductIndex([phone], threshold=1.0)
+        loose = FuzzyProductIndex([phone], threshold=0.5, match_numbers=False)
+
+        assert strict.get("iPhone 15 Pro Maxx") is None
+        assert loose.get("iPhone 14 Pro Max") is phone
+        assert [product for _, product in loose.candidates("iPhone 15 Pro Maxx")] == [phone]
+
+        with pytest.raises(ValueError):
+            FuzzyProductIndex(threshold=0)
+
+    def test_new_product_registry(self):
+        """Тест использования индекса в new_product"""
+        index = FuzzyProductIndex()
+        first = Product.new_product({"name": "Iphone 15", "description": "Desc", "price": 100.0, "quantity": 2}, registry=index)
+        second = Product.new_product({"name": "iPhone 15 ", "description": "Desc", "price": 120.0, "quantity": 3}, registry=index)
+
+        assert second is first
+        assert (first.price, first.quantity) == (120.0, 5)
+        assert len(index) == 1
+
+    def test_discard(self):
+        """Тест удаления товара из индекса"""
+        phone = Product("iPhone 15", "Desc", 100.0, 1)
+        index = FuzzyProductIndex([phone])
+
+        index.discard(phone)
+
+        assert index.get("iPhone 15") is None
+        assert len(index) == 0
+
+
+class TestDedupeCategory:
+    """Тесты для пакетного объединения дубликатов категории"""
+
+    def test_dedupe_category(self):
+        """Тест объединения приближенных дубликатов категории"""
+        phone = Product("Iphone 15", "Desc", 100.0, 2)
+        category = Category(
+            "Смартфоны",
+            "Desc",
+            [phone, Product("Galaxy S23", "Desc", 90.0, 1), Product("iPhone 15 ", "Desc", 120.0, 3)],
+        )
+
+        pairs = dedupe_category(category)
+
+        assert [(kept.name, removed.name) for kept, removed in pairs] == [("Iphone 15", "iPhone 15 ")]
+        assert [product.name for product in category] == ["Iphone 15", "Galaxy S23"]
+        assert (phone.price, phone.quantity) == (120.0, 5)
+        assert category.total_quantity == 6
+        assert Category.product_count == 2
+
+    def test_dedupe_columnar_category(self):
+        """Тест объединения дубликатов в колоночном хранилище"""
+        store = ColumnarProductStore(
+            [
+                Product("Iphone 15", "Desc", 100.0, 2),
+                Product("iphone 15!", "Desc", 100.0, 1),
+                Product("Galaxy S23", "Desc", 90.0, 1),
+                Product("GALAXY S23", "Desc", 95.0, 4),
+            ]
+        )
+        category = Category("Смартфоны", "Desc", store)
+
+        assert len(dedupe_category(category)) == 2
+        assert [str(product) for product in category] == [
+            "Iphone 15, 100.0 руб. Остаток: 3 шт.",
+            "Galaxy S23, 95.0 руб. Остаток: 5 шт.",
+        ]
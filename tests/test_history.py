@@ -0,0 +1,125 @@
+import math
+from itertools import count
+from unittest.mock import patch
+
+from src.history import CategoryPriceHistory, PriceHistory
+from src.product import Category, Product
+from src.storage import ColumnarProductStore
+
+
+def make_clock():
+    """Часы, возвращающие 1.0, 2.0, 3.0, ..."""
+    ticks = count(1)
+    return lambda: float(next(ticks))
+
+
+class TestPriceHistory:
+    """Тесты для истории цены товара"""
+
+    def test_records_accepted_changes(self):
+        """Тест записи принятых изменений цены"""
+        product = Product("Phone", "Desc", 100.0, 1)
+        history = PriceHistory.attach(product, clock=make_clock())
+
+        product.price = 120.0
+        product.price = -1
+        with patch("builtins.input", return_value="n"):
+            product.price = 50.0
+        product._merge({"price": 150.0, "quantity": 1})
+
+        assert list(history.columns()[1]) == [100.0, 120.0, 150.0]
+        assert history.price_at(0.5) is None
+        assert history.price_at(1.0) == 100.0
+        assert history.price_at(2.5) == 120.0
+        assert history.price_at(10.0) == 150.0
+
+    def test_ring_buffer(self):
+        """Тест вытеснения старых записей"""
+        history = PriceHistory(capacity=3)
+        for timestamp in range(1, 6):
+            history.record(timestamp * 10.0, float(timestamp))
+
+        assert len(history) == 3
+        assert list(history.columns()[0]) == [3.0, 4.0, 5.0]
+        assert history.price_at(2.0) is None
+        assert history.price_at(3.5) == 30.0
+        assert history.price_at(4.0) == 40.0
+        assert history.price_at(7.0) == 50.0
+
+    def test_between_and_monotonic_time(self):
+        """Тест выборки интервала и неубывания времени"""
+        history = PriceHistory(capacity=4)
+        for timestamp, price in [(1.0, 10.0), (2.0, 20.0), (1.5, 25.0), (3.0, 30.0), (4.0, 40.0)]:
+            history.record(price, timestamp)
+
+        times, prices = history.between(2.0, 3.0)
+
+        assert list(times) == [2.0, 2.0, 3.0]
+        assert list(prices) == [20.0, 25.0, 30.0]
+
+    def test_detach(self):
+        """Тест отписки истории от товара"""
+        product = Product("Phone", "Desc", 100.0, 1)
+        history = PriceHistory.attach(product)
+        history.detach(product)
+
+        product.price = 120.0
+
+        assert len(history) == 1
+
+
+class TestCategoryPriceHistory:
+    """Тесты для истории цен категории"""
+
+    def setup_method(self):
+        """Сброс счетчиков перед каждым тестом"""
+        Category.category_count = 0
+        Category.product_count = 0
+
+    def test_prices_at_and_changes(self):
+        """Тест запросов по всей категории"""
+        phone = Product("Phone", "Desc", 100.0, 1)
+        category = Category("Смартфоны", "Desc", [phone])
+        history = CategoryPriceHistory(category, clock=make_clock())
+        tablet = Product("Tablet", "Desc", 200.0, 1)
+        category.add_product(tablet)
+        phone.price = 110.0
+        tablet.price = 220.0
+
+        assert list(history.prices_at(1.0))[0] == 100.0
+        assert math.isnan(history.prices_at(1.0)[1])
+        assert list(history.prices_at(3.0)) == [110.0, 200.0]
+        assert list(history.prices_at(4.0)) == [110.0, 220.0]
+
+        changes = history.changes_between(3.0, 4.0)
+        assert [(product.name, list(prices)) for product, _, prices in changes] == [
+            ("Phone", [110.0]),
+            ("Tablet", [220.0]),
+        ]
+
+        category.remove_product(tablet)
+        assert len(history) == 1
+
+    def test_columnar_category(self):
+        """Тест истории для категории с колоночным хранилищем"""
+        store = ColumnarProductStore([Product("Phone", "Desc", 100.0, 1)])
+        category = Category("Смартфоны", "Desc", store)
+        history = CategoryPriceHistory(category, clock=make_clock())
+
+        store[0].price = 130.0
+
+        assert list(history.prices_at(1.0)) == [100.0]
+        assert list(history.prices_at(2.0)) == [130.0]
+
+    def test_columnar_remove_and_add(self):
+        """Тест истории колоночной категории после удаления и добавления товаров"""
+        store = ColumnarProductStore([Product("Phone", "Desc", 100.0, 1), Product("Tablet", "Desc", 200.0, 1)])
+        category = Category("Смартфоны", "Desc", store)
+        history = CategoryPriceHistory(category, clock=make_clock())
+
+        category.remove_product(store[0])
+        category.add_product(Product("Laptop", "Desc", 300.0, 1))
+        store[0].price = 250.0
+
+        assert list(history.prices_at(10.0)) == [250.0, 300.0]
+        assert len(history) == 2
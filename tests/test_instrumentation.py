@@ -0,0 +1,95 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.instrumentation import Instrumentation, profile
+from src.product import Category, Product
+
+
+@pytest.fixture
+def instrumentation():
+    """Отдельный набор измерений, выключаемый после теста"""
+    instrumentation = Instrumentation()
+    yield instrumentation
+    instrumentation.disable()
+
+
+def exercise():
+    """Вызывает все горячие пути"""
+    category = Category("Смартфоны", "Desc", [])
+    product = Product.new_product({"name": "Phone", "description": "Desc", "price": 100.0, "quantity": 1})
+    category.add_product(product)
+    product.price = 120.0
+    _ = category.products
+    return category, product
+
+
+class TestInstrumentation:
+    """Тесты для измерений горячих путей"""
+
+    def test_disabled_leaves_classes_untouched(self, instrumentation):
+        """Тест, что выключенные измерения не меняют методы"""
+        original = Category.__dict__["add_product"]
+
+        instrumentation.enable()
+        assert Category.__dict__["add_product"] is not original
+        instrumentation.disable()
+
+        assert Category.__dict__["add_product"] is original
+        exercise()
+        assert instrumentation.to_dict()["Category.add_product"]["count"] == 0
+
+    def test_counts_and_histogram(self, instrumentation):
+        """Тест подсчета вызовов и гистограммы задержек"""
+        instrumentation.enable()
+        category, product = exercise()
+        product.price = 130.0
+
+        stats = instrumentation.to_dict()
+        assert stats["Product.new_product"]["count"] == 1
+        assert stats["Category.add_product"]["count"] == 1
+        assert stats["Product.price"]["count"] == 2
+        assert stats["Category.products"]["count"] == 1
+        assert sum(stats["Product.price"]["buckets"].values()) == 2
+        assert product.price == 130.0
+        assert category.max_price == 130.0
+
+    def test_prometheus_export(self, instrumentation):
+        """Тест экспорта в текстовом формате Prometheus"""
+        instrumentation.enable()
+        exercise()
+
+        text = instrumentation.to_prometheus()
+
+        assert '# TYPE catalog_calls_total counter' in text
+        assert 'catalog_calls_total{method="Category.add_product"} 1' in text
+        assert 'catalog_call_duration_seconds_bucket{method="Category.add_product",le="+Inf"} 1' in text
+        assert 'catalog_call_duration_seconds_count{method="Product.new_product"} 1' in text
+
+    def test_profile(self):
+        """Тест профилирования блока кода"""
+        original = Product.__dict__["price"]
+
+        with patch("builtins.input", return_value="y"):
+            with profile() as report:
+                exercise()
+
+        assert report.seconds > 0
+        assert report.memory_peak > 0
+        assert report.metrics["Category.add_product"]["count"] == 1
+        assert Product.__dict__["price"] is original
+
+    def test_profile_with_enabled_instrumentation(self, instrumentation):
+        """Тест, что сброс статистики при включенных измерениях не отключает учет"""
+        instrumentation.enable()
+        exercise()
+
+        with profile(instrumentation, track_allocations=False) as report:
+            exercise()
+
+        assert report.metrics["Category.add_product"]["count"] == 1
+        assert instrumentation.enabled
+
+        instrumentation.reset()
+        exercise()
+        assert instrumentation.stats["Category.add_product"].count == 1
@@ -0,0 +1,78 @@
+import pytest
+
+from src.interning import ProductInterner
+from src.product import Category, Product
+from src.storage import ColumnarProductStore
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    """Сброс счетчиков перед каждым тестом"""
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+class TestProductInterner:
+    """Тесты для интернирования товаров между категориями"""
+
+    def test_new_product_shares_instances(self):
+        """Тест, что одинаковые имена дают один общий товар"""
+        interner = ProductInterner()
+        first = interner.new_product({"name": "Phone", "description": "Desc", "price": 100.0, "quantity": 5})
+        second = interner.new_product({"name": "PHONE", "description": "Desc", "price": 120.0, "quantity": 3})
+
+        assert first is second
+        assert (first.price, first.quantity) == (120.0, 8)
+        assert len(interner) == 1
+
+    def test_strings_interned(self):
+        """Тест интернирования названий и описаний"""
+        interner = ProductInterner()
+        description = "".join(["Очень ", "длинное описание"])
+        other = "".join(["Очень длинное ", "описание"])
+        first = interner.new_product({"name": "Phone", "description": description, "price": 1.0, "quantity": 1})
+        second = interner.new_product({"name": "Tablet", "description": other, "price": 1.0, "quantity": 1})
+
+        assert first.description is second.description
+
+    def test_intern_categories(self):
+        """Тест замены дубликатов в нескольких категориях общим товаром"""
+        phones = Category("Смартфоны", "Desc", [Product("Phone", "Desc", 100.0, 5), Product("Case", "Desc", 10.0, 1)])
+        sale = Category("Распродажа", "Desc", [Product("phone", "Desc", 120.0, 3)])
+        _ = sale.products
+        interner = ProductInterner()
+
+        assert interner.intern_categories([phones, sale]) == 1
+
+        shared = phones.get_products_list()[0]
+        assert sale.get_products_list() == [shared]
+        assert (shared.price, shared.quantity) == (120.0, 8)
+        assert phones.total_quantity == 9
+        assert sale.total_quantity == 8
+        assert sale.products == "Phone, 120.0 руб. Остаток: 8 шт.\n"
+        assert Category.product_count == 3
+
+        shared.quantity = 10
+        assert (phones.total_quantity, sale.total_quantity) == (11, 10)
+
+    def test_duplicates_within_category(self):
+        """Тест удаления дубликата, если общий товар уже есть в категории"""
+        duplicate = Product("phone", "Desc", 50.0, 2)
+        category = Category("Смартфоны", "Desc", [duplicate, Product("Phone", "Desc", 100.0, 5)])
+        other = Category("Распродажа", "Desc", [duplicate])
+        interner = ProductInterner()
+        interner.add(category.get_products_list()[1])
+
+        assert interner.intern_categories([category, other]) == 2
+
+        shared = category.get_products_list()[0]
+        assert category.get_products_list() == [shared]
+        assert other.get_products_list() == [shared]
+        assert shared.quantity == 7
+
+    def test_columnar_category_rejected(self):
+        """Тест отказа для колоночной категории"""
+        category = Category("Смартфоны", "Desc", ColumnarProductStore([Product("Phone", "Desc", 1.0, 1)]))
+
+        with pytest.raises(TypeError):
+            ProductInterner().intern_category(category)
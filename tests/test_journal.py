@@ -0,0 +1,217 @@
+import json
+import os
+
+import pytest
+
+from src.journal import ChangeJournal, recover, replay
+from src.pricing import approve_all, use_price_policy
+from src.product import Category, Product
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    """Сброс счетчиков перед каждым тестом"""
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+def read_records(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestChangeJournal:
+    """Тесты для журнала изменений каталога"""
+
+    def test_records_mutations(self, tmp_path):
+        """Тест записи добавлений, изменений количества и цены"""
+        path = tmp_path / "catalog.wal"
+        product = Product("Phone", "Desc", 100.0, 5)
+        category = Category("Electronics", "Devices", [product])
+
+        with ChangeJournal(path) as journal:
+            journal.attach(category)
+            category.add_product(Product("Tablet", "Desc", 200.0, 3))
+            product.quantity += 2
+            product.price = 150.0
+
+        assert [record["op"] for record in read_records(path)] == ["category", "add", "add", "quantity", "price"]
+        assert read_records(path)[3]["delta"] == 2
+
+    def test_group_commit(self, tmp_path):
+        """Тест сброса записей группами"""
+        path = tmp_path / "catalog.wal"
+        product = Product("Phone", "Desc", 100.0, 5)
+        category = Category("Electronics", "Devices", [product])
+        journal = ChangeJournal(path, group_size=3)
+        journal.attach(category)
+        assert path.read_text(encoding="utf-8") == ""
+
+        product.quantity += 1
+        assert len(read_records(path)) == 3
+
+        product.quantity += 1
+        assert len(read_records(path)) == 3
+
+        journal.close()
+        assert len(read_records(path)) == 4
+
+    def test_replay_restores_state(self, tmp_path):
+        """Тест восстановления состояния из журнала"""
+        path = tmp_path / "catalog.wal"
+        product = Product("Phone", "Desc", 100.0, 5)
+        category = Category("Electronics", "Devices", [product])
+
+        with ChangeJournal(path) as journal:
+            journal.attach(category)
+            category.add_product(Product("Tablet", "Desc", 200.0, 3))
+            product.quantity -= 4
+            with use_price_policy(approve_all):
+                product.price = 80.0
+
+        restored = replay(path)
+
+        assert len(restored) == 1
+        assert restored[0].products == category.products
+        assert restored[0].total_value() == category.total_value()
+
+    def test_replay_skips_torn_last_line(self, tmp_path):
+        """Тест пропуска оборванной последней записи"""
+        path = tmp_path / "catalog.wal"
+        path.write_text(
+            '{"op": "category", "name": "A", "description": "D"}\n{"op": "add", "category": "A", "na',
+            encoding="utf-8",
+        )
+
+        restored = replay(path)
+
+        assert restored[0].name == "A"
+        assert restored[0].get_products_list() == []
+
+    def test_replay_corrupted_record(self, tmp_path):
+        """Тест ошибки для поврежденной записи в середине журнала"""
+        path = tmp_path / "catalog.wal"
+        path.write_text('{"op": "category", "na\n{"op": "category", "name": "A", "description": "D"}\n', encoding="utf-8")
+
+        with pytest.raises(ValueError, match="строке 1"):
+            replay(path)
+
+    def test_compact_and_recover(self, tmp_path):
+        """Тест сжатия журнала в снимок и восстановления по снимку и хвосту журнала"""
+        journal_path = tmp_path / "catalog.wal"
+        snapshot_path = tmp_path / "catalog.snap"
+        product = Product("Phone", "Desc", 100.0, 5)
+        category = Category("Electronics", "Devices", [product])
+
+        journal = ChangeJournal(journal_path)
+        journal.attach(category)
+        for _ in range(50):
+            product.quantity += 1
+        journal.compact(snapshot_path)
+
+        assert read_records(journal_path) == [{"op": "checkpoint", "seq": 52}]
+
+        category.add_product(Product("Tablet", "Desc", 200.0, 3))
+        product.quantity += 10
+        journal.close()
+
+        assert [record["seq"] for record in read_records(journal_path)] == [52, 53, 54]
+        restored = recover(snapshot_path, journal_path)
+        assert restored[0].products == category.products
+
+    def test_recover_without_files(self, tmp_path):
+        """Тест восстановления при отсутствии снимка и журнала"""
+        assert recover(tmp_path / "none.snap", tmp_path / "none.wal") == []
+
+    def test_invalid_group_size(self, tmp_path):
+        """Тест проверки размера группы"""
+        with pytest.raises(ValueError):
+            ChangeJournal(tmp_path / "catalog.wal", group_size=0)
+
+    def test_replay_remove(self, tmp_path):
+        """Тест записи и повторного применения удаления товара"""
+        path = tmp_path / "catalog.wal"
+        product = Product("Phone", "Desc", 100.0, 5)
+        category = Category("Electronics", "Devices", [product, Product("Tablet", "Desc", 200.0, 3)])
+
+        with ChangeJournal(path) as journal:
+            journal.attach(category)
+            category.remove_product(product)
+
+        restored = replay(path)
+
+        assert [product.name for product in restored[0]] == ["Tablet"]
+
+    def test_replay_names_differing_in_case(self, tmp_path):
+        """Тест, что товары с названиями, различающимися регистром, не путаются"""
+        path = tmp_path / "catalog.wal"
+        upper, lower = Product("X", "Desc", 100.0, 1), Product("x", "Desc", 200.0, 2)
+        category = Category("Electronics", "Devices", [upper, lower])
+
+        with ChangeJournal(path) as journal:
+            journal.attach(category)
+            lower.quantity += 5
+            category.remove_product(upper)
+
+        restored = replay(path)
+
+        assert [str(product) for product in restored[0]] == ["x, 200.0 руб. Остаток: 7 шт."]
+
+    def test_recover_after_crash_during_compact(self, tmp_path, monkeypatch):
+        """Тест, что хвост журнала, вошедший в снимок, не применяется повторно после сбоя сжатия"""
+        journal_path = tmp_path / "catalog.wal"
+        snapshot_path = tmp_path / "catalog.snap"
+        product = Product("Phone", "Desc", 100.0, 5)
+        category = Category("Electronics", "Devices", [product])
+        journal = ChangeJournal(journal_path)
+        journal.attach(category)
+        product.quantity += 3
+        replace = os.replace
+
+        def crash_on_journal(source, target):
+            if os.fspath(target) == os.fspath(journal_path):
+                raise OSError("Сбой при сжатии")
+            replace(source, target)
+
+        monkeypatch.setattr(os, "replace", crash_on_journal)
+        with pytest.raises(OSError):
+            journal.compact(snapshot_path)
+        monkeypatch.undo()
+
+        restored = recover(snapshot_path, journal_path)
+
+        assert restored[0].total_quantity == 8
+        assert len(restored[0].get_products_list()) == 1
+
+    def test_reopened_journal_continues_sequence(self, tmp_path):
+        """Тест продолжения нумерации записей после повторного открытия сжатого журнала"""
+        journal_path = tmp_path / "catalog.wal"
+        snapshot_path = tmp_path / "catalog.snap"
+        product = Product("Phone", "Desc", 100.0, 5)
+        category = Category("Electronics", "Devices", [product])
+        with ChangeJournal(journal_path) as journal:
+            journal.attach(category)
+            journal.compact(snapshot_path)
+
+        with ChangeJournal(journal_path) as journal:
+            journal.attach(category, include_products=False)
+            product.quantity += 1
+
+        assert [record["seq"] for record in read_records(journal_path)] == [2, 3, 4]
+        assert recover(snapshot_path, journal_path)[0].total_quantity == 6
+
+    def test_reopen_after_torn_last_line(self, tmp_path):
+        """Тест, что оборванная последняя запись отрезается при повторном открытии журнала"""
+        path = tmp_path / "catalog.wal"
+        category = Category("Electronics", "Devices", [])
+        with ChangeJournal(path) as journal:
+            journal.attach(category)
+        with open(path, "a", encoding="utf-8") as stream:
+            stream.write('{"op": "add", "categ')
+
+        with ChangeJournal(path) as journal:
+            journal.attach(category, include_products=False)
+            category.add_product(Product("Phone", "Desc", 100.0, 5))
+
+        assert [record["seq"] for record in read_records(path)] == [1, 2, 3]
+        restored = replay(path)
+        assert [product.name for product in restored[0]] == ["Phone"]
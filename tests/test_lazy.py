@@ -0,0 +1,95 @@
+import pytest
+
+from benchmarks import lazy as lazy_benchmark
+from src.lazy import LazyProduct
+from src.product import Category, Product, ProductRegistry
+
+
+@pytest.fixture
+def record():
+    """Запись товара со строковыми значениями"""
+    return {"name": "Phone", "description": "Desc", "price": "100.5", "quantity": "3"}
+
+
+class TestLazyProduct:
+    """Тесты для ленивого товара"""
+
+    def test_attributes_from_record(self, record):
+        """Тест чтения и преобразования полей записи"""
+        product = LazyProduct(record)
+
+        assert isinstance(product, Product)
+        assert product.price == 100.5
+        assert product.quantity == 3
+        assert str(product) == "Phone, 100.5 руб. Остаток: 3 шт."
+
+    def test_fields_materialized_on_access(self, record):
+        """Тест, что поле берется из записи только один раз"""
+        product = LazyProduct(record)
+        _ = product.price
+        record["price"] = "1.0"
+        record["name"] = "Other"
+
+        assert product.price == 100.5
+        assert product.name == "Other"
+
+    def test_write_before_read(self, record):
+        """Тест, что записанное значение не перезаписывается из записи"""
+        product = LazyProduct(record)
+        product.quantity = 10
+
+        assert product.quantity == 10
+        assert product.name == "Phone"
+
+    def test_materialize(self, record):
+        """Тест заполнения всех полей и освобождения записи"""
+        product = LazyProduct(record).materialize()
+
+        assert product._record is None
+        assert repr(product) == "Product('Phone', 'Desc', 100.5, 3)"
+
+    def test_unknown_attribute(self, record):
+        """Тест ошибки для несуществующего атрибута"""
+        with pytest.raises(AttributeError):
+            _ = LazyProduct(record).unknown
+
+    def test_category_add_product(self, record):
+        """Тест добавления ленивого товара в категорию"""
+        Category.category_count = 0
+        Category.product_count = 0
+        product = LazyProduct(record)
+        category = Category("Смартфоны", "Desc", [])
+
+        category.add_product(product)
+        product.quantity = 5
+
+        assert category.total_quantity == 5
+        assert category.max_price == 100.5
+
+    def test_price_and_quantity_loaded_together(self, record):
+        """Тест, что цена и количество заполняются из записи одним обращением"""
+        product = LazyProduct(record)
+        _ = product.price
+        record["quantity"] = "7"
+
+        assert product.quantity == 3
+        product.price = 200.0
+        assert (product.price, product.quantity) == (200.0, 3)
+
+    def test_new_product(self, record):
+        """Тест создания и объединения товара через new_product"""
+        registry = ProductRegistry()
+        product = LazyProduct(record)
+
+        assert Product.new_product(product, registry=registry) is product
+
+        duplicate = LazyProduct({"name": "PHONE", "description": "Desc", "price": "120", "quantity": "2"})
+        assert Product.new_product(duplicate, registry=registry) is product
+        assert (product.price, product.quantity) == (120.0, 5)
+
+    def test_benchmark(self):
+        """Тест сценария производительности на малом объеме"""
+        result = lazy_benchmark.run(rows=200, inspected=0.05)
+
+        assert result["rows"] == 200
+        assert result["lazy_seconds"] > 0
@@ -0,0 +1,179 @@
+import io
+import json
+
+import pytest
+
+from src.loader import CatalogBuilder, detect_format, iter_json_array, iter_jsonl_records, load_catalog
+from src.product import Category
+from src.storage import ColumnarProductStore
+
+CATALOG = [
+    {
+        "name": "Смартфоны",
+        "description": "Смартфоны для жизни",
+        "products": [
+            {"name": "Iphone 15", "description": "512GB", "price": 210000.0, "quantity": 8},
+            {"name": "Xiaomi Redmi Note 11", "description": "1024GB", "price": 31000.0, "quantity": 14},
+            {"name": "iphone 15", "description": "512GB", "price": 220000.0, "quantity": 2},
+        ],
+    },
+    {
+        "name": "Телевизоры",
+        "description": "Телевизоры",
+        "products": [{"name": '55" QLED 4K', "description": "Подсветка", "price": 123000.0, "quantity": 7}],
+    },
+]
+
+
+class TestIterJsonArray:
+    """Тесты для потокового разбора JSON-массива"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 64, 1 << 16])
+    def test_elements_across_chunks(self, chunk_size):
+        """Тест разбора элементов при любом размере блока"""
+        data = [{"a": 1}, [1, 2], 12345, "строка", None, 1.5e10]
+        stream = io.StringIO(json.dumps(data, ensure_ascii=False, indent=2))
+
+        assert list(iter_json_array(stream, chunk_size)) == data
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 5])
+    def test_partial_tokens_across_chunks(self, chunk_size):
+        """Тест, что оборванные на границе блока токены дочитываются, а не считаются ошибкой"""
+        data = [{"name": 'Экран 55" \\ 4K', "price": -1.5e-3, "flags": [True, False, None]}, float("-inf"), "\u00e9"]
+        stream = io.StringIO(json.dumps(data))
+
+        assert list(iter_json_array(stream, chunk_size)) == data
+
+    def test_malformed_element_stops_early(self):
+        """Тест, что некорректный элемент не дочитывает файл до конца"""
+        stream = io.StringIO('[{"a": 1}, {"b" 2}, ' + ",".join(['{"c": 3}'] * 10000) + "]")
+        iterator = iter_json_array(stream, chunk_size=64)
+
+        assert next(iterator) == {"a": 1}
+        with pytest.raises(ValueError, match="Некорректный JSON-элемент"):
+            next(iterator)
+        assert stream.tell() < 1000
+
+    def test_empty_array(self):
+        """Тест пустого массива"""
+        assert list(iter_json_array(io.StringIO("  [ ] "))) == []
+
+    def test_not_an_array(self):
+        """Тест ошибки, если верхний уровень не массив"""
+        with pytest.raises(ValueError, match="Ожидался JSON-массив"):
+            list(iter_json_array(io.StringIO('{"a": 1}')))
+
+    def test_truncated_array(self):
+        """Тест ошибки для оборванного массива"""
+        with pytest.raises(ValueError):
+            list(iter_json_array(io.StringIO('[{"a": 1}, {"b"'), chunk_size=4))
+
+    @pytest.mark.parametrize("text", ["[1,", '[{"a": 1},', "[1, \n "])
+    @pytest.mark.parametrize("chunk_size", [1, 1 << 16])
+    def test_truncated_after_separator(self, text, chunk_size):
+        """Тест ошибки для массива, оборванного после запятой"""
+        with pytest.raises(ValueError, match="Неожиданный конец JSON-массива"):
+            list(iter_json_array(io.StringIO(text), chunk_size))
+
+    def test_reads_lazily(self):
+        """Тест, что элементы выдаются до чтения всего файла"""
+        stream = io.StringIO("[" + ",".join(['{"a": 1}'] * 1000) + "]")
+        iterator = iter_json_array(stream, chunk_size=16)
+
+        assert next(iterator) == {"a": 1}
+        assert stream.tell() < 100
+
+
+class TestJsonlRecords:
+    """Тесты для чтения JSONL"""
+
+    def test_skips_blank_lines(self):
+        """Тест пропуска пустых строк"""
+        stream = io.StringIO('{"a": 1}\n\n{"b": 2}\n')
+
+        assert list(iter_jsonl_records(stream)) == [{"a": 1}, {"b": 2}]
+
+    def test_invalid_line(self):
+        """Тест ошибки для некорректной строки"""
+        with pytest.raises(ValueError, match="строка 2"):
+            list(iter_jsonl_records(io.StringIO('{"a": 1}\n{oops\n')))
+
+
+class TestLoadCatalog:
+    """Тесты для загрузки каталога из файлов"""
+
+    def setup_method(self):
+        """Сброс счетчиков перед каждым тестом"""
+        Category.category_count = 0
+        Category.product_count = 0
+
+    def check_catalog(self, categories, stats):
+        phones, tvs = categories
+        assert phones.name == "Смартфоны"
+        assert phones.description == "Смартфоны для жизни"
+        assert [product.name for product in phones] == ["Iphone 15", "Xiaomi Redmi Note 11"]
+        assert phones.get_products_list()[0].quantity == 10
+        assert phones.get_products_list()[0].price == 220000.0
+        assert phones.total_quantity == 24
+        assert tvs.total_quantity == 7
+        assert stats.records == 4
+        assert stats.products == 3
+        assert stats.categories == 2
+        assert Category.product_count == 3
+
+    def test_load_json(self, tmp_path):
+        """Тест загрузки JSON"""
+        path = tmp_path / "catalog.json"
+        path.write_text(json.dumps(CATALOG, ensure_ascii=False), encoding="utf-8")
+
+        self.check_catalog(*load_catalog(path, chunk_size=32))
+
+    def test_load_jsonl(self, tmp_path):
+        """Тест загрузки JSONL с записями товаров"""
+        path = tmp_path / "catalog.jsonl"
+        lines = [
+            json.dumps(dict(product, category=category["name"], category_description=category["description"]))
+            for category in CATALOG
+            for product in category["products"]
+        ]
+        path.write_text("\n".join(lines), encoding="utf-8")
+
+        self.check_catalog(*load_catalog(path))
+
+    def test_load_csv(self, tmp_path):
+        """Тест загрузки CSV"""
+        path = tmp_path / "catalog.csv"
+        rows = ["category,category_description,name,description,price,quantity"]
+        for category in CATALOG:
+            for product in category["products"]:
+                rows.append(
+                    f'{category["name"]},{category["description"]},"{product["name"].replace(chr(34), chr(34) * 2)}",'
+                    f'{product["description"]},{product["price"]},{product["quantity"]}'
+                )
+        path.write_text("\n".join(rows), encoding="utf-8")
+
+        self.check_catalog(*load_catalog(path))
+
+    def test_load_columnar(self, tmp_path):
+        """Тест загрузки в колоночное хранилище с объединением дубликатов"""
+        path = tmp_path / "catalog.json"
+        path.write_text(json.dumps(CATALOG, ensure_ascii=False), encoding="utf-8")
+
+        categories, stats = load_catalog(path, columnar=True)
+
+        assert isinstance(categories[0].get_products_list(), ColumnarProductStore)
+        self.check_catalog(categories, stats)
+
+    def test_detect_format(self):
+        """Тест определения формата по расширению"""
+        assert detect_format("data/catalog.JSONL") == "jsonl"
+        with pytest.raises(ValueError):
+            detect_format("catalog.xml")
+
+    def test_builder_stats(self):
+        """Тест статистики построителя"""
+        builder = CatalogBuilder()
+        builder.add_records(CATALOG)
+
+        assert builder.stats.seconds > 0
+        assert builder.stats.records_per_second > 0
@@ -0,0 +1,90 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.parallel import pack_category, process_categories, unpack_category
+from src.product import Category, Product
+from src.storage import ColumnarProductStore
+
+
+@pytest.fixture
+def categories():
+    """Категории для параллельной обработки"""
+    Category.category_count = 0
+    Category.product_count = 0
+    phones = Category(
+        "Смартфоны",
+        "Desc",
+        [
+            Product("Iphone 15", "512GB", 210000.0, 8),
+            Product("Xiaomi", "512GB", 31000.0, 14),
+            Product("IPHONE 15", "256GB", 220000.0, 2),
+        ],
+    )
+    tvs = Category("Телевизоры", "Desc", ColumnarProductStore([Product("QLED", "4K", 123000.0, 7)]))
+    return [phones, tvs]
+
+
+class TestPacking:
+    """Тесты для компактной упаковки категорий"""
+
+    def test_pack_roundtrip(self, categories):
+        """Тест упаковки и распаковки категории"""
+        restored = unpack_category(pack_category(categories[0]))
+
+        assert restored.name == "Смартфоны"
+        assert restored.products == categories[0].products
+        assert Category.category_count == 3
+        assert Category.product_count == 7
+
+    def test_pack_columnar(self, categories):
+        """Тест упаковки категории с колоночным хранилищем"""
+        packed = pack_category(categories[1])
+
+        assert packed[4] == ["QLED"]
+        assert unpack_category(packed).total_value() == 861000.0
+
+
+class TestProcessCategories:
+    """Тесты для параллельной обработки категорий"""
+
+    def test_process_pool(self, categories):
+        """Тест обработки в пуле процессов"""
+        results = process_categories(categories, tasks=("value", "render"), max_workers=2)
+
+        assert [result["name"] for result in results] == ["Смартфоны", "Телевизоры"]
+        assert results[0]["value"]["total_value"] == categories[0].total_value()
+        assert results[1]["render"] == categories[1].products
+
+    def test_dedupe(self, categories):
+        """Тест объединения дубликатов с детерминированным обновлением счетчиков"""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = process_categories(categories, tasks=("dedupe",), executor=executor)
+
+        deduped = results[0]["dedupe"]
+        assert [product.name for product in deduped] == ["Iphone 15", "Xiaomi"]
+        assert deduped.get_products_list()[0].quantity == 10
+        assert deduped.get_products_list()[0].price == 220000.0
+        # Результат dedupe заменяет исходную категорию в счетчиках
+        assert Category.category_count == 2
+        assert Category.product_count == 3
+
+    def test_int_prices(self):
+        """Тест, что целые цены выводятся так же, как в Category.products"""
+        category = Category("Кабели", "Desc", [Product("USB", "1m", 500, 3), Product("HDMI", "2m", 750.5, 1)])
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            results = process_categories([category], tasks=("render", "dedupe"), executor=executor)
+
+        assert results[0]["render"] == category.products == "USB, 500 руб. Остаток: 3 шт.\nHDMI, 750.5 руб. Остаток: 1 шт.\n"
+        assert results[0]["dedupe"].products == category.products
+        assert unpack_category(pack_category(category)).products == category.products
+
+    def test_unknown_task(self, categories):
+        """Тест ошибки для неизвестной задачи"""
+        with pytest.raises(ValueError, match="Неизвестные задачи"):
+            process_categories(categories, tasks=("explode",))
+
+    def test_empty(self):
+        """Тест обработки пустого набора категорий"""
+        assert process_categories([]) == []
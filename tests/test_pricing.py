@@ -0,0 +1,138 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.pricing import (
+    REASON_INVALID_PRICE,
+    REASON_NOT_FOUND,
+    REASON_REJECTED_BY_POLICY,
+    ThresholdPolicy,
+    approve_all,
+    bulk_update_prices,
+    reject_all,
+    use_price_policy,
+)
+from src.product import Product, ProductRegistry
+
+
+class TestPricePolicies:
+    """Тесты для политик подтверждения понижения цены"""
+
+    @patch("builtins.input")
+    def test_approve_all_policy(self, mock_input):
+        """Тест политики автоматического подтверждения"""
+        product = Product("Test", "Desc", 100.0, 5)
+
+        with use_price_policy(approve_all):
+            product.price = 80.0
+
+        assert product.price == 80.0
+        mock_input.assert_not_called()
+
+    @patch("builtins.input")
+    def test_reject_all_policy(self, mock_input):
+        """Тест политики автоматического отклонения"""
+        product = Product("Test", "Desc", 100.0, 5)
+
+        with use_price_policy(reject_all):
+            product.price = 80.0
+            product.price = 120.0
+
+        assert product.price == 120.0
+        mock_input.assert_not_called()
+
+    def test_threshold_policy(self):
+        """Тест политики с порогом понижения"""
+        product = Product("Test", "Desc", 100.0, 5)
+
+        with use_price_policy(ThresholdPolicy(10)):
+            product.price = 85.0
+            assert product.price == 100.0
+            product.price = 90.0
+            assert product.price == 90.0
+
+    def test_threshold_policy_validation(self):
+        """Тест проверки процента в политике с порогом"""
+        with pytest.raises(ValueError):
+            ThresholdPolicy(150)
+
+    def test_callback_policy(self):
+        """Тест произвольной функции обратного вызова в качестве политики"""
+        calls = []
+
+        def policy(product, old_price, new_price):
+            calls.append((product.name, old_price, new_price))
+            return True
+
+        product = Product("Test", "Desc", 100.0, 5)
+        with use_price_policy(policy):
+            product.price = 70.0
+
+        assert calls == [("Test", 100.0, 70.0)]
+
+    def test_policy_restored(self):
+        """Тест восстановления политики после выхода из контекста"""
+        previous_policy = Product.price_policy
+
+        with pytest.raises(RuntimeError):
+            with use_price_policy(approve_all):
+                raise RuntimeError
+
+        assert Product.price_policy is previous_policy
+
+
+class TestBulkUpdatePrices:
+    """Тесты для пакетного обновления цен"""
+
+    def setup_method(self):
+        """Подготовка товаров"""
+        self.phone = Product("Phone", "Desc", 100.0, 5)
+        self.tablet = Product("Tablet", "Desc", 200.0, 3)
+        self.products = [self.phone, self.tablet]
+
+    @patch("builtins.input")
+    def test_bulk_update_from_mapping(self, mock_input, capsys):
+        """Тест обновления цен из словаря без ввода и вывода"""
+        report = bulk_update_prices({"phone": 150.0, "Tablet": 150.0, "TV": 10.0, "PHONE ": 1.0}, self.products)
+
+        assert self.phone.price == 150.0
+        assert self.tablet.price == 200.0
+        assert report.accepted == [("Phone", 100.0, 150.0)]
+        assert report.rejected == [
+            ("Tablet", 150.0, REASON_REJECTED_BY_POLICY),
+            ("TV", 10.0, REASON_NOT_FOUND),
+            ("PHONE ", 1.0, REASON_NOT_FOUND),
+        ]
+        mock_input.assert_not_called()
+        assert capsys.readouterr().out == ""
+
+    def test_bulk_update_invalid_prices(self):
+        """Тест отклонения некорректных цен"""
+        report = bulk_update_prices([("Phone", -1), ("Tablet", "abc")], ProductRegistry(self.products))
+
+        assert [reason for _, _, reason in report.rejected] == [REASON_INVALID_PRICE, REASON_INVALID_PRICE]
+        assert self.phone.price == 100.0
+
+    def test_bulk_update_with_policy_and_batches(self):
+        """Тест пакетной обработки потока изменений с политикой"""
+        updates = (("Phone" if i % 2 else "Tablet", 300.0 - i) for i in range(5))
+
+        report = bulk_update_prices(updates, self.products, policy=approve_all, batch_size=2)
+
+        assert report.batches == 3
+        assert len(report.accepted) == 5
+        assert self.phone.price == 297.0
+        assert self.tablet.price == 296.0
+
+    def test_bulk_update_repeated_product_in_batch(self):
+        """Тест, что повторная строка товара сравнивается с последней принятой в пакете ценой"""
+        report = bulk_update_prices([("Phone", 120.0), ("phone", 110.0), ("Phone", 130.0)], self.products, policy=reject_all)
+
+        assert report.accepted == [("Phone", 100.0, 120.0), ("Phone", 120.0, 130.0)]
+        assert report.rejected == [("phone", 110.0, REASON_REJECTED_BY_POLICY)]
+        assert self.phone.price == 130.0
+
+    def test_bulk_update_batch_size_validation(self):
+        """Тест проверки размера пакета"""
+        with pytest.raises(ValueError):
+            bulk_update_prices({}, self.products, batch_size=0)
@@ -1,10 +1,13 @@
+import gc
+import io
 import os
 import sys
-from unittest.mock import patch
+import weakref
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.product import Category, CategoryIterator, Product
+from src.product import Category, CategoryIterator, Product, ProductRegistry
 
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
@@ -571,3 +574,488 @@ class TestIntegrationMagicMethods:
         products_output = category.products
         assert "Product1, 100.0 руб. Остаток: 5 шт." in products_output
         assert "Product2, 200.0 руб. Остаток: 3 шт." in products_output
+
+
+class TestProductRegistry:
+    """Тесты для индекса товаров ProductRegistry"""
+
+    def test_registry_lookup_case_insensitive(self):
+        """Тест поиска товара без учета регистра"""
+        product = Product("iPhone 15", "Desc", 100.0, 5)
+        registry = ProductRegistry([product])
+
+        assert registry.get("IPHONE 15") is product
+        assert "iphone 15" in registry
+        assert registry.get("Samsung") is None
+        assert len(registry) == 1
+
+    def test_registry_keeps_first_product(self):
+        """Тест, что при совпадении имен в индексе остается первый товар"""
+        first = Product("Phone", "Desc", 100.0, 5)
+        second = Product("PHONE", "Desc", 200.0, 3)
+        registry = ProductRegistry([first])
+
+        assert registry.add(second) is first
+        assert registry.get_products_list() == [first]
+
+    def test_registry_type_check(self):
+        """Тест проверки типа при добавлении в индекс"""
+        registry = ProductRegistry()
+
+        with pytest.raises(TypeError, match="Можно добавлять только объекты класса Product"):
+            registry.add("not a product")
+
+    def test_new_product_with_registry_duplicate(self):
+        """Тест new_product с индексом при дубликате"""
+        existing = Product("Existing Product", "Desc", 100.0, 5)
+        registry = ProductRegistry([existing])
+
+        result = Product.new_product(
+            {"name": "existing product", "description": "New", "price": 150.0, "quantity": 3},
+            registry=registry,
+        )
+
+        assert result is existing
+        assert result.quantity == 8
+        assert result.price == 150.0
+
+    def test_new_product_with_registry_registers_new(self):
+        """Тест, что new_product регистрирует новый товар в индексе"""
+        registry = ProductRegistry()
+
+        result = Product.new_product(
+            {"name": "New Product", "description": "Desc", "price": 100.0, "quantity": 1},
+            registry=registry,
+        )
+
+        assert registry.get("new product") is result
+        assert len(registry) == 1
+
+    def test_new_products_bulk(self):
+        """Тест массового создания товаров с объединением дубликатов"""
+        products_data = [
+            {"name": "Laptop", "description": "A", "price": 100.0, "quantity": 1},
+            {"name": "Mouse", "description": "B", "price": 10.0, "quantity": 5},
+            {"name": "LAPTOP", "description": "C", "price": 120.0, "quantity": 2},
+        ]
+
+        registry = Product.new_products(iter(products_data))
+        products = registry.get_products_list()
+
+        assert [product.name for product in products] == ["Laptop", "Mouse"]
+        assert products[0].quantity == 3
+        assert products[0].price == 120.0
+        assert products[0].description == "A"
+
+
+class TestCategoryAggregates:
+    """Тесты для инкрементальных агрегатов категории"""
+
+    def setup_method(self):
+        """Сброс счетчиков перед каждым тестом"""
+        Category.category_count = 0
+        Category.product_count = 0
+
+    def test_aggregates_on_init_and_add(self):
+        """Тест агрегатов при создании категории и добавлении товара"""
+        category = Category("Test", "Desc", [Product("Product1", "Desc1", 100.0, 10)])
+        category.add_product(Product("Product2", "Desc2", 50.0, 4))
+
+        assert category.total_quantity == 14
+        assert category.total_value() == 1200.0
+        assert category.min_price == 50.0
+        assert category.max_price == 100.0
+        assert category.stats()["mean_price"] == 75.0
+
+    def test_aggregates_follow_quantity_changes(self):
+        """Тест обновления агрегатов при изменении количества"""
+        product = Product("Product1", "Desc1", 100.0, 10)
+        category = Category("Test", "Desc", [product])
+
+        product.quantity -= 3
+
+        assert str(category) == "Test, количество продуктов: 7 шт."
+        assert category.total_value() == 700.0
+
+    def test_discarded_categories_are_released(self):
+        """Тест, что товар не удерживает удаленные категории и не уведомляет их"""
+        product = Product("Product1", "Desc1", 100.0, 10)
+        categories = [Category("Test", "Desc", [product]) for _ in range(1000)]
+        released = weakref.ref(categories[0])
+        kept = Category("Kept", "Desc", [product])
+
+        del categories
+        gc.collect()
+        product.quantity += 1
+        Category("Other", "Desc", [product])
+
+        assert released() is None
+        assert len(product._observers) == 2
+        assert kept.total_quantity == 11
+
+    @patch("builtins.input", return_value="y")
+    def test_aggregates_follow_price_changes(self, mock_input):
+        """Тест обновления агрегатов при изменении цены"""
+        product1 = Product("Product1", "Desc1", 100.0, 10)
+        product2 = Product("Product2", "Desc2", 200.0, 1)
+        category = Category("Test", "Desc", [product1, product2])
+
+        product2.price = 50.0
+
+        assert category.min_price == 50.0
+        assert category.max_price == 100.0
+        assert category.total_value() == 1050.0
+
+        product1.price = 300.0
+
+        assert category.max_price == 300.0
+        assert category.stats()["sum_price"] == 350.0
+
+    def test_aggregates_follow_new_product_merge(self):
+        """Тест обновления агрегатов при объединении дубликата"""
+        product = Product("Laptop", "Desc", 100.0, 3)
+        category = Category("Test", "Desc", [product])
+
+        Product.new_product(
+            {"name": "laptop", "description": "Desc", "price": 150.0, "quantity": 2},
+            category.get_products_list(),
+        )
+
+        assert category.total_quantity == 5
+        assert category.total_value() == 750.0
+        assert category.max_price == 150.0
+
+    def test_shared_product_updates_all_categories(self):
+        """Тест, что общий товар обновляет агрегаты всех своих категорий"""
+        product = Product("Product1", "Desc1", 100.0, 10)
+        category1 = Category("A", "Desc", [product])
+        category2 = Category("B", "Desc", [])
+        category2.add_product(product)
+
+        product.quantity = 1
+
+        assert category1.total_quantity == 1
+        assert category2.total_quantity == 1
+
+    def test_empty_category_aggregates(self):
+        """Тест агрегатов пустой категории"""
+        category = Category("Empty", "Desc", [])
+
+        assert category.total_quantity == 0
+        assert category.min_price is None
+        assert category.max_price is None
+
+    def test_recalculate(self):
+        """Тест полного пересчета агрегатов после изменения списка в обход add_product"""
+        category = Category("Test", "Desc", [])
+        category.get_products_list().append(Product("Product1", "Desc1", 100.0, 10))
+
+        category.recalculate()
+
+        assert category.total_quantity == 10
+        assert category.min_price == 100.0
+
+
+class TestCategoryRendering:
+    """Тесты для вывода и кэширования строкового представления товаров"""
+
+    def setup_method(self):
+        """Сброс счетчиков перед каждым тестом"""
+        Category.category_count = 0
+        Category.product_count = 0
+
+    def test_products_cached(self):
+        """Тест, что повторный вызов геттера возвращает закэшированную строку"""
+        category = Category("Test", "Desc", [Product("Product1", "Desc1", 100.0, 5)])
+
+        assert category.products is category.products
+
+    def test_cache_invalidated_on_add(self):
+        """Тест сброса кэша при добавлении товара"""
+        category = Category("Test", "Desc", [Product("Product1", "Desc1", 100.0, 5)])
+        _ = category.products
+
+        category.add_product(Product("Product2", "Desc2", 200.0, 3))
+
+        assert "Product2, 200.0 руб. Остаток: 3 шт." in category.products
+
+    def test_cache_invalidated_on_product_change(self):
+        """Тест сброса кэша при изменении цены и количества"""
+        product = Product("Product1", "Desc1", 100.0, 5)
+        category = Category("Test", "Desc", [product])
+        _ = category.products
+
+        product.quantity = 7
+        assert category.products == "Product1, 100.0 руб. Остаток: 7 шт.\n"
+
+        product.price = 150.0
+        assert category.products == "Product1, 150.0 руб. Остаток: 7 шт.\n"
+
+    def test_iter_product_lines(self):
+        """Тест генератора строк товаров"""
+        category = Category(
+            "Test", "Desc", [Product("Product1", "Desc1", 100.0, 5), Product("Product2", "Desc2", 200.0, 3)]
+        )
+
+        assert list(category.iter_product_lines()) == [
+            "Product1, 100.0 руб. Остаток: 5 шт.\n",
+            "Product2, 200.0 руб. Остаток: 3 шт.\n",
+        ]
+
+    def test_write_products(self):
+        """Тест записи строк товаров в файловый объект"""
+        category = Category("Test", "Desc", [Product("Product1", "Desc1", 100.0, 5)])
+        stream = io.StringIO()
+
+        category.write_products(stream)
+        _ = category.products
+        category.write_products(stream)
+
+        assert stream.getvalue() == category.products * 2
+
+
+class TestCategoryIterationModes:
+    """Тесты для режимов итерации по категории"""
+
+    def setup_method(self):
+        """Сброс счетчиков перед каждым тестом"""
+        Category.category_count = 0
+        Category.product_count = 0
+
+    def make_category(self, count):
+        return Category("Test", "Desc", [Product(f"Product{index}", "Desc", 100.0, 1) for index in range(count)])
+
+    def test_live_iteration_sees_additions(self):
+        """Тест, что обычная итерация видит товары, добавленные по ходу обхода"""
+        category = self.make_category(2)
+        names = []
+        for product in category:
+            names.append(product.name)
+            if len(names) == 1:
+                category.add_product(Product("Added", "Desc", 1.0, 1))
+
+        assert names == ["Product0", "Product1", "Added"]
+
+    def test_snapshot_iteration(self):
+        """Тест, что итерация по снимку не видит добавленные товары"""
+        category = self.make_category(2)
+        names = []
+        for product in category.iter_snapshot():
+            names.append(product.name)
+            category.add_product(Product("Added", "Desc", 1.0, 1))
+
+        assert names == ["Product0", "Product1"]
+
+    def test_iter_chunks(self):
+        """Тест пакетной итерации"""
+        category = self.make_category(5)
+
+        chunks = list(category.iter_chunks(2))
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert [product.name for chunk in chunks for product in chunk] == [f"Product{index}" for index in range(5)]
+
+    def test_iter_chunks_snapshot(self):
+        """Тест пакетной итерации по снимку"""
+        category = self.make_category(3)
+        chunks = category.iter_chunks(2, snapshot=True)
+
+        next(chunks)
+        category.add_product(Product("Added", "Desc", 1.0, 1))
+
+        assert [product.name for product in next(chunks)] == ["Product2"]
+        assert list(chunks) == []
+
+    def test_iter_chunks_invalid_size(self):
+        """Тест проверки размера пакета"""
+        with pytest.raises(ValueError):
+            list(self.make_category(1).iter_chunks(0))
+
+    def test_iter_chunks_empty(self):
+        """Тест пакетной итерации пустой категории"""
+        assert list(self.make_category(0).iter_chunks(10)) == []
+
+
+class TestCategoryRemoveProduct:
+    """Тесты для удаления товара из категории"""
+
+    def setup_method(self):
+        """Сброс счетчиков перед каждым тестом"""
+        Category.category_count = 0
+        Category.product_count = 0
+
+    def test_remove_product(self):
+        """Тест удаления товара с обновлением агрегатов и счетчика"""
+        product1 = Product("Product1", "Desc1", 100.0, 10)
+        product2 = Product("Product2", "Desc2", 50.0, 4)
+        category = Category("Test", "Desc", [product1, product2])
+        _ = category.products
+
+        category.remove_product(product2)
+
+        assert category.get_products_list() == [product1]
+        assert category.total_quantity == 10
+        assert category.min_price == 100.0
+        assert category.products == "Product1, 100.0 руб. Остаток: 10 шт.\n"
+        assert Category.product_count == 1
+
+        product2.quantity = 100
+        assert category.total_quantity == 10
+
+    def test_remove_missing_product(self):
+        """Тест ошибки при удалении отсутствующего товара"""
+        category = Category("Test", "Desc", [])
+
+        with pytest.raises(ValueError, match="Товар не найден в категории"):
+            category.remove_product(Product("Product1", "Desc1", 100.0, 10))
+
+    def test_registry_discard(self):
+        """Тест удаления товара из индекса"""
+        product = Product("Product1", "Desc1", 100.0, 10)
+        registry = ProductRegistry([product])
+
+        registry.discard(Product("product1", "Other", 1.0, 1))
+        assert len(registry) == 1
+
+        registry.discard(product)
+        assert len(registry) == 0
+
+    def test_replace_product(self):
+        """Тест замены товара с сохранением позиции"""
+        product1 = Product("Product1", "Desc1", 100.0, 10)
+        product2 = Product("Product2", "Desc2", 50.0, 4)
+        replacement = Product("Product3", "Desc3", 10.0, 1)
+        category = Category("Test", "Desc", [product1, product2])
+
+        category.replace_product(product1, replacement)
+
+        assert category.get_products_list() == [replacement, product2]
+        assert category.total_quantity == 5
+        assert category.max_price == 50.0
+        assert Category.product_count == 2
+
+        product1.quantity = 100
+        replacement.quantity = 2
+        assert category.total_quantity == 6
+
+
+class TestCategoryBulkOperations:
+    """Тесты для пакетных операций категории"""
+
+    def setup_method(self):
+        """Сброс счетчиков перед каждым тестом"""
+        Category.category_count = 0
+        Category.product_count = 0
+
+    def test_extend(self):
+        """Тест пакетного добавления товаров"""
+        category = Category("Test", "Desc", [Product("Product1", "Desc1", 100.0, 10)])
+        listener = MagicMock()
+        category.add_listener(listener)
+        _ = category.products
+        new_products = [Product("Product2", "Desc2", 50.0, 4), Product("Product3", "Desc3", 10.0, 1)]
+
+        category.extend(iter(new_products))
+
+        assert len(category.get_products_list()) == 3
+        assert category.total_quantity == 15
+        assert category.min_price == 10.0
+        assert "Product3" in category.products
+        assert Category.product_count == 3
+        assert listener.product_added.call_count == 2
+
+        new_products[0].quantity = 5
+        assert category.total_quantity == 16
+
+    def test_extend_validates_before_changes(self):
+        """Тест, что при ошибке в пакете категория не меняется"""
+        category = Category("Test", "Desc", [])
+
+        with pytest.raises(TypeError):
+            category.extend([Product("Product1", "Desc1", 100.0, 10), "not a product"])
+
+        assert category.get_products_list() == []
+        assert Category.product_count == 0
+
+    def test_merge_with_dedupe(self):
+        """Тест объединения категорий с объединением дубликатов"""
+        phone = Product("Phone", "Desc", 100.0, 5)
+        target = Category("Смартфоны", "Desc", [phone])
+        source = Category(
+            "Распродажа",
+            "Desc",
+            [Product("PHONE", "Desc", 150.0, 2), Product("Tablet", "Desc", 200.0, 1), Product("tablet", "Desc", 100.0, 3)],
+        )
+
+        assert target.merge(source) == 2
+
+        assert [product.name for product in target] == ["Phone", "Tablet"]
+        assert (phone.price, phone.quantity) == (150.0, 7)
+        assert target.total_quantity == 11
+        assert target.max_price == 200.0
+        assert Category.product_count == 5
+
+    def test_merge_skips_shared_products(self):
+        """Тест, что товар, уже входящий в категорию, не добавляется повторно"""
+        shared = Product("Phone", "Desc", 100.0, 5)
+        target = Category("Смартфоны", "Desc", [shared])
+        source = Category("Распродажа", "Desc", [shared, Product("Case", "Desc", 10.0, 1)])
+
+        assert target.merge(source) == 0
+
+        assert [product.name for product in target] == ["Phone", "Case"]
+        assert shared.quantity == 5
+        assert target.total_quantity == 6
+
+    def test_merge_skips_shared_case_duplicate(self):
+        """Тест, что второй товар с тем же названием без учета регистра тоже не объединяется сам с собой"""
+        upper, lower = Product("Phone", "Desc", 100.0, 1), Product("phone", "Desc", 100.0, 2)
+        target = Category("Смартфоны", "Desc", [upper, lower])
+
+        assert target.merge(Category("Распродажа", "Desc", [lower])) == 0
+
+        assert (upper.quantity, lower.quantity) == (1, 2)
+        assert target.total_quantity == 3
+
+    def test_from_iterable_skips_repeated_products(self):
+        """Тест, что повторно переданный объект товара не объединяется сам с собой"""
+        product = Product("Phone", "Desc", 100.0, 5)
+
+        category = Category.from_iterable("Смартфоны", "Desc", [product, product], dedupe=True)
+
+        assert category.get_products_list() == [product]
+        assert product.quantity == 5
+
+    def test_merge_without_dedupe(self):
+        """Тест объединения категорий без поиска дубликатов"""
+        target = Category("Смартфоны", "Desc", [Product("Phone", "Desc", 100.0, 5)])
+        source = Category("Распродажа", "Desc", [Product("Phone", "Desc", 150.0, 2)])
+
+        assert target.merge(source, dedupe=False) == 0
+        assert len(target.get_products_list()) == 2
+
+    def test_from_iterable(self):
+        """Тест создания категории из товаров и словарей"""
+        category = Category.from_iterable(
+            "Смартфоны",
+            "Desc",
+            (
+                item
+                for item in [
+                    Product("Phone", "Desc", 100.0, 5),
+                    {"name": "phone", "description": "Desc", "price": 120.0, "quantity": 1},
+                    {"name": "Tablet", "description": "Desc", "price": 200.0, "quantity": 2},
+                ]
+            ),
+            dedupe=True,
+        )
+
+        assert [str(product) for product in category] == [
+            "Phone, 120.0 руб. Остаток: 6 шт.",
+            "Tablet, 200.0 руб. Остаток: 2 шт.",
+        ]
+        assert Category.category_count == 1
+        assert Category.product_count == 2
+
+        with pytest.raises(TypeError):
+            Category.from_iterable("Test", "Desc", [42])
@@ -0,0 +1,155 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.product import Category, Product
+from src.query import CatalogIndex
+from src.storage import ColumnarProductStore
+
+
+@pytest.fixture
+def products():
+    """Товары для индексации"""
+    return [
+        Product("iPhone 15", "Desc", 210000.0, 8),
+        Product("Samsung Galaxy S23", "Desc", 180000.0, 0),
+        Product("Xiaomi Redmi Note 11", "Desc", 31000.0, 14),
+        Product("iPhone 14", "Desc", 70000.0, 15),
+    ]
+
+
+@pytest.fixture
+def category(products):
+    """Категория с товарами"""
+    Category.category_count = 0
+    Category.product_count = 0
+    return Category("Смартфоны", "Desc", list(products))
+
+
+def names(products):
+    return [product.name for product in products]
+
+
+class TestCatalogIndex:
+    """Тесты для вторичных индексов каталога"""
+
+    def test_find_by_price_range(self, category):
+        """Тест поиска по диапазону цен"""
+        index = CatalogIndex([category])
+
+        assert names(index.find_by_price_range(50000.0, 180000.0)) == ["iPhone 14", "Samsung Galaxy S23"]
+        assert names(index.find_by_price_range(max_price=70000.0)) == ["Xiaomi Redmi Note 11", "iPhone 14"]
+        assert names(index.find_by_price_range(100000.0, in_stock_only=True)) == ["iPhone 15"]
+        assert len(index.find_by_price_range()) == 4
+
+    def test_search_name(self, category):
+        """Тест поиска по подстроке и префиксу названия"""
+        index = CatalogIndex([category])
+
+        assert names(index.search_name("PHONE")) == ["iPhone 15", "iPhone 14"]
+        assert names(index.search_name("iphone", prefix=True)) == ["iPhone 14", "iPhone 15"]
+        assert names(index.search_name("1")) == ["iPhone 15", "Xiaomi Redmi Note 11", "iPhone 14"]
+        assert index.search_name("nokia") == []
+
+    def test_top_n_by_value(self, category):
+        """Тест выборки товаров с наибольшей стоимостью"""
+        index = CatalogIndex([category])
+
+        assert names(index.top_n_by_value(2)) == ["iPhone 15", "iPhone 14"]
+        assert index.top_n_by_value(0) == []
+        assert len(index.top_n_by_value(10)) == 4
+
+    def test_in_stock(self, category):
+        """Тест битовой карты товаров в наличии"""
+        index = CatalogIndex([category])
+
+        assert "Samsung Galaxy S23" not in names(index.in_stock())
+        assert len(index.in_stock()) == 3
+
+    @patch("builtins.input", return_value="y")
+    def test_index_follows_updates(self, mock_input, category, products):
+        """Тест обновления индексов при изменении товаров категории"""
+        index = CatalogIndex([category])
+
+        products[1].quantity = 3
+        products[0].price = 20000.0
+        category.add_product(Product("Honor Magic5", "Desc", 65000.0, 7))
+
+        assert names(index.find_by_price_range(max_price=40000.0)) == ["iPhone 15", "Xiaomi Redmi Note 11"]
+        assert names(index.top_n_by_value(1)) == ["iPhone 14"]
+        assert "Samsung Galaxy S23" in names(index.in_stock())
+        assert names(index.search_name("magic")) == ["Honor Magic5"]
+        assert len(index) == 5
+
+    def test_shared_product_indexed_once(self, category, products):
+        """Тест, что общий для нескольких категорий товар индексируется один раз"""
+        other = Category("Apple", "Desc", [products[0]])
+        index = CatalogIndex([category, other])
+
+        products[0].quantity = 100
+
+        assert len(index) == 4
+        assert names(index.top_n_by_value(1)) == ["iPhone 15"]
+        assert len(index.find_by_price_range(210000.0, 210000.0)) == 1
+
+    def test_detach(self, category):
+        """Тест отписки индекса от категорий"""
+        index = CatalogIndex([category])
+        index.detach()
+
+        category.add_product(Product("Nokia", "Desc", 1000.0, 1))
+
+        assert len(index) == 4
+
+    def test_columnar_category(self, products):
+        """Тест индексации категории с колоночным хранилищем"""
+        store = ColumnarProductStore(products)
+        category = Category("Смартфоны", "Desc", store)
+        index = CatalogIndex([category])
+
+        store[2].quantity = 0
+
+        assert len(index) == 4
+        assert "Xiaomi Redmi Note 11" not in names(index.in_stock())
+        assert names(index.top_n_by_value(1)) == ["iPhone 15"]
+
+    def test_remove_product(self, category, products):
+        """Тест удаления товара из индексов"""
+        other = Category("Apple", "Desc", [products[0]])
+        index = CatalogIndex([category, other])
+
+        category.remove_product(products[0])
+        assert len(index) == 4
+
+        other.remove_product(products[0])
+        category.remove_product(products[3])
+
+        assert len(index) == 2
+        assert index.search_name("iphone") == []
+        assert names(index.find_by_price_range()) == ["Xiaomi Redmi Note 11", "Samsung Galaxy S23"]
+        assert names(index.in_stock()) == ["Xiaomi Redmi Note 11"]
+        assert len(index.search_name("a")) == 2
+
+    def test_columnar_add_indexes_stored_view(self):
+        """Тест, что при добавлении в колоночное хранилище индексируется его элемент"""
+        store = ColumnarProductStore()
+        category = Category("Смартфоны", "Desc", store)
+        index = CatalogIndex([category])
+
+        category.add_product(Product("Phone", "Desc", 100.0, 1))
+        store[0].quantity = 0
+
+        assert index.in_stock() == []
+
+    def test_columnar_remove_keeps_views_valid(self):
+        """Тест индекса после удаления товаров из колоночного хранилища"""
+        store = ColumnarProductStore([Product(f"P{index}", "Desc", 10.0 + index, index) for index in range(4)])
+        category = Category("Склад", "Desc", store)
+        index = CatalogIndex([category])
+
+        category.remove_product(store[0])
+        category.remove_product(store[0])
+        store[0].price = 100.0
+
+        assert names(index.find_by_price_range()) == ["P3", "P2"]
+        assert names(index.find_by_price_range(50.0)) == ["P2"]
@@ -0,0 +1,141 @@
+import sys
+import threading
+
+import pytest
+
+from benchmarks import reservations as reservations_benchmark
+from src.product import Category, Product
+from src.reservations import COMMITTED, RELEASED, RESERVED, ReservationEngine
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    """Сброс счетчиков перед каждым тестом"""
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+class TestReservationEngine:
+    """Тесты для резервирования остатков"""
+
+    def test_reserve_checks_available(self):
+        """Тест проверки свободного остатка с учетом резервов"""
+        product = Product("Phone", "Desc", 100.0, 5)
+        engine = ReservationEngine()
+
+        first, second, third = engine.reserve([(product, 3), (product, 3), (product, 2)])
+
+        assert first.quantity == 3
+        assert second is None
+        assert third.quantity == 2
+        assert engine.available(product) == 0
+        assert product.quantity == 5
+        assert (engine.accepted, engine.rejected) == (2, 1)
+
+    def test_commit_and_release(self):
+        """Тест списания и отмены резервов"""
+        product = Product("Phone", "Desc", 100.0, 5)
+        category = Category("Смартфоны", "Desc", [product])
+        engine = ReservationEngine()
+        first, second = engine.reserve([(product, 2), (product, 1)])
+
+        engine.commit([first, None])
+        engine.release([second])
+
+        assert product.quantity == 3
+        assert category.total_quantity == 3
+        assert engine.reserved(product) == 0
+        assert (first.state, second.state) == (COMMITTED, RELEASED)
+        with pytest.raises(ValueError, match="уже завершен"):
+            engine.commit([first])
+
+    def test_duplicate_reservation_rejected(self):
+        """Тест отказа при повторной передаче резерва в одном пакете"""
+        product = Product("Phone", "Desc", 100.0, 5)
+        engine = ReservationEngine()
+        reservation, other = engine.reserve([(product, 2), (product, 1)])
+
+        for operation in (engine.commit, engine.release):
+            with pytest.raises(ValueError, match="повторно"):
+                operation([reservation, other, reservation])
+
+        assert product.quantity == 5
+        assert engine.reserved(product) == 3
+        assert (reservation.state, other.state) == (RESERVED, RESERVED)
+
+    def test_commit_rejects_bypassed_decrease(self):
+        """Тест отказа в списании, если остаток уменьшен в обход резервирования"""
+        product = Product("Phone", "Desc", 100.0, 5)
+        engine = ReservationEngine()
+        (reservation,) = engine.reserve([(product, 4)])
+        product.quantity = 1
+
+        with pytest.raises(ValueError, match="меньше резерва"):
+            engine.commit([reservation])
+        assert product.quantity == 1
+
+    def test_invalid_quantity(self):
+        """Тест проверки количества в заказе"""
+        with pytest.raises(ValueError):
+            ReservationEngine().reserve([(Product("Phone", "Desc", 100.0, 5), 0)])
+
+    def test_concurrent_finish_of_same_reservation(self):
+        """Тест, что параллельные commit и release одного резерва завершают его один раз"""
+        product = Product("Phone", "Desc", 100.0, 1000)
+        engine = ReservationEngine()
+        reservations = engine.reserve([(product, 1)] * 500)
+        barrier = threading.Barrier(8)
+        finished = []
+
+        def worker(operation):
+            barrier.wait()
+            for reservation in reservations:
+                try:
+                    operation([reservation])
+                except ValueError:
+                    continue
+                finished.append(reservation)
+
+        workers = [threading.Thread(target=worker, args=(operation,)) for operation in (engine.commit, engine.release) * 4]
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for thread in workers:
+                thread.start()
+            for thread in workers:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        committed = sum(reservation.state == COMMITTED for reservation in reservations)
+        assert len(finished) == 500
+        assert product.quantity == 1000 - committed
+        assert engine.reserved(product) == 0
+
+    def test_no_oversell_under_threads(self):
+        """Тест отсутствия перепродажи при одновременном резервировании"""
+        product = Product("Phone", "Desc", 100.0, 1000)
+        engine = ReservationEngine()
+        barrier = threading.Barrier(8)
+
+        def worker():
+            barrier.wait()
+            for _ in range(50):
+                engine.commit(engine.reserve([(product, 3)]))
+
+        workers = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+
+        assert product.quantity == 1000 - 3 * engine.accepted
+        assert product.quantity >= 0
+        assert engine.accepted == 333
+
+    def test_benchmark(self):
+        """Тест сценария производительности на малом масштабе"""
+        result = reservations_benchmark.run(products=100, orders=1000, batch_size=50, threads=2)
+
+        assert result["orders"] == 1000
+        assert result["accepted"] > 0
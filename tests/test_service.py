@@ -0,0 +1,125 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks import service as service_benchmark
+from src.pricing import approve_all
+from src.product import Category, Product
+from src.service import CatalogService
+
+
+@pytest.fixture
+def category():
+    """Категория для асинхронного каталога"""
+    Category.category_count = 0
+    Category.product_count = 0
+    return Category("Смартфоны", "Desc", [Product("Iphone 15", "512GB", 210000.0, 8)])
+
+
+class TestCatalogService:
+    """Тесты для асинхронного фасада каталога"""
+
+    def test_add_product_batched(self, category):
+        """Тест пакетного добавления товаров с объединением дубликатов"""
+        service = CatalogService([category])
+
+        async def scenario():
+            return await asyncio.gather(
+                service.add_product("Смартфоны", {"name": "Xiaomi", "description": "D", "price": 1.0, "quantity": 1}),
+                service.add_product("Смартфоны", {"name": "xiaomi", "description": "D", "price": 2.0, "quantity": 2}),
+                service.add_product("Смартфоны", {"name": "IPHONE 15", "description": "D", "price": 1.0, "quantity": 1}),
+            )
+
+        first, second, third = asyncio.run(scenario())
+
+        assert first is second
+        assert first.quantity == 3
+        assert first.price == 2.0
+        assert third.quantity == 9
+        assert service.batches == 1
+        assert [product.name for product in category] == ["Iphone 15", "Xiaomi"]
+
+    def test_add_product_unknown_category(self, category):
+        """Тест ошибки при добавлении в неизвестную категорию"""
+        service = CatalogService([category])
+
+        with pytest.raises(KeyError, match="Категория не найдена"):
+            asyncio.run(service.add_product("ТВ", {"name": "A", "description": "D", "price": 1.0, "quantity": 1}))
+
+    @patch("builtins.input")
+    def test_reprice_coalesced(self, mock_input, category):
+        """Тест объединения запросов изменения цены"""
+        service = CatalogService([category], price_policy=approve_all)
+
+        async def scenario():
+            return await asyncio.gather(
+                service.reprice("iphone 15", 100.0),
+                service.reprice("Iphone 15", 150.0),
+                service.reprice("Nokia", 10.0),
+            )
+
+        assert asyncio.run(scenario()) == [True, True, False]
+        assert category.get_products_list()[0].price == 150.0
+        assert service.coalesced == 1
+        assert service.batches == 1
+        mock_input.assert_not_called()
+
+    @patch("builtins.input")
+    def test_reprice_rejected_by_default_policy(self, mock_input, category):
+        """Тест, что по умолчанию понижение цены отклоняется без ввода"""
+        service = CatalogService([category])
+
+        assert asyncio.run(service.reprice("Iphone 15", 1.0)) is False
+        assert category.get_products_list()[0].price == 210000.0
+        mock_input.assert_not_called()
+
+    def test_reprice_policy_error(self, category):
+        """Тест передачи ошибки политики цены всем ожидающим запросам"""
+
+        def failing_policy(product, old_price, new_price):
+            raise RuntimeError("Политика недоступна")
+
+        service = CatalogService([category], price_policy=failing_policy)
+
+        async def scenario():
+            requests = asyncio.gather(
+                service.reprice("Iphone 15", 1.0),
+                service.reprice("iphone 15", 2.0),
+                return_exceptions=True,
+            )
+            return await asyncio.wait_for(requests, timeout=5)
+
+        results = asyncio.run(scenario())
+
+        assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+        assert service.batches == 1
+
+    def test_iter_category(self, category):
+        """Тест асинхронного обхода категории"""
+        category.add_product(Product("Xiaomi", "D", 1.0, 1))
+        service = CatalogService([category])
+
+        async def scenario():
+            return [product.name async for product in service.iter_category("Смартфоны", chunk_size=1)]
+
+        assert asyncio.run(scenario()) == ["Iphone 15", "Xiaomi"]
+
+    def test_flush_delay(self, category):
+        """Тест отложенного применения пакета и принудительного flush"""
+        service = CatalogService([category], price_policy=approve_all, flush_delay=60)
+
+        async def scenario():
+            task = asyncio.ensure_future(service.reprice("Iphone 15", 1.0))
+            await asyncio.sleep(0)
+            await service.flush()
+            return await task
+
+        assert asyncio.run(scenario()) is True
+
+    def test_load_generator(self):
+        """Тест генератора нагрузки на малом объеме"""
+        result = asyncio.run(service_benchmark.run(clients=5, requests=20, products=3))
+
+        assert result["requests"] == 100
+        assert result["batches"] <= 40
@@ -0,0 +1,105 @@
+import pytest
+
+from src.product import Category, Product
+from src.snapshot import LEGACY_MAGIC, open_snapshot, write_snapshot
+from src.storage import ColumnarProductStore
+
+
+@pytest.fixture
+def categories():
+    """Категории для записи в снимок"""
+    Category.category_count = 0
+    Category.product_count = 0
+    phones = Category(
+        "Смартфоны",
+        "Смартфоны для жизни",
+        [Product("Iphone 15", "512GB", 210000.0, 8), Product("Xiaomi", "512GB", 31000.0, 14)],
+    )
+    tvs = Category("Телевизоры", "Телевизоры", ColumnarProductStore([Product('55" QLED', "4K", 123000.0, 7)]))
+    empty = Category("Пустая", "Нет товаров", [])
+    return [phones, tvs, empty]
+
+
+class TestSnapshot:
+    """Тесты для бинарного снимка каталога"""
+
+    def test_roundtrip(self, tmp_path, categories):
+        """Тест записи и чтения снимка"""
+        path = tmp_path / "catalog.snap"
+
+        assert write_snapshot(categories, path) == 3
+
+        with open_snapshot(path) as snapshot:
+            assert len(snapshot) == 3
+            assert list(snapshot.prices) == [210000.0, 31000.0, 123000.0]
+            assert list(snapshot.quantities) == [8, 14, 7]
+
+            phones = snapshot[0]
+            assert phones.name == "Смартфоны"
+            assert phones.description == "Смартфоны для жизни"
+            assert len(phones) == 2
+            assert str(phones.product(1)) == "Xiaomi, 31000.0 руб. Остаток: 14 шт."
+            with pytest.raises(IndexError):
+                phones.product(2)
+
+            assert [len(category) for category in snapshot] == [2, 1, 0]
+
+    def test_columns_are_zero_copy(self, tmp_path, categories):
+        """Тест, что колонки категорий читаются из отображенного файла"""
+        path = tmp_path / "catalog.snap"
+        write_snapshot(categories, path)
+
+        with open_snapshot(path) as snapshot:
+            prices, quantities = snapshot[1].columns()
+
+            assert isinstance(prices, memoryview)
+            assert prices.readonly
+            assert list(prices) == [123000.0]
+            assert list(quantities) == [7]
+            del prices, quantities
+
+    def test_to_categories(self, tmp_path, categories):
+        """Тест материализации снимка в категории"""
+        path = tmp_path / "catalog.snap"
+        write_snapshot(categories, path)
+
+        with open_snapshot(path) as snapshot:
+            restored = snapshot.to_categories()
+
+        assert [category.name for category in restored] == ["Смартфоны", "Телевизоры", "Пустая"]
+        assert isinstance(restored[0].get_products_list(), ColumnarProductStore)
+        assert restored[0].products == categories[0].products
+        assert restored[0].total_value() == categories[0].total_value()
+
+    def test_close_with_exported_views(self, tmp_path, categories):
+        """Тест закрытия снимка, когда снаружи остались срезы колонок"""
+        path = tmp_path / "catalog.snap"
+        write_snapshot(categories, path)
+
+        snapshot = open_snapshot(path)
+        phones = snapshot[0]
+        snapshot.close()
+
+        assert list(phones.prices) == [210000.0, 31000.0]
+
+    def test_sequence_and_legacy_header(self, tmp_path, categories):
+        """Тест номера записи журнала в заголовке и чтения снимков первой версии"""
+        path = tmp_path / "catalog.snap"
+        write_snapshot(categories, path, sequence=42)
+        with open_snapshot(path) as snapshot:
+            assert snapshot.sequence == 42
+
+        data = path.read_bytes()
+        # Заголовок первой версии короче на поле номера записи, секции сдвигаются без изменения выравнивания
+        path.write_bytes(LEGACY_MAGIC + data[8:40] + data[48:])
+        with open_snapshot(path) as snapshot:
+            assert snapshot.sequence == 0
+            assert [category.name for category in snapshot.to_categories()] == ["Смартфоны", "Телевизоры", "Пустая"]
+
+    def test_invalid_file(self, tmp_path):
+        """Тест ошибки при открытии файла другого формата"""
+        path = tmp_path / "catalog.snap"
+        path.write_bytes(b"not a snapshot at all, just some bytes here")
+
+        with pytest.raises(ValueError, match="не является снимком"):
+            open_snapshot(path)
@@ -0,0 +1,215 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.product import Category, CategoryIterator, Product
+from src.storage import ColumnarProductStore, ProductView
+
+
+class TestSlots:
+    """Тесты для __slots__ у Product и CategoryIterator"""
+
+    def test_product_has_no_dict(self):
+        """Тест, что у Product нет словаря атрибутов"""
+        product = Product("Test", "Desc", 100.0, 5)
+
+        with pytest.raises(AttributeError):
+            _ = product.__dict__
+        with pytest.raises(AttributeError):
+            product.color = "red"
+
+    def test_iterator_has_no_dict(self):
+        """Тест, что у CategoryIterator нет словаря атрибутов"""
+        iterator = CategoryIterator([])
+
+        with pytest.raises(AttributeError):
+            _ = iterator.__dict__
+
+
+class TestColumnarProductStore:
+    """Тесты для колоночного хранилища товаров"""
+
+    def setup_method(self):
+        """Сброс счетчиков перед каждым тестом"""
+        Category.category_count = 0
+        Category.product_count = 0
+
+    def test_store_columns(self):
+        """Тест раскладки товаров по колонкам"""
+        store = ColumnarProductStore(
+            [
+                Product("Phone", "Same desc", 100.0, 5),
+                Product("Tablet", "Same desc", 200.0, 3),
+            ]
+        )
+
+        assert len(store) == 2
+        assert list(store.prices) == [100.0, 200.0]
+        assert list(store.quantities) == [5, 3]
+        # Одинаковые описания хранятся в таблице строк один раз
+        assert store._description_ids[0] == store._description_ids[1]
+
+    def test_store_views(self):
+        """Тест представлений товаров из хранилища"""
+        store = ColumnarProductStore([Product("Phone", "Desc", 100.0, 5)])
+        view = store[0]
+
+        assert isinstance(view, ProductView)
+        assert isinstance(view, Product)
+        assert str(view) == "Phone, 100.0 руб. Остаток: 5 шт."
+        assert view == store[-1]
+        with pytest.raises(IndexError):
+            _ = store[1]
+
+    def test_view_writes_through(self):
+        """Тест, что изменения через представление попадают в колонки"""
+        store = ColumnarProductStore([Product("Phone", "Desc", 100.0, 5)])
+        view = store[0]
+
+        view.quantity += 2
+        view.price = 150.0
+        view.description = "New desc"
+
+        assert store.quantities[0] == 7
+        assert store.prices[0] == 150.0
+        assert store[0].description == "New desc"
+
+    @patch("builtins.input", return_value="n")
+    def test_view_price_setter_validation(self, mock_input):
+        """Тест, что проверки сеттера цены работают и для представлений"""
+        store = ColumnarProductStore([Product("Phone", "Desc", 100.0, 5)])
+        view = store[0]
+
+        view.price = -1
+        view.price = 50.0
+
+        assert store.prices[0] == 100.0
+        mock_input.assert_called_once()
+
+    def test_store_type_check(self):
+        """Тест проверки типа при добавлении в хранилище"""
+        store = ColumnarProductStore()
+
+        with pytest.raises(TypeError, match="Можно добавлять только объекты класса Product"):
+            store.append("not a product")
+
+    def test_category_with_columnar_store(self):
+        """Тест категории с колоночным хранилищем"""
+        store = ColumnarProductStore([Product("Phone", "Desc", 100.0, 5)])
+        category = Category("Electronics", "Devices", store)
+        category.add_product(Product("Tablet", "Desc", 200.0, 3))
+
+        assert Category.product_count == 2
+        assert str(category) == "Electronics, количество продуктов: 8 шт."
+        assert category.products == "Phone, 100.0 руб. Остаток: 5 шт.\nTablet, 200.0 руб. Остаток: 3 шт.\n"
+        assert [product.name for product in category] == ["Phone", "Tablet"]
+        assert category.get_products_list() is store
+
+    def test_new_product_merges_into_store(self):
+        """Тест объединения дубликата с товаром из хранилища"""
+        store = ColumnarProductStore([Product("Phone", "Desc", 100.0, 5)])
+
+        result = Product.new_product(
+            {"name": "PHONE", "description": "Desc", "price": 120.0, "quantity": 1}, store
+        )
+
+        assert result == store[0]
+        assert store.quantities[0] == 6
+        assert store.prices[0] == 120.0
+
+    def test_category_aggregates_with_columnar_store(self):
+        """Тест инкрементальных агрегатов категории с колоночным хранилищем"""
+        store = ColumnarProductStore([Product("Phone", "Desc", 100.0, 5)])
+        category = Category("Electronics", "Devices", store)
+
+        store[0].quantity += 5
+        store[0].price = 200.0
+
+        assert category.total_quantity == 10
+        assert category.total_value() == 2000.0
+        assert category.max_price == 200.0
+
+    def test_remove_product_from_store(self):
+        """Тест удаления товара из категории с колоночным хранилищем"""
+        store = ColumnarProductStore([Product("Phone", "Desc", 100.0, 5), Product("Tablet", "Desc", 200.0, 3)])
+        category = Category("Electronics", "Devices", store)
+
+        category.remove_product(store[0])
+
+        assert [product.name for product in category] == ["Tablet"]
+        assert category.total_quantity == 3
+        with pytest.raises(ValueError):
+            category.remove_product(Product("Phone", "Desc", 100.0, 5))
+
+    def test_replace_product_in_store(self):
+        """Тест замены товара в категории с колоночным хранилищем"""
+        store = ColumnarProductStore([Product("Phone", "Desc", 100.0, 5), Product("Tablet", "Desc", 200.0, 3)])
+        category = Category("Electronics", "Devices", store)
+
+        category.replace_product(store[0], Product("Laptop", "Desc", 300.0, 1))
+
+        assert [product.name for product in category] == ["Laptop", "Tablet"]
+        assert category.total_quantity == 4
+        assert category.max_price == 300.0
+
+    def test_extend_and_merge_into_store(self):
+        """Тест пакетных операций для категории с колоночным хранилищем"""
+        store = ColumnarProductStore([Product("Phone", "Desc", 100.0, 5)])
+        category = Category("Electronics", "Devices", store)
+
+        category.merge([Product("phone", "Desc", 150.0, 1), Product("Tablet", "Desc", 200.0, 3)])
+
+        assert [str(product) for product in category] == [
+            "Phone, 150.0 руб. Остаток: 6 шт.",
+            "Tablet, 200.0 руб. Остаток: 3 шт.",
+        ]
+        assert category.total_quantity == 9
+
+    def test_views_stable_after_delete(self):
+        """Тест, что удаление строки не сдвигает выданные представления"""
+        store = ColumnarProductStore([Product(f"P{index}", "Desc", 10.0 + index, index) for index in range(4)])
+        first, second, third = store[0], store[1], store[2]
+
+        del store[1]
+        store.append(Product("New", "Desc", 1.0, 1))
+
+        assert (first.name, third.name) == ("P0", "P2")
+        assert third == store[1]
+        assert hash(third) == hash(store[1])
+        assert store.index(third) == 1
+        assert [product.name for product in store] == ["P0", "P2", "P3", "New"]
+        with pytest.raises(IndexError):
+            _ = second.price
+        with pytest.raises(ValueError):
+            store.index(second)
+
+    def test_views_after_many_deletes(self):
+        """Тест позиций представлений после чередования удалений и добавлений"""
+        store = ColumnarProductStore([Product(f"P{index}", "Desc", 1.0, index) for index in range(10)])
+        views = list(store)
+
+        for index in (7, 0, 3, 5):
+            del store[index]
+        store.append(Product("New", "Desc", 1.0, 10))
+        del store[-2]
+
+        assert [product.name for product in store] == ["P1", "P2", "P3", "P5", "P6", "New"]
+        kept = [views[index] for index in (1, 2, 3, 5, 6)]
+        assert [store.index(view) for view in kept] == [0, 1, 2, 3, 4]
+        assert [view.quantity for view in kept] == [1, 2, 3, 5, 6]
+        with pytest.raises(IndexError):
+            _ = views[9].name
+
+    def test_int_prices_keep_type(self):
+        """Тест, что целые цены выводятся так же, как в категории на списке"""
+        products = [Product("Phone", "Desc", 100, 5), Product("Case", "Desc", 9.5, 2)]
+        store = ColumnarProductStore(products)
+        columnar = Category("Electronics", "Devices", store)
+        plain = Category("Electronics", "Devices", list(products))
+
+        assert columnar.products == plain.products == "Phone, 100 руб. Остаток: 5 шт.\nCase, 9.5 руб. Остаток: 2 шт.\n"
+        store[1].price = 10
+        del store[0]
+        store.append(Product("Cable", "Desc", 3.5, 1))
+        assert [product.price for product in store] == [10, 3.5]
+        assert [type(product.price) for product in store] == [int, float]
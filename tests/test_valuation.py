@@ -0,0 +1,101 @@
+import pytest
+
+from src.product import Category, Product
+from src.storage import ColumnarProductStore
+from src.valuation import aggregate, column_stats, total_value
+
+
+class TestColumnStats:
+    """Тесты для агрегатов по колонкам"""
+
+    def test_column_stats(self):
+        """Тест агрегатов по непустым колонкам"""
+        stats = column_stats([100.0, 200.0, 300.0], [1, 2, 3])
+
+        assert stats == {
+            "count": 3,
+            "total_quantity": 6,
+            "total_value": 1400.0,
+            "sum_price": 600.0,
+            "min_price": 100.0,
+            "max_price": 300.0,
+            "mean_price": 200.0,
+        }
+
+    def test_column_stats_empty(self):
+        """Тест агрегатов по пустым колонкам"""
+        stats = column_stats([], [])
+
+        assert stats["count"] == 0
+        assert stats["total_value"] == 0
+        assert stats["min_price"] is None
+        assert stats["mean_price"] is None
+
+
+class TestCategoryValuation:
+    """Тесты для оценки стоимости категорий"""
+
+    def setup_method(self):
+        """Сброс счетчиков перед каждым тестом"""
+        Category.category_count = 0
+        Category.product_count = 0
+
+    def test_category_total_value_matches_add(self):
+        """Тест, что total_value совпадает с попарным сложением продуктов"""
+        product1 = Product("Product1", "Desc1", 100.0, 10)
+        product2 = Product("Product2", "Desc2", 200.0, 5)
+        category = Category("Test Category", "Test Description", [product1, product2])
+
+        assert category.total_value() == product1 + product2
+
+    def test_category_total_value_columnar(self):
+        """Тест total_value для колоночного хранилища"""
+        store = ColumnarProductStore([Product("Product1", "Desc1", 100.0, 10)])
+        category = Category("Test Category", "Test Description", store)
+
+        assert category.columns()[0] is store.prices
+        assert category.total_value() == 1000.0
+
+    def test_category_stats(self):
+        """Тест агрегатов категории"""
+        category = Category(
+            "Test Category",
+            "Test Description",
+            [Product("Product1", "Desc1", 100.0, 10), Product("Product2", "Desc2", 300.0, 0)],
+        )
+
+        stats = category.stats()
+
+        assert stats["count"] == 2
+        assert stats["total_quantity"] == 10
+        assert stats["mean_price"] == 200.0
+
+    def test_total_value_across_categories(self):
+        """Тест общей стоимости нескольких категорий"""
+        category1 = Category("A", "Desc", [Product("Product1", "Desc1", 100.0, 10)])
+        category2 = Category("B", "Desc", [Product("Product2", "Desc2", 50.0, 2)])
+
+        assert total_value([category1, category2]) == 1100.0
+
+    def test_aggregate_groups(self):
+        """Тест групповых агрегатов"""
+        category1 = Category("Phones", "Desc", [Product("Product1", "Desc1", 100.0, 10)])
+        category2 = Category("Phones", "Desc", [Product("Product2", "Desc2", 300.0, 2)])
+        category3 = Category("TV", "Desc", [])
+
+        result = aggregate([category1, category2, category3])
+
+        assert set(result) == {"Phones", "TV"}
+        assert result["Phones"]["count"] == 2
+        assert result["Phones"]["total_value"] == 1600.0
+        assert result["Phones"]["mean_price"] == pytest.approx(200.0)
+        assert result["TV"]["count"] == 0
+
+    def test_aggregate_custom_key(self):
+        """Тест групповых агрегатов с пользовательским ключом"""
+        category1 = Category("Phones", "Desc", [Product("Product1", "Desc1", 100.0, 10)])
+        category2 = Category("TV", "Desc", [Product("Product2", "Desc2", 300.0, 2)])
+
+        result = aggregate([category1, category2], key=lambda category: "all")
+
+        assert result["all"]["total_quantity"] == 12